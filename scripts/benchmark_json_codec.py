@@ -0,0 +1,99 @@
+"""
+Benchmark the JSON codec backends on a synthetic Terraform state.
+
+Generates a state file of roughly the requested size (100 MB by default) and
+times a full decode with every installed backend, plus the compact encoder
+used for provider-internal files. The baseline is plain ``json.loads`` /
+``json.dumps``, which the state data sources and registry cache used before.
+
+Usage:
+    python scripts/benchmark_json_codec.py [--size-mb 120] [--rounds 3] [--state PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from tofusoup.tf.components.codec import available_codecs, set_codec
+
+
+def synthetic_state(size_mb: int) -> dict[str, Any]:
+    """Build a state whose JSON encoding is about ``size_mb`` megabytes."""
+    resource = {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "web",
+        "provider": 'provider["registry.terraform.io/hashicorp/aws"]',
+        "instances": [
+            {
+                "schema_version": 1,
+                "attributes": {f"attribute_{i}": f"value-{i}-" + "x" * 24 for i in range(40)}
+                | {"id": "i-0123456789abcdef0", "tags": {"Name": "web", "Env": "prod"}, "cpu": 2, "ebs": 8.5},
+                "dependencies": ["aws_subnet.private", "aws_security_group.web"],
+            }
+        ],
+    }
+    per_resource = len(json.dumps(resource, indent=2))
+    count = max(1, size_mb * 1024 * 1024 // per_resource)
+    resources = [resource | {"name": f"web_{i}", "module": f"module.m{i % 50}"} for i in range(count)]
+    return {"version": 4, "terraform_version": "1.10.6", "serial": 1, "lineage": "bench", "resources": resources}
+
+
+def best_of(rounds: int, func: Callable[[], Any]) -> float:
+    """Best wall time over ``rounds`` calls, starting each from a collected heap."""
+    timings = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--state", type=Path, help="Benchmark an existing state file instead")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.state
+        if path is None:
+            path = Path(tmp) / "terraform.tfstate"
+            path.write_text(json.dumps(synthetic_state(args.size_mb), indent=2))
+        data = path.read_bytes()
+        document = json.loads(data)
+        print(f"State: {path} ({len(data) / 1024 / 1024:.1f} MB)")
+
+        results = {
+            "baseline": (
+                best_of(args.rounds, lambda: json.loads(data)),
+                best_of(args.rounds, lambda: json.dumps(document).encode("utf-8")),
+            )
+        }
+        for name in available_codecs():
+            codec = set_codec(name)
+            results[name] = (
+                best_of(args.rounds, lambda codec=codec: codec.loads(data)),
+                best_of(args.rounds, lambda codec=codec: codec.dumps_bytes(document)),
+            )
+        set_codec(None)
+
+    baseline_decode, baseline_encode = results["baseline"]
+    print(f"{'backend':<10} {'decode s':>9} {'speedup':>8} {'encode s':>9} {'speedup':>8}")
+    for name, (decode, encode) in results.items():
+        print(
+            f"{name:<10} {decode:>9.3f} {baseline_decode / decode:>7.1f}x {encode:>9.3f} {baseline_encode / encode:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""JSON codec used for state files and cached registry responses.
+
+Decoding is the dominant CPU cost when reading large states, so the codec uses
+the fastest JSON library that is installed (orjson, then msgspec, then
+pysimdjson) and falls back to the standard library. Install the ``fast-json``
+extra to get orjson.
+
+Fast backends are stricter than the standard library: they reject ``NaN`` and
+integers beyond 64 bits, for example. Input they refuse is decoded again with
+the standard library, so results never depend on the backend and malformed
+input always reports a ``json.JSONDecodeError``. Large documents are decoded
+with the garbage collector paused: decoding creates millions of acyclic
+objects, and the collections they trigger otherwise cost as much as the
+decoding itself.
+
+``loads`` also takes a ``memoryview``, and ``load`` decodes a memory-mapped
+file in place: orjson and msgspec read the buffer directly, so a mapped state
+is decoded without first being copied into a ``bytes`` object.
+
+``dumps`` produces exactly what ``json.dumps`` does, because its output ends
+up in data source attributes. ``dumps_bytes`` is the fast, compact variant for
+files the provider writes for itself.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import json
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import IO, Any
+
+from attrs import define
+from provide.foundation import logger
+
+STDLIB = "json"
+PAUSE_GC_MIN_BYTES = 1024 * 1024
+
+
+@define(frozen=True)
+class JsonCodec:
+    """A JSON backend: how to decode, and how to encode compactly to bytes."""
+
+    name: str
+    _loads: Callable[[bytes | str | memoryview], Any]
+    _dumps_bytes: Callable[[Any], bytes]
+    errors: tuple[type[Exception], ...] = ()
+    accepts_buffers: bool = False
+
+    def loads(self, data: bytes | str | memoryview) -> Any:
+        """Decode a JSON document."""
+        if isinstance(data, memoryview) and not self.accepts_buffers:
+            data = data.tobytes()
+        if len(data) < PAUSE_GC_MIN_BYTES:
+            return self._decode(data)
+        with _gc_paused():
+            return self._decode(data)
+
+    def _decode(self, data: bytes | str | memoryview) -> Any:
+        if not self.errors:
+            return self._loads(data)
+        try:
+            return self._loads(data)
+        except self.errors:
+            return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+    def load(self, fp: IO[bytes] | mmap.mmap) -> Any:
+        """Decode the JSON document read from a binary file or the rest of a memory map."""
+        if not isinstance(fp, mmap.mmap):
+            return self.loads(fp.read())
+        start = fp.tell()
+        # Views must be released before the map can be closed.
+        with memoryview(fp) as view, view[start:] as rest:
+            document = self.loads(rest)
+        fp.seek(0, os.SEEK_END)
+        return document
+
+    def dumps(self, obj: Any) -> str:
+        """Encode exactly as ``json.dumps(obj)`` does."""
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Encode compactly as UTF-8; non-JSON types are converted with ``str``."""
+        return self._dumps_bytes(obj)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _stdlib_loads(data: bytes | str | memoryview) -> Any:
+    # accepts_buffers is off, so JsonCodec.loads already turns views into bytes; this keeps the signature honest.
+    return json.loads(data.tobytes() if isinstance(data, memoryview) else data)
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec(
+        name=STDLIB,
+        loads=_stdlib_loads,
+        dumps_bytes=lambda obj: json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8"),
+    )
+
+
+def _orjson_codec() -> JsonCodec:
+    orjson = importlib.import_module("orjson")
+    return JsonCodec(
+        name="orjson",
+        loads=orjson.loads,
+        dumps_bytes=lambda obj: orjson.dumps(obj, default=str),
+        errors=(orjson.JSONDecodeError,),
+        accepts_buffers=True,
+    )
+
+
+def _msgspec_codec() -> JsonCodec:
+    msgspec = importlib.import_module("msgspec")
+    encoder = msgspec.json.Encoder(enc_hook=str)
+    return JsonCodec(
+        name="msgspec",
+        loads=msgspec.json.decode,
+        dumps_bytes=encoder.encode,
+        errors=(msgspec.DecodeError,),
+        accepts_buffers=True,
+    )
+
+
+def _simdjson_codec() -> JsonCodec:
+    simdjson = importlib.import_module("simdjson")
+    stdlib = _stdlib_codec()
+    return JsonCodec(
+        name="simdjson",
+        loads=simdjson.loads,
+        dumps_bytes=stdlib.dumps_bytes,
+        errors=(ValueError,),
+    )
+
+
+_BACKENDS: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "simdjson": _simdjson_codec,
+    STDLIB: _stdlib_codec,
+}
+
+_codec: JsonCodec | None = None
+
+
+def available_codecs() -> list[str]:
+    """Names of the installed backends, fastest first."""
+    names = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec() -> JsonCodec:
+    """Return the active codec, selecting the fastest installed backend on first use."""
+    global _codec
+    if _codec is None:
+        _codec = _BACKENDS[available_codecs()[0]]()
+        logger.debug("Selected JSON backend", backend=_codec.name)
+    return _codec
+
+
+def set_codec(name: str | None) -> JsonCodec:
+    """Force a backend by name, or go back to automatic selection with None."""
+    global _codec
+    _codec = None if name is None else _BACKENDS[name]()
+    return get_codec()
@@ -7,9 +7,13 @@ from tofusoup.tf.components.data_sources import (
     provider_info,
     provider_versions,
     registry_search,
+    state_diff,
+    state_graph,
     state_info,
+    state_inventory,
     state_outputs,
     state_resources,
+    state_summary,
 )
 
 __all__ = [
@@ -19,7 +23,11 @@ __all__ = [
     "provider_info",
     "provider_versions",
     "registry_search",
+    "state_diff",
+    "state_graph",
     "state_info",
+    "state_inventory",
     "state_outputs",
     "state_resources",
+    "state_summary",
 ]
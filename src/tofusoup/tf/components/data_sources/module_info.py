@@ -6,7 +6,7 @@ information about a specific Terraform/OpenTofu module from registry APIs.
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from attrs import define
 from provide.foundation import logger  # type: ignore
@@ -16,11 +16,12 @@ from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_bool, a_num, a_str, s_data_source  # type: ignore
-from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+from tofusoup.tf.components.registry import query_registry
+
 
 @define(frozen=True)
 class ModuleInfoConfig:
@@ -223,43 +224,33 @@ class ModuleInfoDataSource(BaseDataSource[str, ModuleInfoState, ModuleInfoConfig
             registry=config.registry or "terraform",
         )
 
-        try:
-            # Construct module identifier for version query
-            module_id = f"{config.namespace}/{config.name}/{config.target_provider}"
+        # Construct module identifier for version query
+        module_id = f"{config.namespace}/{config.name}/{config.target_provider}"
+
+        async def fetch(registry: BaseTfRegistry) -> dict[str, Any]:
+            # Get latest version first
+            versions = await registry.list_module_versions(module_id)
+            if not versions:
+                raise DataSourceError(f"No versions found for module {module_id}")
+            latest_version = versions[0].version
+
+            # Get module details for latest version
+            return cast(
+                dict[str, Any],
+                await registry.get_module_details(
+                    config.namespace,
+                    config.name,
+                    config.target_provider,
+                    latest_version,
+                ),
+            )
 
+        try:
             # Determine which registry to use
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    # Get latest version first
-                    versions = await registry.list_module_versions(module_id)
-                    if not versions:
-                        raise DataSourceError(f"No versions found for module {module_id}")
-                    latest_version = versions[0].version
-
-                    # Get module details for latest version
-                    details = await registry.get_module_details(
-                        config.namespace,
-                        config.name,
-                        config.target_provider,
-                        latest_version,
-                    )
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    # Get latest version first
-                    versions = await registry.list_module_versions(module_id)
-                    if not versions:
-                        raise DataSourceError(f"No versions found for module {module_id}")
-                    latest_version = versions[0].version
-
-                    # Get module details for latest version
-                    details = await registry.get_module_details(
-                        config.namespace,
-                        config.name,
-                        config.target_provider,
-                        latest_version,
-                    )
+            registry_class = OpenTofuRegistry if config.registry == "opentofu" else IBMTerraformRegistry
+            details = await query_registry(
+                registry_class, config.registry, "module_info", {"module_id": module_id}, fetch
+            )
 
             # Check if module was found
             if not details:
@@ -10,12 +10,13 @@ from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
-from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.models.module import Module  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+from tofusoup.tf.components.registry import query_registry
+
 
 @define(frozen=True)
 class ModuleSearchConfig:
@@ -181,23 +182,21 @@ class ModuleSearchDataSource(BaseDataSource[str, ModuleSearchState, ModuleSearch
             limit=config.limit,
         )
 
+        async def fetch(registry: BaseTfRegistry) -> list[dict[str, Any]]:
+            modules = await registry.list_modules(query=config.query)
+            # Convert Module objects to dicts
+            return [self._convert_module_to_dict(m) for m in modules]
+
         try:
             # Select the appropriate registry
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    modules = await registry.list_modules(query=config.query)
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    modules = await registry.list_modules(query=config.query)
+            registry_class = OpenTofuRegistry if config.registry == "opentofu" else IBMTerraformRegistry
+            results_data = await query_registry(
+                registry_class, config.registry, "list_modules", {"query": config.query}, fetch
+            )
 
             # Apply limit if specified
             if config.limit is not None:
-                modules = modules[: int(config.limit)]
-
-            # Convert Module objects to dicts
-            results_data = [self._convert_module_to_dict(m) for m in modules]
+                results_data = results_data[: int(config.limit)]
 
             logger.info(
                 "Retrieved module search results",
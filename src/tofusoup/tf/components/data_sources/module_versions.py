@@ -10,12 +10,13 @@ from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
-from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.models.module import ModuleVersion  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+from tofusoup.tf.components.registry import query_registry
+
 
 @define(frozen=True)
 class ModuleVersionsConfig:
@@ -189,19 +190,17 @@ class ModuleVersionsDataSource(BaseDataSource[str, ModuleVersionsState, ModuleVe
             registry=config.registry,
         )
 
+        async def fetch(registry: BaseTfRegistry) -> list[dict[str, Any]]:
+            versions = await registry.list_module_versions(module_id)
+            # Convert ModuleVersion objects to dicts
+            return [self._convert_version_to_dict(v) for v in versions]
+
         try:
             # Select the appropriate registry
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    versions = await registry.list_module_versions(module_id)
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    versions = await registry.list_module_versions(module_id)
-
-            # Convert ModuleVersion objects to dicts
-            versions_data = [self._convert_version_to_dict(v) for v in versions]
+            registry_class = OpenTofuRegistry if config.registry == "opentofu" else IBMTerraformRegistry
+            versions_data = await query_registry(
+                registry_class, config.registry, "list_module_versions", {"module_id": module_id}, fetch
+            )
 
             logger.info(
                 "Retrieved module versions",
@@ -1,6 +1,6 @@
 """TofuSoup provider_info data source implementation."""
 
-from typing import cast
+from typing import Any, cast
 
 from attrs import define
 from provide.foundation import logger
@@ -10,11 +10,12 @@ from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_num, a_str, s_data_source  # type: ignore
-from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+from tofusoup.tf.components.registry import query_registry
+
 
 @define(frozen=True)
 class ProviderInfoConfig:
@@ -143,22 +144,21 @@ class ProviderInfoDataSource(BaseDataSource[str, ProviderInfoState, ProviderInfo
             registry=config.registry,
         )
 
+        async def fetch(registry: BaseTfRegistry) -> dict[str, Any]:
+            return cast(
+                dict[str, Any], await registry.get_provider_details(namespace=config.namespace, name=config.name)
+            )
+
         try:
             # Select the appropriate registry
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    details = await registry.get_provider_details(
-                        namespace=config.namespace,
-                        name=config.name,
-                    )
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    details = await registry.get_provider_details(
-                        namespace=config.namespace,
-                        name=config.name,
-                    )
+            registry_class = OpenTofuRegistry if config.registry == "opentofu" else IBMTerraformRegistry
+            details = await query_registry(
+                registry_class,
+                config.registry,
+                "get_provider_details",
+                {"namespace": config.namespace, "name": config.name},
+                fetch,
+            )
 
             # Check if provider was found (empty dict means error occurred)
             if not details:
@@ -10,13 +10,14 @@ from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
-from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.models.module import Module  # type: ignore
 from tofusoup.registry.models.provider import Provider  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+from tofusoup.tf.components.registry import query_registry
+
 
 @define(frozen=True)
 class RegistrySearchConfig:
@@ -228,34 +229,33 @@ class RegistrySearchDataSource(BaseDataSource[str, RegistrySearchState, Registry
             limit=config.limit,
         )
 
-        try:
+        async def fetch(registry: BaseTfRegistry) -> list[dict[str, Any]]:
             providers: list[Provider] = []
             modules: list[Module] = []
 
-            # Select the appropriate registry
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    # Fetch providers and modules based on resource_type filter
-                    if config.resource_type in ["all", "providers"]:
-                        providers = await registry.list_providers(query=config.query)
-                    if config.resource_type in ["all", "modules"]:
-                        modules = await registry.list_modules(query=config.query)
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    # Fetch providers and modules based on resource_type filter
-                    if config.resource_type in ["all", "providers"]:
-                        providers = await registry.list_providers(query=config.query)
-                    if config.resource_type in ["all", "modules"]:
-                        modules = await registry.list_modules(query=config.query)
+            # Fetch providers and modules based on resource_type filter
+            if config.resource_type in ["all", "providers"]:
+                providers = await registry.list_providers(query=config.query)
+            if config.resource_type in ["all", "modules"]:
+                modules = await registry.list_modules(query=config.query)
 
             # Convert to dictionaries
             provider_dicts = [self._convert_provider_to_dict(p) for p in providers]
             module_dicts = [self._convert_module_to_dict(m) for m in modules]
 
             # Merge results (providers first, then modules)
-            all_results = provider_dicts + module_dicts
+            return provider_dicts + module_dicts
+
+        try:
+            # Select the appropriate registry
+            registry_class = OpenTofuRegistry if config.registry == "opentofu" else IBMTerraformRegistry
+            all_results = await query_registry(
+                registry_class,
+                config.registry,
+                "search",
+                {"query": config.query, "resource_type": config.resource_type},
+                fetch,
+            )
 
             # Apply limit if specified (convert to int to avoid slice error)
             if config.limit is not None:
@@ -0,0 +1,20 @@
+# Compare a state with itself: nothing added, removed or changed
+data "tofusoup_state_diff" "example" {
+  old_state_path = "./terraform.tfstate-example"
+  new_state_path = "./terraform.tfstate-example"
+}
+
+output "diff_counts" {
+  description = "How many instances were added, removed, changed and left unchanged"
+  value = {
+    added     = data.tofusoup_state_diff.example.added_count
+    removed   = data.tofusoup_state_diff.example.removed_count
+    changed   = data.tofusoup_state_diff.example.changed_count
+    unchanged = data.tofusoup_state_diff.example.unchanged_count
+  }
+}
+
+output "changed_instances" {
+  description = "Instances whose attributes differ"
+  value       = data.tofusoup_state_diff.example.changed
+}
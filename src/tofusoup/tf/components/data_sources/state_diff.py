@@ -0,0 +1,189 @@
+"""TofuSoup state_diff data source implementation."""
+
+import json
+from typing import cast
+
+from attrs import define
+from provide.foundation import logger
+from provide.foundation.errors import resilient
+from pyvider.data_sources.base import BaseDataSource  # type: ignore
+from pyvider.data_sources.decorators import register_data_source  # type: ignore
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+from pyvider.schema import PvsSchema, a_list, a_num, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.diff import diff_states
+from tofusoup.tf.components.state.remote import resolve_state
+from tofusoup.tf.components.state.workers import run_in_state_pool
+
+
+@define(frozen=True)
+class StateDiffConfig:
+    """Configuration attributes for state_diff data source."""
+
+    old_state_path: str
+    new_state_path: str
+
+
+@define(frozen=True)
+class StateDiffState:
+    """State attributes for state_diff data source."""
+
+    old_state_path: str | None = None
+    new_state_path: str | None = None
+    added: list[str] | None = None
+    removed: list[str] | None = None
+    changed: list[str] | None = None
+    added_count: int | None = None
+    removed_count: int | None = None
+    changed_count: int | None = None
+    unchanged_count: int | None = None
+
+
+@register_data_source("tofusoup_state_diff")
+class StateDiffDataSource(BaseDataSource[str, StateDiffState, StateDiffConfig]):  # type: ignore[misc]
+    """
+    Compare the resource instances of two Terraform state files.
+
+    Reports which resource instances were added, removed or changed between an
+    old and a new state, for example two serials of the same workspace. Each
+    instance is compared through a hash of its attributes, so only addresses
+    are returned and the attributes of large states are never held in memory.
+
+    **Use Cases:**
+    - Auditing what an apply changed (state serial N against N+1)
+    - Comparing the states of two workspaces or environments
+    - Verifying that a state migration or `terraform state mv` kept every resource
+    - Detecting drift between a backup and the current state
+
+    ## Example Usage
+
+    ```terraform
+    data "tofusoup_state_diff" "last_apply" {
+      old_state_path = "${path.module}/terraform.tfstate.backup"
+      new_state_path = "${path.module}/terraform.tfstate"
+    }
+
+    output "apply_audit" {
+      value = {
+        added   = data.tofusoup_state_diff.last_apply.added
+        removed = data.tofusoup_state_diff.last_apply.removed
+        changed = data.tofusoup_state_diff.last_apply.changed
+      }
+    }
+
+    output "state_unchanged" {
+      value = (
+        data.tofusoup_state_diff.last_apply.added_count +
+        data.tofusoup_state_diff.last_apply.removed_count +
+        data.tofusoup_state_diff.last_apply.changed_count
+      ) == 0
+    }
+    ```
+
+    ## Argument Reference
+
+    - `old_state_path` - (Required) Path to the earlier Terraform state file, or an `s3://bucket/key` or `http(s)://` URL
+    - `new_state_path` - (Required) Path to the later Terraform state file, or an `s3://bucket/key` or `http(s)://` URL
+
+    ## Attribute Reference
+
+    - `old_state_path` - The path to the earlier state file (echoes input)
+    - `new_state_path` - The path to the later state file (echoes input)
+    - `added` - Addresses of instances only in the new state, in its order
+    - `removed` - Addresses of instances only in the old state, in its order
+    - `changed` - Addresses of instances in both states whose attributes differ, in new state order
+    - `added_count`, `removed_count`, `changed_count` - Lengths of the lists above
+    - `unchanged_count` - Number of instances identical in both states
+
+    **Note**: Addresses are instance addresses as Terraform writes them, such as
+    `aws_instance.web[0]`, `module.app.aws_s3_bucket.logs["eu"]` or `data.aws_ami.ubuntu`.
+    Deposed objects carry a `(deposed <key>)` suffix.
+    """
+
+    config_class = StateDiffConfig
+    state_class = StateDiffState
+
+    @classmethod
+    def get_schema(cls) -> PvsSchema:
+        """Return the data source schema."""
+        return s_data_source(
+            attributes={
+                "old_state_path": a_str(required=True),
+                "new_state_path": a_str(required=True),
+                "added": a_list(element_type_def=a_str(), computed=True),
+                "removed": a_list(element_type_def=a_str(), computed=True),
+                "changed": a_list(element_type_def=a_str(), computed=True),
+                "added_count": a_num(computed=True),
+                "removed_count": a_num(computed=True),
+                "changed_count": a_num(computed=True),
+                "unchanged_count": a_num(computed=True),
+            }
+        )
+
+    @resilient()
+    async def _validate_config(self, config: StateDiffConfig) -> list[str]:
+        """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        errors = []
+        if not config.old_state_path:
+            errors.append("'old_state_path' is required and cannot be empty.")
+        if not config.new_state_path:
+            errors.append("'new_state_path' is required and cannot be empty.")
+        return errors
+
+    @resilient()
+    async def read(self, ctx: ResourceContext) -> StateDiffState:
+        """Compare the two state files."""
+        if not ctx.config:
+            raise DataSourceError("Configuration is required.")
+
+        config = cast(StateDiffConfig, ctx.config)
+
+        logger.info(
+            "Reading state diff",
+            old_state_path=config.old_state_path,
+            new_state_path=config.new_state_path,
+        )
+
+        try:
+            old_path = await resolve_state(config.old_state_path)
+            new_path = await resolve_state(config.new_state_path)
+
+            # Both files are streamed in the state worker pool; only per-instance digests are kept.
+            try:
+                diff = await run_in_state_pool(diff_states, old_path, new_path)
+            except json.JSONDecodeError as e:
+                raise DataSourceError(f"Invalid JSON in state file: {e}") from e
+
+            logger.info(
+                "Read state diff successfully",
+                old_state_path=config.old_state_path,
+                new_state_path=config.new_state_path,
+                added=len(diff.added),
+                removed=len(diff.removed),
+                changed=len(diff.changed),
+            )
+
+            return StateDiffState(
+                old_state_path=config.old_state_path,
+                new_state_path=config.new_state_path,
+                added=diff.added,
+                removed=diff.removed,
+                changed=diff.changed,
+                added_count=len(diff.added),
+                removed_count=len(diff.removed),
+                changed_count=len(diff.changed),
+                unchanged_count=diff.unchanged_count,
+            )
+
+        except DataSourceError:
+            # Re-raise DataSourceError as-is
+            raise
+        except PermissionError as e:
+            logger.error("Permission denied reading state file", error=str(e))
+            raise DataSourceError(f"Permission denied reading state file: {e.filename}") from e
+        except Exception as e:
+            logger.error("Failed to diff state files", error=str(e))
+            raise DataSourceError(
+                f"Failed to diff '{config.old_state_path}' and '{config.new_state_path}': {str(e)}"
+            ) from e
@@ -0,0 +1,28 @@
+# The whole graph, in dependency order
+data "tofusoup_state_graph" "all" {
+  state_path = "./terraform.tfstate-example"
+}
+
+output "dependency_order" {
+  description = "Every resource, dependencies first"
+  value       = data.tofusoup_state_graph.all.order
+}
+
+output "graph_stats" {
+  description = "Size of the dependency graph"
+  value = {
+    resources  = data.tofusoup_state_graph.all.resources_count
+    edges      = data.tofusoup_state_graph.all.edges_count
+    has_cycles = data.tofusoup_state_graph.all.has_cycles
+  }
+}
+
+# Impact of one resource (set the address of a resource in your state)
+# data "tofusoup_state_graph" "vpc" {
+#   state_path = "./terraform.tfstate-example"
+#   address    = "aws_vpc.main"
+# }
+#
+# output "affected_by_vpc" {
+#   value = data.tofusoup_state_graph.vpc.dependents
+# }
@@ -0,0 +1,200 @@
+"""TofuSoup state_graph data source implementation."""
+
+import json
+from typing import cast
+
+from attrs import define
+from provide.foundation import logger
+from provide.foundation.errors import resilient
+from pyvider.data_sources.base import BaseDataSource  # type: ignore
+from pyvider.data_sources.decorators import register_data_source  # type: ignore
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.graph import read_graph
+from tofusoup.tf.components.state.remote import resolve_state
+from tofusoup.tf.components.state.workers import run_in_state_pool
+
+
+@define(frozen=True)
+class StateGraphConfig:
+    """Configuration attributes for state_graph data source."""
+
+    state_path: str
+    address: str | None = None
+    transitive: bool | None = True
+
+
+@define(frozen=True)
+class StateGraphState:
+    """State attributes for state_graph data source."""
+
+    state_path: str | None = None
+    address: str | None = None
+    transitive: bool | None = None
+    resources_count: int | None = None
+    edges_count: int | None = None
+    has_cycles: bool | None = None
+    order: list[str] | None = None
+    dependencies: list[str] | None = None
+    dependents: list[str] | None = None
+
+
+@register_data_source("tofusoup_state_graph")
+class StateGraphDataSource(BaseDataSource[str, StateGraphState, StateGraphConfig]):  # type: ignore[misc]
+    """
+    Read the dependency graph of the resources in a Terraform state file.
+
+    Builds the graph from the `dependencies` Terraform records on every resource
+    instance, and reports the resources in dependency order. Given a resource
+    address, also reports what it depends on and what depends on it. The graph
+    is built once per version of the state file and reused by later reads.
+
+    **Use Cases:**
+    - Migration planning: which resources move together, and in which order
+    - Impact analysis before replacing or removing a resource
+    - Ordering `terraform state mv` or import steps
+    - Detecting dependency cycles left behind in a state
+
+    ## Example Usage
+
+    ```terraform
+    # What breaks if the VPC is replaced?
+    data "tofusoup_state_graph" "vpc" {
+      state_path = "${path.module}/terraform.tfstate"
+      address    = "module.network.aws_vpc.main"
+    }
+
+    # Only direct dependencies and dependents
+    data "tofusoup_state_graph" "db_direct" {
+      state_path = "${path.module}/terraform.tfstate"
+      address    = "aws_db_instance.main"
+      transitive = false
+    }
+
+    output "affected_by_vpc" {
+      value = data.tofusoup_state_graph.vpc.dependents
+    }
+
+    output "migration_order" {
+      value = data.tofusoup_state_graph.vpc.order
+    }
+    ```
+
+    ## Argument Reference
+
+    - `state_path` - (Required) Path to the Terraform state file, or an `s3://bucket/key` or `http(s)://` URL
+    - `address` - (Optional) Resource address to query, with module instance keys if any
+      (e.g., "aws_vpc.main", "data.aws_ami.ubuntu", "module.network[0].aws_subnet.private")
+    - `transitive` - (Optional) Whether `dependencies` and `dependents` include indirect ones
+      (default: true)
+
+    ## Attribute Reference
+
+    - `state_path` - The path to the state file (echoes input)
+    - `address` - The resource address queried (echoes input)
+    - `transitive` - Whether indirect dependencies were included (echoes input)
+    - `resources_count` - Number of resources in the graph
+    - `edges_count` - Number of direct dependencies between resources in the state
+    - `has_cycles` - Whether the dependencies contain a cycle
+    - `order` - Every resource address, dependencies before their dependents (resources on a cycle last)
+    - `dependencies` - Addresses `address` depends on, in state order (null without `address`)
+    - `dependents` - Addresses depending on `address`, in state order (null without `address`)
+
+    **Note**: Dependencies on resources that are not in the state are ignored.
+    """
+
+    config_class = StateGraphConfig
+    state_class = StateGraphState
+
+    @classmethod
+    def get_schema(cls) -> PvsSchema:
+        """Return the data source schema."""
+        return s_data_source(
+            attributes={
+                "state_path": a_str(required=True),
+                "address": a_str(optional=True),
+                "transitive": a_bool(optional=True, default=True),
+                "resources_count": a_num(computed=True),
+                "edges_count": a_num(computed=True),
+                "has_cycles": a_bool(computed=True),
+                "order": a_list(element_type_def=a_str(), computed=True),
+                "dependencies": a_list(element_type_def=a_str(), computed=True),
+                "dependents": a_list(element_type_def=a_str(), computed=True),
+            }
+        )
+
+    @resilient()
+    async def _validate_config(self, config: StateGraphConfig) -> list[str]:
+        """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        errors = []
+        if not config.state_path:
+            errors.append("'state_path' is required and cannot be empty.")
+        if config.address is not None and not config.address:
+            errors.append("'address' cannot be empty.")
+        return errors
+
+    @resilient()
+    async def read(self, ctx: ResourceContext) -> StateGraphState:
+        """Read the dependency graph of the state file."""
+        if not ctx.config:
+            raise DataSourceError("Configuration is required.")
+
+        config = cast(StateGraphConfig, ctx.config)
+        transitive = config.transitive is not False
+
+        logger.info("Reading state graph", state_path=config.state_path, address=config.address)
+
+        try:
+            state_path = await resolve_state(config.state_path)
+
+            # Built in the state worker pool and cached per version of the file.
+            try:
+                graph = await run_in_state_pool(read_graph, state_path)
+            except json.JSONDecodeError as e:
+                raise DataSourceError(f"Invalid JSON in state file: {e}") from e
+
+            dependencies = dependents = None
+            if config.address:
+                node = graph.node(config.address)
+                if node is None:
+                    raise DataSourceError(f"Resource not found in state: {config.address}")
+                if transitive:
+                    dependencies = graph.transitive_dependencies(node)
+                    dependents = graph.transitive_dependents(node)
+                else:
+                    dependencies = list(graph.dependencies(node))
+                    dependents = list(graph.dependents(node))
+
+            order, has_cycles = graph.topological_order()
+
+            logger.info(
+                "Read state graph successfully",
+                state_path=config.state_path,
+                resources_count=len(graph.addresses),
+                edges_count=graph.edges_count,
+                has_cycles=has_cycles,
+            )
+
+            return StateGraphState(
+                state_path=config.state_path,
+                address=config.address,
+                transitive=transitive,
+                resources_count=len(graph.addresses),
+                edges_count=graph.edges_count,
+                has_cycles=has_cycles,
+                order=[graph.addresses[node] for node in order],
+                dependencies=[graph.addresses[node] for node in dependencies] if dependencies is not None else None,
+                dependents=[graph.addresses[node] for node in dependents] if dependents is not None else None,
+            )
+
+        except DataSourceError:
+            # Re-raise DataSourceError as-is
+            raise
+        except PermissionError as e:
+            logger.error("Permission denied reading state file", state_path=config.state_path, error=str(e))
+            raise DataSourceError(f"Permission denied reading state file: {config.state_path}") from e
+        except Exception as e:
+            logger.error("Failed to read state graph", state_path=config.state_path, error=str(e))
+            raise DataSourceError(f"Failed to read state graph from '{config.state_path}': {str(e)}") from e
@@ -2,7 +2,6 @@
 
 import json
 from datetime import datetime
-from pathlib import Path
 from typing import cast
 
 from attrs import define
@@ -12,7 +11,10 @@ from pyvider.data_sources.base import BaseDataSource  # type: ignore
 from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
-from pyvider.schema import PvsSchema, a_num, a_str, s_data_source  # type: ignore
+from pyvider.schema import PvsSchema, a_bool, a_num, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.remote import resolve_state_prefix
+from tofusoup.tf.components.state.summary import summarize_state_file
 
 
 @define(frozen=True)
@@ -20,6 +22,7 @@ class StateInfoConfig:
     """Configuration attributes for state_info data source."""
 
     state_path: str
+    header_only: bool | None = False
 
 
 @define(frozen=True)
@@ -27,6 +30,7 @@ class StateInfoState:
     """State attributes for state_info data source."""
 
     state_path: str | None = None
+    header_only: bool | None = None
     version: int | None = None
     terraform_version: str | None = None
     serial: int | None = None
@@ -79,6 +83,12 @@ class StateInfoDataSource(BaseDataSource[str, StateInfoState, StateInfoConfig]):
       }
     }
 
+    # Compare serial and lineage without scanning the resources
+    data "tofusoup_state_info" "quick" {
+      state_path  = "/path/to/huge/terraform.tfstate"
+      header_only = true
+    }
+
     # Check for module usage
     output "uses_modules" {
       value = data.tofusoup_state_info.current.modules_count > 0
@@ -96,8 +106,12 @@ class StateInfoDataSource(BaseDataSource[str, StateInfoState, StateInfoConfig]):
 
     ## Argument Reference
 
-    - `state_path` - (Required) Path to Terraform state file. Can be absolute or relative.
+    - `state_path` - (Required) Path to Terraform state file. Can be absolute or relative,
+      or an `s3://bucket/key` or `http(s)://` URL.
       Supports `~` expansion for home directory.
+    - `header_only` - (Optional) Read only the header fields (`version`, `terraform_version`,
+      `serial`, `lineage`) from the start of the file and leave the count attributes null.
+      Default: `false`.
 
     ## Attribute Reference
 
@@ -116,6 +130,8 @@ class StateInfoDataSource(BaseDataSource[str, StateInfoState, StateInfoConfig]):
 
     **Note**: All count attributes return 0 for empty state files. The data source
     reads the state file from disk and does not require Terraform to be installed.
+    Large state files are streamed rather than loaded whole, so memory use stays
+    flat even for very large states.
     """
 
     config_class = StateInfoConfig
@@ -127,6 +143,7 @@ class StateInfoDataSource(BaseDataSource[str, StateInfoState, StateInfoConfig]):
         return s_data_source(
             attributes={
                 "state_path": a_str(required=True),
+                "header_only": a_bool(optional=True, default=False),
                 "version": a_num(computed=True),
                 "terraform_version": a_str(computed=True),
                 "serial": a_num(computed=True),
@@ -157,83 +174,46 @@ class StateInfoDataSource(BaseDataSource[str, StateInfoState, StateInfoConfig]):
 
         config = cast(StateInfoConfig, ctx.config)
 
-        logger.info("Reading state file", state_path=config.state_path)
+        logger.info("Reading state file", state_path=config.state_path, header_only=config.header_only)
 
         try:
-            # Resolve path (handle ~, relative paths)
-            state_path = Path(config.state_path).expanduser().resolve()
-
-            # Check file exists
-            if not state_path.exists():
-                raise DataSourceError(f"State file not found: {config.state_path}")
-
-            if not state_path.is_file():
-                raise DataSourceError(f"Path is not a file: {config.state_path}")
-
-            # Get file metadata
-            stat_info = state_path.stat()
-            state_file_size = stat_info.st_size
-            state_file_modified = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
+            # Resolve path (handle ~, relative paths); remote states are read with ranged requests
+            state_path = resolve_state_prefix(config.state_path)
 
-            # Load and parse JSON
+            # Use the shared parsed document for small or already-loaded states; large ones
+            # are streamed without materializing the document. Parsing runs in the state
+            # worker pool (or parse processes) so the event loop stays free.
             try:
-                with state_path.open() as f:
-                    state = json.load(f)
+                summary, stat_info = await summarize_state_file(state_path, bool(config.header_only))
             except json.JSONDecodeError as e:
                 raise DataSourceError(f"Invalid JSON in state file: {e}") from e
 
-            # Extract metadata
-            version = state.get("version")
-            terraform_version = state.get("terraform_version")
-            serial = state.get("serial")
-            lineage = state.get("lineage")
-
-            # Count outputs
-            outputs = state.get("outputs", {})
-            outputs_count = len(outputs)
-
-            # Count and categorize resources
-            resources = state.get("resources", [])
-            resources_count = len(resources)
-
-            managed_count = 0
-            data_count = 0
-            modules = set()
-
-            for resource in resources:
-                mode = resource.get("mode")
-                if mode == "managed":
-                    managed_count += 1
-                elif mode == "data":
-                    data_count += 1
-
-                # Track unique modules
-                if "module" in resource:
-                    modules.add(resource["module"])
-
-            modules_count = len(modules)
+            # Get file metadata
+            state_file_size = stat_info.st_size
+            state_file_modified = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
 
             logger.info(
                 "Read state file successfully",
                 state_path=config.state_path,
-                version=version,
-                terraform_version=terraform_version,
-                resources_count=resources_count,
-                outputs_count=outputs_count,
-                modules_count=modules_count,
+                version=summary.version,
+                terraform_version=summary.terraform_version,
+                resources_count=summary.resources_count,
+                outputs_count=summary.outputs_count,
+                modules_count=summary.modules_count,
             )
 
             return StateInfoState(
                 state_path=config.state_path,
-                version=version,
-                terraform_version=terraform_version,
-                serial=serial,
-                lineage=lineage,
-                resources_count=resources_count,
-                outputs_count=outputs_count,
-                managed_resources_count=managed_count,
-                data_resources_count=data_count,
-                modules_count=modules_count,
+                header_only=config.header_only,
+                version=summary.version,
+                terraform_version=summary.terraform_version,
+                serial=summary.serial,
+                lineage=summary.lineage,
+                resources_count=summary.resources_count,
+                outputs_count=summary.outputs_count,
+                managed_resources_count=summary.managed_resources_count,
+                data_resources_count=summary.data_resources_count,
+                modules_count=summary.modules_count,
                 state_file_size=state_file_size,
                 state_file_modified=state_file_modified,
             )
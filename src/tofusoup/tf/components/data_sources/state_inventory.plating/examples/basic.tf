@@ -0,0 +1,35 @@
+# Summarize every state file below the current directory
+data "tofusoup_state_inventory" "all" {
+  path = "."
+}
+
+# Only the workspaces of one configuration
+data "tofusoup_state_inventory" "workspaces" {
+  path = "./terraform.tfstate.d"
+}
+
+output "fleet_totals" {
+  description = "Totals across all state files"
+  value = {
+    states    = data.tofusoup_state_inventory.all.files_count
+    resources = data.tofusoup_state_inventory.all.resources_count
+    managed   = data.tofusoup_state_inventory.all.managed_resources_count
+    outputs   = data.tofusoup_state_inventory.all.outputs_count
+  }
+}
+
+output "resources_per_state" {
+  description = "Resource count of each readable state file"
+  value = {
+    for s in data.tofusoup_state_inventory.all.states :
+    s.state_path => s.resources_count if s.error == null
+  }
+}
+
+output "unreadable_states" {
+  description = "State files that could not be read"
+  value = [
+    for s in data.tofusoup_state_inventory.all.states :
+    "${s.state_path}: ${s.error}" if s.error != null
+  ]
+}
@@ -0,0 +1,210 @@
+"""TofuSoup state_inventory data source implementation."""
+
+from typing import Any, cast
+
+from attrs import define
+from provide.foundation import logger
+from provide.foundation.errors import resilient
+from pyvider.data_sources.base import BaseDataSource  # type: ignore
+from pyvider.data_sources.decorators import register_data_source  # type: ignore
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+from pyvider.schema import PvsSchema, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.inventory import find_state_files, inventory_totals, summarize_state_files
+from tofusoup.tf.components.state.workers import run_in_state_pool
+
+
+@define(frozen=True)
+class StateInventoryConfig:
+    """Configuration attributes for state_inventory data source."""
+
+    path: str
+
+
+@define(frozen=True)
+class StateInventoryState:
+    """State attributes for state_inventory data source."""
+
+    path: str | None = None
+    files_count: int | None = None
+    errors_count: int | None = None
+    resources_count: int | None = None
+    outputs_count: int | None = None
+    managed_resources_count: int | None = None
+    data_resources_count: int | None = None
+    modules_count: int | None = None
+    state_files_size: int | None = None
+    states: list[dict[str, Any]] | None = None
+
+
+@register_data_source("tofusoup_state_inventory")
+class StateInventoryDataSource(BaseDataSource[str, StateInventoryState, StateInventoryConfig]):  # type: ignore[misc]
+    """
+    Summarize every Terraform state file matching a glob pattern or directory.
+
+    Reports the same metadata and counts as `tofusoup_state_info` for each
+    matching state file, plus totals across all of them. Files are summarized
+    concurrently, and files unchanged since the last read (same size and
+    modification time) are not read again.
+
+    **Use Cases:**
+    - Fleet-wide infrastructure inventory across workspaces or environments
+    - Finding states written by outdated Terraform versions
+    - Reporting resource counts per environment
+    - Detecting unreadable or corrupt state files
+
+    ## Example Usage
+
+    ```terraform
+    # Every state under an environments tree
+    data "tofusoup_state_inventory" "envs" {
+      path = "${path.module}/envs/**/terraform.tfstate"
+    }
+
+    # All workspaces of a configuration
+    data "tofusoup_state_inventory" "workspaces" {
+      path = "${path.module}/terraform.tfstate.d"
+    }
+
+    output "fleet_totals" {
+      value = {
+        states    = data.tofusoup_state_inventory.envs.files_count
+        resources = data.tofusoup_state_inventory.envs.resources_count
+        managed   = data.tofusoup_state_inventory.envs.managed_resources_count
+      }
+    }
+
+    output "resources_per_state" {
+      value = {
+        for s in data.tofusoup_state_inventory.envs.states :
+        s.state_path => s.resources_count if s.error == null
+      }
+    }
+
+    output "unreadable_states" {
+      value = [
+        for s in data.tofusoup_state_inventory.envs.states :
+        "${s.state_path}: ${s.error}" if s.error != null
+      ]
+    }
+    ```
+
+    ## Argument Reference
+
+    - `path` - (Required) Glob pattern or directory. Patterns support `~` expansion and `**` to match
+      across directories (e.g. `envs/**/terraform.tfstate`). A directory is searched recursively for
+      `*.tfstate` files, which includes `terraform.tfstate.d` workspace directories.
+
+    ## Attribute Reference
+
+    - `path` - The glob pattern or directory (echoes input)
+    - `files_count` - Number of state files matched
+    - `errors_count` - Number of matched files that could not be read
+    - `resources_count` - Total resources across all readable state files
+    - `outputs_count` - Total outputs across all readable state files
+    - `managed_resources_count` - Total managed resources across all readable state files
+    - `data_resources_count` - Total data sources across all readable state files
+    - `modules_count` - Sum of the unique modules of each readable state file
+    - `state_files_size` - Total size in bytes of the readable state files
+    - `states` - List of state file objects, in path order, each containing:
+      - `state_path` - Absolute path of the state file
+      - `version`, `terraform_version`, `serial`, `lineage` - As reported by `tofusoup_state_info`
+      - `resources_count`, `outputs_count`, `managed_resources_count`, `data_resources_count`,
+        `modules_count` - As reported by `tofusoup_state_info`
+      - `state_file_size` - File size in bytes
+      - `state_file_modified` - Last modified timestamp (ISO 8601 format)
+      - `error` - Why the file could not be read (null on success; the other attributes are then null)
+
+    **Note**: A pattern matching no files is not an error; the inventory is empty.
+    """
+
+    config_class = StateInventoryConfig
+    state_class = StateInventoryState
+
+    @classmethod
+    def get_schema(cls) -> PvsSchema:
+        """Return the data source schema."""
+        return s_data_source(
+            attributes={
+                "path": a_str(required=True),
+                "files_count": a_num(computed=True),
+                "errors_count": a_num(computed=True),
+                "resources_count": a_num(computed=True),
+                "outputs_count": a_num(computed=True),
+                "managed_resources_count": a_num(computed=True),
+                "data_resources_count": a_num(computed=True),
+                "modules_count": a_num(computed=True),
+                "state_files_size": a_num(computed=True),
+                "states": a_list(
+                    element_type_def=a_obj(
+                        attributes={
+                            "state_path": a_str(computed=True),
+                            "version": a_num(computed=True),
+                            "terraform_version": a_str(computed=True),
+                            "serial": a_num(computed=True),
+                            "lineage": a_str(computed=True),
+                            "resources_count": a_num(computed=True),
+                            "outputs_count": a_num(computed=True),
+                            "managed_resources_count": a_num(computed=True),
+                            "data_resources_count": a_num(computed=True),
+                            "modules_count": a_num(computed=True),
+                            "state_file_size": a_num(computed=True),
+                            "state_file_modified": a_str(computed=True),
+                            "error": a_str(computed=True),
+                        }
+                    ),
+                    computed=True,
+                ),
+            }
+        )
+
+    @resilient()
+    async def _validate_config(self, config: StateInventoryConfig) -> list[str]:
+        """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        errors = []
+        if not config.path:
+            errors.append("'path' is required and cannot be empty.")
+        return errors
+
+    @resilient()
+    async def read(self, ctx: ResourceContext) -> StateInventoryState:
+        """Summarize every matching state file."""
+        if not ctx.config:
+            raise DataSourceError("Configuration is required.")
+
+        config = cast(StateInventoryConfig, ctx.config)
+
+        logger.info("Reading state inventory", path=config.path)
+
+        try:
+            paths = await run_in_state_pool(find_state_files, config.path)
+
+            # Summaries run concurrently in the state worker pool (or parse processes);
+            # each file's failure is recorded on its own entry.
+            entries = await summarize_state_files(paths)
+            totals = inventory_totals(entries)
+            errors_count = sum(1 for entry in entries if entry.error is not None)
+
+            logger.info(
+                "Read state inventory successfully",
+                path=config.path,
+                files_count=len(entries),
+                errors_count=errors_count,
+                resources_count=totals["resources_count"],
+            )
+
+            return StateInventoryState(
+                path=config.path,
+                files_count=len(entries),
+                errors_count=errors_count,
+                states=[entry.to_dict() for entry in entries],
+                **totals,
+            )
+
+        except DataSourceError:
+            # Re-raise DataSourceError as-is
+            raise
+        except Exception as e:
+            logger.error("Failed to read state inventory", path=config.path, error=str(e))
+            raise DataSourceError(f"Failed to read state inventory for '{config.path}': {str(e)}") from e
@@ -1,7 +1,6 @@
 """TofuSoup state_outputs data source implementation."""
 
 import json
-from pathlib import Path
 from typing import Any, cast
 
 from attrs import define
@@ -11,7 +10,12 @@ from pyvider.data_sources.base import BaseDataSource  # type: ignore
 from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
-from pyvider.schema import PvsSchema, a_bool, a_list, a_obj, a_str, a_num, s_data_source  # type: ignore
+from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.outputs import OutputFilter, read_outputs
+from tofusoup.tf.components.state.paths import parse_value_path
+from tofusoup.tf.components.state.remote import resolve_state_prefix
+from tofusoup.tf.components.state.workers import run_in_state_pool
 
 
 @define(frozen=True)
@@ -20,6 +24,10 @@ class StateOutputsConfig:
 
     state_path: str
     filter_name: str | None = None
+    filter_names: list[str] | None = None
+    values: bool | None = True
+    max_value_bytes: int | None = None
+    value_path: str | None = None
 
 
 @define(frozen=True)
@@ -28,6 +36,10 @@ class StateOutputsState:
 
     state_path: str | None = None
     filter_name: str | None = None
+    filter_names: list[str] | None = None
+    values: bool | None = None
+    max_value_bytes: int | None = None
+    value_path: str | None = None
     output_count: int | None = None
     outputs: list[dict[str, Any]] | None = None
 
@@ -38,7 +50,8 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
     Read and inspect outputs from a Terraform state file.
 
     Provides detailed information about each output defined in the state, including
-    output values, types, and sensitivity flags. Supports filtering by output name.
+    output values, types, and sensitivity flags. Supports filtering by output names
+    and glob patterns.
 
     **Use Cases:**
     - Extract output values from state files
@@ -61,6 +74,31 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
       filter_name = "vpc_id"
     }
 
+    # Get several outputs, by name or glob pattern, in one read
+    data "tofusoup_state_outputs" "network" {
+      state_path   = "${path.module}/terraform.tfstate"
+      filter_names = ["vpc_*", "subnet_ids", "nat_gateway_ip"]
+    }
+
+    # List output names, types and sensitivity without their values
+    data "tofusoup_state_outputs" "catalog" {
+      state_path = "${path.module}/terraform.tfstate"
+      values     = false
+    }
+
+    # Cap the size of returned values; larger ones come back null with value_truncated = true
+    data "tofusoup_state_outputs" "bounded" {
+      state_path      = "${path.module}/terraform.tfstate"
+      max_value_bytes = 65536
+    }
+
+    # Return only a nested field of an object output
+    data "tofusoup_state_outputs" "endpoint" {
+      state_path  = "${path.module}/terraform.tfstate"
+      filter_name = "cluster"
+      value_path  = "endpoint.hostname"
+    }
+
     # Extract output value
     output "vpc_id_value" {
       value = jsondecode(data.tofusoup_state_outputs.vpc_id.outputs[0].value)
@@ -93,17 +131,32 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
 
     ## Argument Reference
 
-    - `state_path` - (Required) Path to Terraform state file. Supports absolute, relative, and `~` paths.
+    - `state_path` - (Required) Path to Terraform state file. Supports absolute, relative, and `~` paths,
+      and `s3://bucket/key` or `http(s)://` URLs.
     - `filter_name` - (Optional) Filter to return only the output with this name
+    - `filter_names` - (Optional) List of output names and glob patterns (`*`, `?`, `[...]`, e.g. `vpc_*`);
+      outputs matching any of them are returned. Combined with `filter_name` if both are set.
+    - `values` - (Optional) Whether to return output values. Set to `false` to list only names, types
+      and sensitivity. Default: `true`.
+    - `max_value_bytes` - (Optional) Largest JSON-encoded value to return, in bytes. Larger values are
+      returned as null with `value_truncated` set, without being encoded in full. Default: no limit.
+    - `value_path` - (Optional) Path selecting a subtree of each output value, e.g. `endpoint.hostname`,
+      `nodes[0].ip` or `tags["kubernetes.io/role"]` (a leading `$.` is accepted). Only the selected
+      subtree is returned, and `type` describes it; `value` is null for outputs without that path.
 
     ## Attribute Reference
 
     - `state_path` - The state file path (echoes input)
     - `filter_name` - The name filter applied (echoes input)
+    - `filter_names` - The name and pattern filters applied (echoes input)
+    - `values` - Whether values were returned (echoes input)
+    - `max_value_bytes` - The value size limit applied (echoes input)
+    - `value_path` - The value path applied (echoes input)
     - `output_count` - Number of outputs returned (after filtering)
     - `outputs` - List of output objects, each containing:
       - `name` - Output name as defined in configuration
-      - `value` - Output value (JSON-encoded string)
+      - `value` - Output value (JSON-encoded string); null when `values = false` or the value is truncated
+      - `value_truncated` - Boolean indicating the value exceeded `max_value_bytes` and was omitted
       - `type` - Output type information (string representation)
       - `sensitive` - Boolean indicating if output is marked sensitive
 
@@ -111,6 +164,8 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
     to parse complex values (lists, objects). Scalar values can be used as strings directly.
     Sensitive outputs will have their values included (not redacted) since this data source
     reads the state file directly. Ensure appropriate access controls on state files.
+    Large state files are read only up to the end of their outputs, which Terraform
+    writes ahead of the resources.
     """
 
     config_class = StateOutputsConfig
@@ -123,12 +178,17 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
             attributes={
                 "state_path": a_str(required=True),
                 "filter_name": a_str(optional=True),
+                "filter_names": a_list(element_type_def=a_str(), optional=True),
+                "values": a_bool(optional=True, default=True),
+                "max_value_bytes": a_num(optional=True),
+                "value_path": a_str(optional=True),
                 "output_count": a_num(computed=True),
                 "outputs": a_list(
                     element_type_def=a_obj(
                         attributes={
                             "name": a_str(computed=True),
                             "value": a_str(computed=True),
+                            "value_truncated": a_bool(computed=True),
                             "type": a_str(computed=True),
                             "sensitive": a_bool(computed=True),
                         }
@@ -144,6 +204,15 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
         errors = []
         if not config.state_path:
             errors.append("'state_path' is required and cannot be empty.")
+        if config.filter_names and not all(config.filter_names):
+            errors.append("'filter_names' cannot contain empty names.")
+        if config.max_value_bytes is not None and config.max_value_bytes <= 0:
+            errors.append("'max_value_bytes' must be a positive number of bytes.")
+        if config.value_path is not None:
+            try:
+                parse_value_path(config.value_path)
+            except ValueError as e:
+                errors.append(f"'value_path' is invalid: {e}")
         return errors
 
     @resilient()
@@ -158,75 +227,50 @@ class StateOutputsDataSource(BaseDataSource[str, StateOutputsState, StateOutputs
             "Reading state outputs",
             state_path=config.state_path,
             filter_name=config.filter_name,
+            filter_names=config.filter_names,
+            values=config.values,
+            max_value_bytes=config.max_value_bytes,
+            value_path=config.value_path,
         )
 
         try:
-            # Resolve path (handle ~, relative paths)
-            state_path = Path(config.state_path).expanduser().resolve()
-
-            # Check file exists
-            if not state_path.exists():
-                raise DataSourceError(f"State file not found: {config.state_path}")
-
-            if not state_path.is_file():
-                raise DataSourceError(f"Path is not a file: {config.state_path}")
+            # Resolve path (handle ~, relative paths); remote states are read with ranged requests
+            state_path = resolve_state_prefix(config.state_path)
 
-            # Load and parse JSON
+            # Large states are streamed only up to the end of `outputs` (or the last
+            # requested output); every name and pattern is matched in the same pass,
+            # in the state worker pool.
+            output_filter = OutputFilter.from_names([config.filter_name, *(config.filter_names or [])])
             try:
-                with state_path.open() as f:
-                    state = json.load(f)
+                value_path = parse_value_path(config.value_path) if config.value_path is not None else ()
+            except ValueError as e:
+                raise DataSourceError(f"Invalid value_path: {e}") from e
+            try:
+                output_data = await run_in_state_pool(
+                    read_outputs,
+                    state_path,
+                    output_filter,
+                    values=config.values is not False,
+                    max_value_bytes=int(config.max_value_bytes) if config.max_value_bytes is not None else None,
+                    value_path=value_path,
+                )
             except json.JSONDecodeError as e:
                 raise DataSourceError(f"Invalid JSON in state file: {e}") from e
 
-            # Extract outputs dictionary
-            outputs_dict = state.get("outputs", {})
-
-            # Apply filter if specified
-            if config.filter_name:
-                if config.filter_name in outputs_dict:
-                    outputs_dict = {config.filter_name: outputs_dict[config.filter_name]}
-                    logger.debug(f"Filtered by name '{config.filter_name}': 1 output")
-                else:
-                    outputs_dict = {}
-                    logger.debug(f"Filtered by name '{config.filter_name}': 0 outputs (not found)")
-
-            # Convert to output format
-            output_data = []
-            for name, output_info in outputs_dict.items():
-                # Handle both Terraform state formats
-                value = output_info.get("value")
-                output_type = output_info.get("type", "unknown")
-                sensitive = output_info.get("sensitive", False)
-
-                # Convert value to JSON string for consistent handling
-                value_str = json.dumps(value) if value is not None else "null"
-
-                # Convert type to string representation
-                # Type can be a string ("string", "number") or array (["list", "string"])
-                if isinstance(output_type, list):
-                    type_str = json.dumps(output_type)
-                else:
-                    type_str = str(output_type)
-
-                output_data.append(
-                    {
-                        "name": name,
-                        "value": value_str,
-                        "type": type_str,
-                        "sensitive": bool(sensitive),
-                    }
-                )
-
             logger.info(
                 "Read state outputs successfully",
                 state_path=config.state_path,
-                total_outputs=len(state.get("outputs", {})),
                 filtered_outputs=len(output_data),
+                truncated_values=sum(1 for o in output_data if o["value_truncated"]),
             )
 
             return StateOutputsState(
                 state_path=config.state_path,
                 filter_name=config.filter_name,
+                filter_names=config.filter_names,
+                values=config.values,
+                max_value_bytes=config.max_value_bytes,
+                value_path=config.value_path,
                 output_count=len(output_data),
                 outputs=output_data,
             )
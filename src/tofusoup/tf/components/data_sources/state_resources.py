@@ -1,7 +1,6 @@
 """TofuSoup state_resources data source implementation."""
 
 import json
-from pathlib import Path
 from typing import Any, cast
 
 from attrs import define
@@ -11,7 +10,12 @@ from pyvider.data_sources.base import BaseDataSource  # type: ignore
 from pyvider.data_sources.decorators import register_data_source  # type: ignore
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
-from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
+from pyvider.schema import PvsSchema, a_bool, a_list, a_map, a_num, a_obj, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.paths import parse_value_path
+from tofusoup.tf.components.state.remote import resolve_state
+from tofusoup.tf.components.state.resources import SORT_ORDERS, SORT_STATE, ResourceFilter, read_resources
+from tofusoup.tf.components.state.workers import run_in_state_pool
 
 
 @define(frozen=True)
@@ -22,6 +26,10 @@ class StateResourcesConfig:
     filter_mode: str | None = None
     filter_type: str | None = None
     filter_module: str | None = None
+    attributes: list[str] | None = None
+    limit: int | None = None
+    offset: int | None = None
+    sort_by: str | None = None
 
 
 @define(frozen=True)
@@ -32,7 +40,12 @@ class StateResourcesState:
     filter_mode: str | None = None
     filter_type: str | None = None
     filter_module: str | None = None
+    attributes: list[str] | None = None
+    limit: int | None = None
+    offset: int | None = None
+    sort_by: str | None = None
     resource_count: int | None = None
+    next_offset: int | None = None
     resources: list[dict[str, Any]] | None = None
 
 
@@ -78,6 +91,33 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
       filter_module = "module.ec2_cluster"
     }
 
+    # Instance attributes without `terraform state show`
+    data "tofusoup_state_resources" "instance_ips" {
+      state_path  = "${path.module}/terraform.tfstate"
+      filter_type = "aws_instance"
+      attributes  = ["arn", "private_ip", "tags.Name"]
+    }
+
+    output "private_ips" {
+      value = flatten([
+        for r in data.tofusoup_state_resources.instance_ips.resources : [
+          for i in r.instances : jsondecode(i.attributes["private_ip"])
+        ]
+      ])
+    }
+
+    # Walk a large state a page at a time
+    data "tofusoup_state_resources" "page_1" {
+      state_path = "${path.module}/terraform.tfstate"
+      limit      = 500
+    }
+
+    data "tofusoup_state_resources" "page_2" {
+      state_path = "${path.module}/terraform.tfstate"
+      limit      = 500
+      offset     = data.tofusoup_state_resources.page_1.next_offset
+    }
+
     output "resource_inventory" {
       value = {
         total = data.tofusoup_state_resources.all.resource_count
@@ -99,10 +139,16 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
 
     ## Argument Reference
 
-    - `state_path` - (Required) Path to Terraform state file. Supports absolute, relative, and `~` paths.
+    - `state_path` - (Required) Path to Terraform state file. Supports absolute, relative, and `~` paths,
+      and `s3://bucket/key` or `http(s)://` URLs.
     - `filter_mode` - (Optional) Filter by resource mode: "managed" or "data"
     - `filter_type` - (Optional) Filter by resource type (e.g., "aws_instance", "aws_vpc")
     - `filter_module` - (Optional) Filter by module path (e.g., "module.ec2_cluster")
+    - `attributes` - (Optional) Instance attributes to return, as names or paths into the attributes
+      (e.g., `["arn", "private_ip", "tags.Name"]`). When set, each resource lists its instances.
+    - `limit` - (Optional) Largest number of resources to return
+    - `offset` - (Optional) Number of matching resources to skip before the first one returned (default: 0)
+    - `sort_by` - (Optional) Order of the results: "state" (file order, the default) or "resource_id"
 
     ## Attribute Reference
 
@@ -110,6 +156,11 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
     - `filter_mode` - The mode filter applied (echoes input)
     - `filter_type` - The type filter applied (echoes input)
     - `filter_module` - The module filter applied (echoes input)
+    - `attributes` - The attribute projection applied (echoes input)
+    - `limit` - The page size applied (echoes input)
+    - `offset` - The offset applied (echoes input)
+    - `sort_by` - The sort order applied (echoes input)
+    - `next_offset` - Offset of the next page, or null when there are no more matching resources
     - `resource_count` - Number of resources returned (after filtering)
     - `resources` - List of resource objects, each containing:
       - `mode` - Resource mode: "managed" or "data"
@@ -121,6 +172,9 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
       - `has_multiple_instances` - Boolean indicating count/for_each usage
       - `resource_id` - Unique identifier (format: mode.type.name or mode.module.type.name)
       - `id` - ID attribute from first instance (commonly needed identifier)
+      - `instances` - Only with `attributes`: one object per instance, containing:
+        - `index_key` - The `count` index or `for_each` key (JSON-encoded), null for single instances
+        - `attributes` - Map of each requested attribute to its JSON-encoded value (null if absent)
 
     **Note**: This data source exposes resource metadata and structure, not full
     resource attributes. Use `terraform state show` for complete resource details.
@@ -140,7 +194,12 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
                 "filter_mode": a_str(optional=True),
                 "filter_type": a_str(optional=True),
                 "filter_module": a_str(optional=True),
+                "attributes": a_list(element_type_def=a_str(), optional=True),
+                "limit": a_num(optional=True),
+                "offset": a_num(optional=True),
+                "sort_by": a_str(optional=True),
                 "resource_count": a_num(computed=True),
+                "next_offset": a_num(computed=True),
                 "resources": a_list(
                     element_type_def=a_obj(
                         attributes={
@@ -153,6 +212,15 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
                             "has_multiple_instances": a_bool(computed=True),
                             "resource_id": a_str(computed=True),
                             "id": a_str(computed=True),
+                            "instances": a_list(
+                                element_type_def=a_obj(
+                                    attributes={
+                                        "index_key": a_str(computed=True),
+                                        "attributes": a_map(element_type_def=a_str(), computed=True),
+                                    }
+                                ),
+                                computed=True,
+                            ),
                         }
                     ),
                     computed=True,
@@ -168,6 +236,17 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
             errors.append("'state_path' is required and cannot be empty.")
         if config.filter_mode and config.filter_mode not in ["managed", "data"]:
             errors.append("'filter_mode' must be either 'managed' or 'data'.")
+        for attribute in config.attributes or []:
+            try:
+                parse_value_path(attribute)
+            except ValueError as e:
+                errors.append(f"'attributes' entry is invalid: {e}")
+        if config.limit is not None and config.limit <= 0:
+            errors.append("'limit' must be a positive number of resources.")
+        if config.offset is not None and config.offset < 0:
+            errors.append("'offset' cannot be negative.")
+        if config.sort_by and config.sort_by not in SORT_ORDERS:
+            errors.append("'sort_by' must be either 'state' or 'resource_id'.")
         return errors
 
     @resilient()
@@ -187,83 +266,36 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
         )
 
         try:
-            # Resolve path (handle ~, relative paths)
-            state_path = Path(config.state_path).expanduser().resolve()
-
-            # Check file exists
-            if not state_path.exists():
-                raise DataSourceError(f"State file not found: {config.state_path}")
-
-            if not state_path.is_file():
-                raise DataSourceError(f"Path is not a file: {config.state_path}")
-
-            # Load and parse JSON
+            # Resolve path (handle ~, relative paths); remote states are fetched into a local copy
+            state_path = await resolve_state(config.state_path)
+
+            # Stream resources one at a time and apply every filter in a single pass;
+            # output dicts are only built for the matches on the requested page. The scan runs in
+            # the state worker pool.
+            resource_filter = ResourceFilter(
+                mode=config.filter_mode,
+                type=config.filter_type,
+                module=config.filter_module,
+            )
             try:
-                with state_path.open() as f:
-                    state = json.load(f)
+                page = await run_in_state_pool(
+                    read_resources,
+                    state_path,
+                    resource_filter,
+                    tuple(config.attributes or ()),
+                    offset=int(config.offset or 0),
+                    limit=int(config.limit) if config.limit is not None else None,
+                    sort_by=config.sort_by or SORT_STATE,
+                )
             except json.JSONDecodeError as e:
                 raise DataSourceError(f"Invalid JSON in state file: {e}") from e
 
-            # Extract resources array
-            resources = state.get("resources", [])
-
-            # Apply filters
-            filtered_resources = resources
-
-            if config.filter_mode:
-                filtered_resources = [r for r in filtered_resources if r.get("mode") == config.filter_mode]
-                logger.debug(f"Filtered by mode '{config.filter_mode}': {len(filtered_resources)} resources")
-
-            if config.filter_type:
-                filtered_resources = [r for r in filtered_resources if r.get("type") == config.filter_type]
-                logger.debug(f"Filtered by type '{config.filter_type}': {len(filtered_resources)} resources")
-
-            if config.filter_module:
-                filtered_resources = [r for r in filtered_resources if r.get("module") == config.filter_module]
-                logger.debug(f"Filtered by module '{config.filter_module}': {len(filtered_resources)} resources")
-
-            # Convert to output format
-            resource_data = []
-            for resource in filtered_resources:
-                mode = resource.get("mode", "unknown")
-                type_ = resource.get("type", "unknown")
-                name = resource.get("name", "unknown")
-                module = resource.get("module")
-                provider = resource.get("provider", "")
-                instances = resource.get("instances", [])
-
-                # Construct unique resource ID
-                if module:
-                    resource_id = f"{mode}.{module}.{type_}.{name}"
-                else:
-                    resource_id = f"{mode}.{type_}.{name}"
-
-                # Get ID from first instance if available
-                instance_id = None
-                if instances and len(instances) > 0:
-                    attributes = instances[0].get("attributes", {})
-                    if attributes:
-                        instance_id = attributes.get("id")
-
-                resource_data.append(
-                    {
-                        "mode": mode,
-                        "type": type_,
-                        "name": name,
-                        "provider": provider,
-                        "module": module,
-                        "instance_count": len(instances),
-                        "has_multiple_instances": len(instances) > 1,
-                        "resource_id": resource_id,
-                        "id": instance_id,
-                    }
-                )
-
             logger.info(
                 "Read state resources successfully",
                 state_path=config.state_path,
-                total_resources=len(resources),
-                filtered_resources=len(resource_data),
+                scanned_resources=page.scanned,
+                filtered_resources=len(page.resources),
+                next_offset=page.next_offset,
             )
 
             return StateResourcesState(
@@ -271,8 +303,13 @@ class StateResourcesDataSource(BaseDataSource[str, StateResourcesState, StateRes
                 filter_mode=config.filter_mode,
                 filter_type=config.filter_type,
                 filter_module=config.filter_module,
-                resource_count=len(resource_data),
-                resources=resource_data,
+                attributes=config.attributes,
+                limit=config.limit,
+                offset=config.offset,
+                sort_by=config.sort_by,
+                resource_count=len(page.resources),
+                next_offset=page.next_offset,
+                resources=page.resources,
             )
 
         except DataSourceError:
@@ -0,0 +1,34 @@
+# Count resources along every dimension
+data "tofusoup_state_summary" "all" {
+  state_path = "./terraform.tfstate-example"
+}
+
+# Only per-type counts of the managed resources
+data "tofusoup_state_summary" "managed_types" {
+  state_path  = "./terraform.tfstate-example"
+  filter_mode = "managed"
+  group_by    = ["type"]
+}
+
+output "totals" {
+  description = "Resource and instance totals"
+  value = {
+    resources = data.tofusoup_state_summary.all.resources_count
+    instances = data.tofusoup_state_summary.all.instances_count
+  }
+}
+
+output "resources_per_provider" {
+  description = "Resource count per provider"
+  value       = data.tofusoup_state_summary.all.resources_by_provider
+}
+
+output "resources_per_module" {
+  description = "Resource count per module (root module resources under \"root\")"
+  value       = data.tofusoup_state_summary.all.resources_by_module
+}
+
+output "managed_instances_per_type" {
+  description = "Instance count per managed resource type"
+  value       = data.tofusoup_state_summary.managed_types.instances_by_type
+}
@@ -0,0 +1,205 @@
+"""TofuSoup state_summary data source implementation."""
+
+import json
+from typing import cast
+
+from attrs import define
+from provide.foundation import logger
+from provide.foundation.errors import resilient
+from pyvider.data_sources.base import BaseDataSource  # type: ignore
+from pyvider.data_sources.decorators import register_data_source  # type: ignore
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+from pyvider.schema import PvsSchema, a_list, a_map, a_num, a_str, s_data_source  # type: ignore
+
+from tofusoup.tf.components.state.aggregate import GROUP_DIMENSIONS, read_histogram
+from tofusoup.tf.components.state.remote import resolve_state
+from tofusoup.tf.components.state.resources import ResourceFilter
+from tofusoup.tf.components.state.workers import run_in_state_pool
+
+
+@define(frozen=True)
+class StateSummaryConfig:
+    """Configuration attributes for state_summary data source."""
+
+    state_path: str
+    filter_mode: str | None = None
+    filter_type: str | None = None
+    filter_module: str | None = None
+    group_by: list[str] | None = None
+
+
+@define(frozen=True)
+class StateSummaryState:
+    """State attributes for state_summary data source."""
+
+    state_path: str | None = None
+    filter_mode: str | None = None
+    filter_type: str | None = None
+    filter_module: str | None = None
+    group_by: list[str] | None = None
+    resources_count: int | None = None
+    instances_count: int | None = None
+    resources_by_mode: dict[str, int] | None = None
+    resources_by_type: dict[str, int] | None = None
+    resources_by_provider: dict[str, int] | None = None
+    resources_by_module: dict[str, int] | None = None
+    instances_by_type: dict[str, int] | None = None
+
+
+@register_data_source("tofusoup_state_summary")
+class StateSummaryDataSource(BaseDataSource[str, StateSummaryState, StateSummaryConfig]):  # type: ignore[misc]
+    """
+    Count the resources of a Terraform state file per type, provider, module and mode.
+
+    Computes the grouped counts in one streaming pass over the state and
+    returns only the resulting maps, instead of listing every resource with
+    `tofusoup_state_resources` just to count them in HCL. Supports the same
+    mode, type and module filters.
+
+    **Use Cases:**
+    - Resource counts per type, provider or module for dashboards and reports
+    - Checking quotas and limits across a large state
+    - Spotting modules or providers that dominate a state
+    - Cheap inventory of states too large to list
+
+    ## Example Usage
+
+    ```terraform
+    # Every grouping
+    data "tofusoup_state_summary" "all" {
+      state_path = "${path.module}/terraform.tfstate"
+    }
+
+    # Only per-type counts of the managed resources of one module
+    data "tofusoup_state_summary" "cluster" {
+      state_path    = "${path.module}/terraform.tfstate"
+      filter_mode   = "managed"
+      filter_module = "module.ec2_cluster"
+      group_by      = ["type"]
+    }
+
+    output "resources_per_provider" {
+      value = data.tofusoup_state_summary.all.resources_by_provider
+    }
+
+    output "ec2_instances" {
+      value = lookup(data.tofusoup_state_summary.cluster.instances_by_type, "aws_instance", 0)
+    }
+    ```
+
+    ## Argument Reference
+
+    - `state_path` - (Required) Path to the Terraform state file, or an `s3://bucket/key` or `http(s)://` URL
+    - `filter_mode` - (Optional) Only count resources of this mode: "managed" or "data"
+    - `filter_type` - (Optional) Only count resources of this type (e.g., "aws_instance")
+    - `filter_module` - (Optional) Only count resources in this module (e.g., "module.ec2_cluster")
+    - `group_by` - (Optional) Dimensions to group by: any of "mode", "type", "provider" and "module"
+      (default: all of them). Maps for the other dimensions are left null.
+
+    ## Attribute Reference
+
+    - `state_path` - The path to the state file (echoes input)
+    - `filter_mode`, `filter_type`, `filter_module` - The filters applied (echo input)
+    - `group_by` - The dimensions grouped by (echoes input)
+    - `resources_count` - Number of resources counted (after filtering)
+    - `instances_count` - Number of instances of those resources
+    - `resources_by_mode` - Map of resource mode to resource count
+    - `resources_by_type` - Map of resource type to resource count
+    - `resources_by_provider` - Map of provider address (as written in the state) to resource count
+    - `resources_by_module` - Map of module path to resource count; root module resources are under "root"
+    - `instances_by_type` - Map of resource type to instance count (only when grouping by type)
+    """
+
+    config_class = StateSummaryConfig
+    state_class = StateSummaryState
+
+    @classmethod
+    def get_schema(cls) -> PvsSchema:
+        """Return the data source schema."""
+        return s_data_source(
+            attributes={
+                "state_path": a_str(required=True),
+                "filter_mode": a_str(optional=True),
+                "filter_type": a_str(optional=True),
+                "filter_module": a_str(optional=True),
+                "group_by": a_list(element_type_def=a_str(), optional=True),
+                "resources_count": a_num(computed=True),
+                "instances_count": a_num(computed=True),
+                "resources_by_mode": a_map(element_type_def=a_num(), computed=True),
+                "resources_by_type": a_map(element_type_def=a_num(), computed=True),
+                "resources_by_provider": a_map(element_type_def=a_num(), computed=True),
+                "resources_by_module": a_map(element_type_def=a_num(), computed=True),
+                "instances_by_type": a_map(element_type_def=a_num(), computed=True),
+            }
+        )
+
+    @resilient()
+    async def _validate_config(self, config: StateSummaryConfig) -> list[str]:
+        """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        errors = []
+        if not config.state_path:
+            errors.append("'state_path' is required and cannot be empty.")
+        if config.filter_mode and config.filter_mode not in ["managed", "data"]:
+            errors.append("'filter_mode' must be either 'managed' or 'data'.")
+        for dimension in config.group_by or []:
+            if dimension not in GROUP_DIMENSIONS:
+                errors.append(f"'group_by' entry '{dimension}' must be one of 'mode', 'type', 'provider' or 'module'.")
+        return errors
+
+    @resilient()
+    async def read(self, ctx: ResourceContext) -> StateSummaryState:
+        """Count the resources of the state file."""
+        if not ctx.config:
+            raise DataSourceError("Configuration is required.")
+
+        config = cast(StateSummaryConfig, ctx.config)
+
+        logger.info("Reading state summary", state_path=config.state_path, group_by=config.group_by)
+
+        try:
+            state_path = await resolve_state(config.state_path)
+
+            # One streaming pass in the state worker pool; only the counters are kept.
+            resource_filter = ResourceFilter(
+                mode=config.filter_mode,
+                type=config.filter_type,
+                module=config.filter_module,
+            )
+            group_by = tuple(config.group_by) if config.group_by is not None else GROUP_DIMENSIONS
+            try:
+                histogram = await run_in_state_pool(read_histogram, state_path, resource_filter, group_by)
+            except json.JSONDecodeError as e:
+                raise DataSourceError(f"Invalid JSON in state file: {e}") from e
+
+            logger.info(
+                "Read state summary successfully",
+                state_path=config.state_path,
+                resources_count=histogram.resources_count,
+                instances_count=histogram.instances_count,
+            )
+
+            return StateSummaryState(
+                state_path=config.state_path,
+                filter_mode=config.filter_mode,
+                filter_type=config.filter_type,
+                filter_module=config.filter_module,
+                group_by=config.group_by,
+                resources_count=histogram.resources_count,
+                instances_count=histogram.instances_count,
+                resources_by_mode=histogram.counts("mode"),
+                resources_by_type=histogram.counts("type"),
+                resources_by_provider=histogram.counts("provider"),
+                resources_by_module=histogram.counts("module"),
+                instances_by_type=histogram.instance_counts(),
+            )
+
+        except DataSourceError:
+            # Re-raise DataSourceError as-is
+            raise
+        except PermissionError as e:
+            logger.error("Permission denied reading state file", state_path=config.state_path, error=str(e))
+            raise DataSourceError(f"Permission denied reading state file: {config.state_path}") from e
+        except Exception as e:
+            logger.error("Failed to read state summary", state_path=config.state_path, error=str(e))
+            raise DataSourceError(f"Failed to read state summary from '{config.state_path}': {str(e)}") from e
@@ -1,8 +1,32 @@
 """TofuSoup Terraform provider implementation."""
 
+import asyncio
+import atexit
+import contextlib
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
 from attrs import define
+from provide.foundation import logger
+from pyvider.hub import hub  # type: ignore
 from pyvider.providers import BaseProvider, ProviderMetadata, register_provider  # type: ignore
-from pyvider.schema import PvsSchema, a_num, a_str, s_provider  # type: ignore
+from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_str, s_provider  # type: ignore
+
+from tofusoup.tf.components.registry.cache import (
+    DEFAULT_CACHE_DIR_NAME,
+    DEFAULT_CACHE_MAX_SIZE_MB,
+    RegistryCache,
+)
+from tofusoup.tf.components.registry.pool import DEFAULT_MAX_CONNECTIONS, RegistryClientPool
+from tofusoup.tf.components.registry.singleflight import SingleFlight
+from tofusoup.tf.components.state.graph import StateGraphCache
+from tofusoup.tf.components.state.index import DEFAULT_INDEX_DIR_NAME, StateIndexStore
+from tofusoup.tf.components.state.loader import DEFAULT_STATE_CACHE_MAX_MB, ParsedStateCache
+from tofusoup.tf.components.state.remote import DEFAULT_REMOTE_DIR_NAME, RemoteStateClient
+from tofusoup.tf.components.state.summary import StateSummaryCache
+from tofusoup.tf.components.state.workers import DEFAULT_STATE_PARSE_PROCESSES, DEFAULT_STATE_WORKERS
 
 
 @define(frozen=True)
@@ -11,8 +35,18 @@ class TofuSoupProviderConfig:
 
     cache_dir: str | None = None
     cache_ttl_hours: int = 24
+    cache_max_size_mb: int = DEFAULT_CACHE_MAX_SIZE_MB
+    registry_max_connections: int = DEFAULT_MAX_CONNECTIONS
     terraform_registry_url: str = "https://registry.terraform.io"
     opentofu_registry_url: str = "https://registry.opentofu.org"
+    terraform_registry_mirrors: list[str] | None = None
+    opentofu_registry_mirrors: list[str] | None = None
+    state_cache_max_mb: int = DEFAULT_STATE_CACHE_MAX_MB
+    state_index: bool | None = False
+    state_workers: int = DEFAULT_STATE_WORKERS
+    state_parse_processes: int = DEFAULT_STATE_PARSE_PROCESSES
+    state_s3_endpoint: str | None = None
+    state_s3_region: str | None = None
     log_level: str = "INFO"
 
 
@@ -32,20 +66,60 @@ class TofuSoupProvider(BaseProvider):  # type: ignore[misc]
     provider "tofusoup" {
       cache_dir               = "/tmp/tofusoup-cache"
       cache_ttl_hours         = 24
+      cache_max_size_mb       = 256
+      registry_max_connections = 10
       terraform_registry_url  = "https://registry.terraform.io"
       opentofu_registry_url   = "https://registry.opentofu.org"
+      terraform_registry_mirrors = ["https://registry-mirror.internal.example.com"]
+      state_cache_max_mb      = 512
+      state_index             = true
+      state_workers           = 4
+      state_parse_processes   = 8
+      state_s3_endpoint       = "http://minio.internal.example.com:9000"
+      state_s3_region         = "eu-west-1"
       log_level               = "INFO"
     }
     ```
 
     ## Configuration
 
-    - `cache_dir` - (Optional) Directory path for caching registry responses. If not specified, uses system temp directory.
-    - `cache_ttl_hours` - (Optional) Cache time-to-live in hours. Default: 24 hours.
+    - `cache_dir` - (Optional) Directory for on-disk caches: registry responses, the state index and
+      local copies of remote states, each in its own subdirectory. If not specified, uses the system
+      temp directory.
+    - `cache_ttl_hours` - (Optional) Cache time-to-live in hours. Default: 24 hours. Set to 0 to disable caching.
+    - `cache_max_size_mb` - (Optional) Maximum size of the registry cache; least recently used entries
+      are evicted beyond it. Default: 256.
+    - `registry_max_connections` - (Optional) Maximum number of pooled keep-alive connections per registry.
+      Default: 10.
     - `terraform_registry_url` - (Optional) Terraform registry base URL. Default: "https://registry.terraform.io"
     - `opentofu_registry_url` - (Optional) OpenTofu registry base URL. Default: "https://registry.opentofu.org"
+    - `terraform_registry_mirrors` - (Optional) Additional Terraform registry URLs serving the same content.
+    - `opentofu_registry_mirrors` - (Optional) Additional OpenTofu registry URLs serving the same content.
+    - `state_cache_max_mb` - (Optional) Total size of state files kept parsed in memory, so several state
+      data sources reading the same file parse it once. Default: 512. Set to 0 to disable.
+    - `state_index` - (Optional) Keep an index of resource locations for large state files under
+      `cache_dir`, so filtered `tofusoup_state_resources` reads seek straight to the matching resources.
+      The index is rebuilt automatically when the state changes. Default: false.
+    - `state_workers` - (Optional) Number of threads reading and parsing state files, so state reads
+      run alongside each other and alongside registry requests. Default: 4.
+    - `state_parse_processes` - (Optional) Number of worker processes that parse state files for
+      `tofusoup_state_info`, so many states read at once use several CPU cores. Only the summary is
+      sent back from a worker. Default: 0 (parse in the `state_workers` threads).
+    - `state_s3_endpoint` - (Optional) Endpoint of an S3-compatible object store (such as MinIO) for
+      `s3://bucket/key` state paths, addressed in path style. Default: the regional AWS S3 endpoint.
+    - `state_s3_region` - (Optional) Region used for `s3://` state paths and their request signatures.
+      Default: `AWS_REGION`, then `AWS_DEFAULT_REGION`, then "us-east-1".
     - `log_level` - (Optional) Logging level (DEBUG, INFO, WARNING, ERROR). Default: "INFO"
 
+    When mirrors are configured, each request goes to the registry URL or mirror with the lowest
+    observed latency, failing over to the next one on connection errors or 5xx responses. Mirrors
+    that failed recently are tried last.
+
+    State data sources also accept `s3://bucket/key` and `http(s)://` locations as state paths.
+    S3 requests are signed with the `AWS_ACCESS_KEY_ID`, `AWS_SECRET_ACCESS_KEY` and `AWS_SESSION_TOKEN`
+    environment variables when they are set. Whole states are kept as a local copy under `cache_dir`
+    and only downloaded again when their ETag changes; header and output reads use ranged requests.
+
     ## Registry Data Sources
 
     Query Terraform and OpenTofu registries:
@@ -62,6 +136,10 @@ class TofuSoupProvider(BaseProvider):  # type: ignore[misc]
     - `tofusoup_state_info` - Read state file metadata (version, serial, lineage)
     - `tofusoup_state_resources` - List resources in state file
     - `tofusoup_state_outputs` - Read outputs from state file
+    - `tofusoup_state_inventory` - Summarize every state file matching a glob or directory
+    - `tofusoup_state_summary` - Count resources per type, provider, module and mode
+    - `tofusoup_state_graph` - Resource dependency graph: dependency order and what depends on what
+    - `tofusoup_state_diff` - Compare the resource instances of two state files
     """
 
     config_class = TofuSoupProviderConfig
@@ -74,6 +152,58 @@ class TofuSoupProvider(BaseProvider):  # type: ignore[misc]
                 version="0.0.1108",
             )
         )
+        self._registry_cache: RegistryCache | None = None
+        self._registry_cache_ready = False
+        self._registry_pool: RegistryClientPool | None = None
+        self.registry_singleflight = SingleFlight()
+        self._state_cache: ParsedStateCache | None = None
+        self._state_summary_cache: StateSummaryCache | None = None
+        self._state_graph_cache: StateGraphCache | None = None
+        self._state_index: StateIndexStore | None = None
+        self._state_executor: ThreadPoolExecutor | None = None
+        self._state_process_pool: ProcessPoolExecutor | None = None
+        self._remote_state_client: RemoteStateClient | None = None
+
+    async def setup(self) -> None:
+        """Run framework setup, keeping the TofuSoup configuration schema.
+
+        The base implementation composes the provider schema from capabilities only,
+        which would drop the attributes declared in ``get_schema()``.
+        """
+        await super().setup()
+        self._final_schema = self.get_schema()
+        self.config_class = TofuSoupProviderConfig
+
+    @property
+    def provider_config(self) -> TofuSoupProviderConfig:
+        """Return the configuration Terraform sent, or defaults if the provider is unconfigured."""
+        provider_ctx = hub.get_component("singleton", "provider_context")
+        config = getattr(provider_ctx, "config", None)
+        if isinstance(config, TofuSoupProviderConfig):
+            return config
+        return TofuSoupProviderConfig()
+
+    @property
+    def registry_cache(self) -> RegistryCache | None:
+        """Return the on-disk registry response cache, or None when caching is disabled."""
+        if not self._registry_cache_ready:
+            config = self.provider_config
+            ttl_hours = float(config.cache_ttl_hours if config.cache_ttl_hours is not None else 24)
+            max_size_mb = int(config.cache_max_size_mb or DEFAULT_CACHE_MAX_SIZE_MB)
+            if ttl_hours > 0:
+                if config.cache_dir:
+                    # cache_dir also holds the state index and remote state copies; keep registry entries apart.
+                    cache_dir = Path(config.cache_dir) / "registry"
+                else:
+                    cache_dir = Path(tempfile.gettempdir()) / DEFAULT_CACHE_DIR_NAME
+                self._registry_cache = RegistryCache(
+                    cache_dir=cache_dir,
+                    ttl_seconds=ttl_hours * 3600,
+                    max_size_bytes=max_size_mb * 1024 * 1024,
+                )
+                logger.debug("Registry response cache enabled", cache_dir=str(cache_dir), ttl_hours=ttl_hours)
+            self._registry_cache_ready = True
+        return self._registry_cache
 
     @classmethod
     def get_schema(cls) -> PvsSchema:
@@ -82,8 +212,149 @@ class TofuSoupProvider(BaseProvider):  # type: ignore[misc]
             attributes={
                 "cache_dir": a_str(optional=True),
                 "cache_ttl_hours": a_num(optional=True, default=24),
+                "cache_max_size_mb": a_num(optional=True, default=DEFAULT_CACHE_MAX_SIZE_MB),
+                "registry_max_connections": a_num(optional=True, default=DEFAULT_MAX_CONNECTIONS),
                 "terraform_registry_url": a_str(optional=True, default="https://registry.terraform.io"),
                 "opentofu_registry_url": a_str(optional=True, default="https://registry.opentofu.org"),
+                "terraform_registry_mirrors": a_list(element_type_def=a_str(), optional=True),
+                "opentofu_registry_mirrors": a_list(element_type_def=a_str(), optional=True),
+                "state_cache_max_mb": a_num(optional=True, default=DEFAULT_STATE_CACHE_MAX_MB),
+                "state_index": a_bool(optional=True, default=False),
+                "state_workers": a_num(optional=True, default=DEFAULT_STATE_WORKERS),
+                "state_parse_processes": a_num(optional=True, default=DEFAULT_STATE_PARSE_PROCESSES),
+                "state_s3_endpoint": a_str(optional=True),
+                "state_s3_region": a_str(optional=True),
                 "log_level": a_str(optional=True, default="INFO"),
             }
         )
+
+    def registry_urls(self, registry: str | None) -> list[str]:
+        """Return the configured base URL for a registry followed by its mirrors, without duplicates."""
+        config = self.provider_config
+        defaults = TofuSoupProviderConfig()
+        if registry == "opentofu":
+            primary = config.opentofu_registry_url or defaults.opentofu_registry_url
+            mirrors = config.opentofu_registry_mirrors or []
+        else:
+            primary = config.terraform_registry_url or defaults.terraform_registry_url
+            mirrors = config.terraform_registry_mirrors or []
+        urls: list[str] = []
+        for url in [primary, *mirrors]:
+            url = url.rstrip("/")
+            if url and url not in urls:
+                urls.append(url)
+        return urls
+
+    @property
+    def state_cache(self) -> ParsedStateCache:
+        """Return the in-memory cache of parsed state files shared by the state data sources."""
+        if self._state_cache is None:
+            max_mb = self.provider_config.state_cache_max_mb
+            max_mb = DEFAULT_STATE_CACHE_MAX_MB if max_mb is None else int(max_mb)
+            self._state_cache = ParsedStateCache(max_size_bytes=max_mb * 1024 * 1024)
+        return self._state_cache
+
+    @property
+    def state_summary_cache(self) -> StateSummaryCache:
+        """Return the cache of state summaries, so unchanged state files are not summarized twice."""
+        if self._state_summary_cache is None:
+            self._state_summary_cache = StateSummaryCache()
+        return self._state_summary_cache
+
+    @property
+    def state_graph_cache(self) -> StateGraphCache:
+        """Return the cache of state dependency graphs, so unchanged state files are not walked twice."""
+        if self._state_graph_cache is None:
+            self._state_graph_cache = StateGraphCache()
+        return self._state_graph_cache
+
+    @property
+    def state_index(self) -> StateIndexStore | None:
+        """Return the store for state resource indexes, or None when indexing is disabled."""
+        config = self.provider_config
+        if not config.state_index:
+            return None
+        if self._state_index is None:
+            if config.cache_dir:
+                index_dir = Path(config.cache_dir) / "state-index"
+            else:
+                index_dir = Path(tempfile.gettempdir()) / DEFAULT_INDEX_DIR_NAME
+            self._state_index = StateIndexStore(index_dir)
+            logger.debug("State index enabled", index_dir=str(index_dir))
+        return self._state_index
+
+    @property
+    def state_executor(self) -> ThreadPoolExecutor:
+        """Return the bounded thread pool that runs blocking state file reads."""
+        if self._state_executor is None:
+            max_workers = max(1, int(self.provider_config.state_workers or DEFAULT_STATE_WORKERS))
+            self._state_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tofusoup-state")
+        return self._state_executor
+
+    @property
+    def state_process_pool(self) -> ProcessPoolExecutor | None:
+        """Return the pool of state parse processes, or None when parsing stays in threads."""
+        processes = int(self.provider_config.state_parse_processes or 0)
+        if processes <= 0:
+            return None
+        if self._state_process_pool is None:
+            # Spawned rather than forked: the provider process runs an event loop and worker threads.
+            self._state_process_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.debug("State parse processes enabled", processes=processes)
+        return self._state_process_pool
+
+    @property
+    def remote_state_client(self) -> RemoteStateClient:
+        """Return the connection-pooled client reading `s3://` and `http(s)://` state paths."""
+        if self._remote_state_client is None:
+            config = self.provider_config
+            if config.cache_dir:
+                remote_dir = Path(config.cache_dir) / "remote-state"
+            else:
+                remote_dir = Path(tempfile.gettempdir()) / DEFAULT_REMOTE_DIR_NAME
+            self._remote_state_client = RemoteStateClient(
+                remote_dir, s3_endpoint=config.state_s3_endpoint, s3_region=config.state_s3_region
+            )
+            logger.debug("Remote state client created", cache_dir=str(remote_dir))
+        return self._remote_state_client
+
+    @property
+    def registry_pool(self) -> RegistryClientPool:
+        """Return the connection-pooled registry clients shared for the life of the provider process."""
+        if self._registry_pool is None:
+            max_connections = int(self.provider_config.registry_max_connections or DEFAULT_MAX_CONNECTIONS)
+            self._registry_pool = RegistryClientPool(max_connections=max_connections)
+            atexit.register(self._close_at_exit)
+        return self._registry_pool
+
+    async def shutdown(self) -> None:
+        """Release provider-scoped resources such as pooled registry connections."""
+        stats = self.registry_singleflight.stats
+        logger.debug("Registry request coalescing", executed=stats.executed, coalesced=stats.coalesced)
+        if self._state_cache is not None:
+            state_stats = self._state_cache.stats
+            logger.debug("Parsed state cache", hits=state_stats.hits, misses=state_stats.misses)
+            self._state_cache.clear()
+        if self._state_summary_cache is not None:
+            self._state_summary_cache.clear()
+        if self._state_graph_cache is not None:
+            self._state_graph_cache.clear()
+        if self._state_executor is not None:
+            executor, self._state_executor = self._state_executor, None
+            executor.shutdown(wait=False)
+        if self._state_process_pool is not None:
+            process_pool, self._state_process_pool = self._state_process_pool, None
+            process_pool.shutdown(wait=False, cancel_futures=True)
+        if self._remote_state_client is not None:
+            remote_client, self._remote_state_client = self._remote_state_client, None
+            remote_client.close()
+        if self._registry_pool is not None:
+            pool, self._registry_pool = self._registry_pool, None
+            await pool.aclose()
+
+    def _close_at_exit(self) -> None:
+        # pyvider has no provider shutdown hook; close pooled connections on interpreter exit.
+        with contextlib.suppress(Exception):
+            asyncio.run(self.shutdown())
@@ -0,0 +1,17 @@
+"""Registry access helpers shared by the TofuSoup registry data sources."""
+
+from tofusoup.tf.components.registry.cache import RegistryCache, cache_key
+from tofusoup.tf.components.registry.pool import RegistryClientPool
+from tofusoup.tf.components.registry.query import query_registry
+from tofusoup.tf.components.registry.singleflight import SingleFlight, SingleFlightStats
+from tofusoup.tf.components.runtime import active_provider
+
+__all__ = [
+    "RegistryCache",
+    "RegistryClientPool",
+    "SingleFlight",
+    "SingleFlightStats",
+    "active_provider",
+    "cache_key",
+    "query_registry",
+]
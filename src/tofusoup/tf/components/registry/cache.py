@@ -0,0 +1,163 @@
+"""Persistent on-disk cache for registry responses.
+
+Entries are content-addressed: the cache key is the SHA-256 of the canonical
+JSON encoding of (registry URL, endpoint, params). Each entry lives in its own
+file, is written atomically (temp file + ``os.replace``) and carries its
+creation time so the TTL can be enforced on read. The total size of the cache
+directory is bounded; when it grows past the limit the least recently used
+entries (by file mtime, refreshed on every hit) are evicted first.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from provide.foundation import logger
+
+from tofusoup.tf.components.codec import get_codec
+
+DEFAULT_CACHE_DIR_NAME = "tofusoup-registry-cache"
+DEFAULT_CACHE_MAX_SIZE_MB = 256
+
+_ENTRY_SUFFIX = ".json"
+# Entries are sharded by the first two hex digits of their key; nothing else in the directory is an entry.
+_ENTRY_GLOB = f"[0-9a-f][0-9a-f]/*{_ENTRY_SUFFIX}"
+
+
+def cache_key(registry_url: str, endpoint: str, params: dict[str, Any]) -> str:
+    """Return the content address for a registry request."""
+    canonical = json.dumps(
+        {"registry_url": registry_url.rstrip("/"), "endpoint": endpoint, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RegistryCache:
+    """Size-bounded, TTL-expiring registry response cache shared by all registry data sources."""
+
+    def __init__(self, cache_dir: str | Path, ttl_seconds: float, max_size_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._total_size: int | None = None
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob(_ENTRY_GLOB))
+
+    def get(self, registry_url: str, endpoint: str, params: dict[str, Any]) -> Any | None:
+        """Return the cached payload, or None on a miss or an expired entry."""
+        key = cache_key(registry_url, endpoint, params)
+        path = self._entry_path(key)
+        try:
+            with path.open("rb") as f:
+                entry = get_codec().load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Discarding unreadable registry cache entry", path=str(path), error=str(e))
+            self._remove(path)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            logger.debug("Registry cache entry expired", endpoint=endpoint, key=key)
+            self._remove(path)
+            return None
+
+        # Refresh mtime so eviction sees this entry as recently used.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        logger.debug("Registry cache hit", endpoint=endpoint, key=key)
+        return entry.get("payload")
+
+    def set(self, registry_url: str, endpoint: str, params: dict[str, Any], payload: Any) -> None:
+        """Store a payload, evicting least recently used entries if the size limit is exceeded."""
+        key = cache_key(registry_url, endpoint, params)
+        path = self._entry_path(key)
+        data = get_codec().dumps_bytes({"created_at": time.time(), "payload": payload})
+        if len(data) > self.max_size_bytes:
+            logger.debug("Registry response too large to cache", endpoint=endpoint, size=len(data))
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous_size = path.stat().st_size if path.exists() else 0
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=_ENTRY_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write registry cache entry", path=str(path), error=str(e))
+            return
+
+        logger.debug("Registry cache store", endpoint=endpoint, key=key, size=len(data))
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(self._size_of(p) for p in self._entries())
+            else:
+                self._total_size += len(data) - previous_size
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            for path in self._entries():
+                self._remove(path)
+            self._total_size = 0
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits its size budget."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+
+        self._total_size = total
+        logger.debug("Evicted registry cache entries", evicted=evicted, total_size=total)
+
+    @staticmethod
+    def _size_of(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        with contextlib.suppress(OSError):
+            path.unlink()
@@ -0,0 +1,126 @@
+"""Latency-based registry mirror selection with failover.
+
+The TofuSoup registry clients turn transport errors and bad statuses into empty
+results, so failures cannot be seen from their return values. Instead, every
+pooled HTTP client is wrapped in ``ObservedTransport``, which times each
+response and reports it to a ``MirrorSelector``. A failure (connection error or
+5xx) is also flagged on the current ``MirrorAttempt`` so the caller knows to
+retry the request on the next mirror.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+
+import httpx
+from attrs import define, field
+from provide.foundation import logger
+
+DEFAULT_FAILURE_COOLDOWN_SECONDS = 30.0
+DEFAULT_LATENCY_SMOOTHING = 0.3
+
+
+@define
+class MirrorAttempt:
+    """Outcome of one request attempt against a single mirror."""
+
+    base_url: str
+    failed: bool = False
+
+
+@define
+class MirrorStats:
+    """Observed health of a single registry mirror."""
+
+    latency: float | None = None
+    successes: int = 0
+    failures: int = 0
+    last_failure: float | None = None
+
+
+current_attempt: ContextVar[MirrorAttempt | None] = ContextVar("tofusoup_mirror_attempt", default=None)
+
+
+@define
+class MirrorSelector:
+    """Order candidate registry URLs by observed latency, skipping recently failed ones."""
+
+    failure_cooldown: float = DEFAULT_FAILURE_COOLDOWN_SECONDS
+    smoothing: float = DEFAULT_LATENCY_SMOOTHING
+    _stats: dict[str, MirrorStats] = field(factory=dict, init=False)
+
+    def stats(self, base_url: str) -> MirrorStats:
+        """Return the (possibly empty) statistics for a mirror."""
+        return self._stats.setdefault(base_url, MirrorStats())
+
+    def record_success(self, base_url: str, elapsed: float) -> None:
+        """Fold a response time into the mirror's exponentially weighted latency."""
+        stats = self.stats(base_url)
+        if stats.latency is None:
+            stats.latency = elapsed
+        else:
+            stats.latency = self.smoothing * elapsed + (1 - self.smoothing) * stats.latency
+        stats.successes += 1
+
+    def record_failure(self, base_url: str) -> None:
+        """Mark a mirror as failed, putting it behind healthy mirrors until the cooldown passes."""
+        stats = self.stats(base_url)
+        stats.failures += 1
+        stats.last_failure = time.monotonic()
+        logger.warning("Registry mirror request failed", base_url=base_url, failures=stats.failures)
+
+    def order(self, base_urls: list[str]) -> list[str]:
+        """Return ``base_urls`` fastest first.
+
+        Mirrors in their failure cooldown go last. Mirrors never tried yet sort
+        ahead of measured ones so each gets probed once, while mirrors that have
+        only ever failed are retried after every measured one, fewest failures
+        first; the configured order breaks ties.
+        """
+        now = time.monotonic()
+
+        def sort_key(indexed: tuple[int, str]) -> tuple[bool, float, int, int]:
+            index, url = indexed
+            stats = self._stats.get(url)
+            if stats is None:
+                return (False, 0.0, 0, index)
+            cooling_down = stats.last_failure is not None and now - stats.last_failure < self.failure_cooldown
+            if stats.latency is not None:
+                latency = stats.latency
+            else:
+                latency = float("inf") if stats.failures else 0.0
+            return (cooling_down, latency, stats.failures, index)
+
+        return [url for _, url in sorted(enumerate(base_urls), key=sort_key)]
+
+
+class ObservedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that reports per-mirror latency and failures to a MirrorSelector."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, selector: MirrorSelector, base_url: str) -> None:
+        self._transport = transport
+        self._selector = selector
+        self._base_url = base_url
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._fail()
+            raise
+        if response.status_code >= 500:
+            self._fail()
+        else:
+            self._selector.record_success(self._base_url, time.perf_counter() - start)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _fail(self) -> None:
+        self._selector.record_failure(self._base_url)
+        attempt = current_attempt.get()
+        if attempt is not None:
+            attempt.failed = True
@@ -0,0 +1,77 @@
+"""Provider-scoped pool of long-lived registry clients.
+
+Each registry base URL gets a single ``httpx.AsyncClient`` with keep-alive and a
+bounded connection pool, shared by every registry client object built for that
+URL. Reads therefore reuse warm TCP/TLS connections instead of paying a fresh
+handshake per data source. Each client's transport is observed by the pool's
+``MirrorSelector`` so mirror latency and failures are tracked per URL.
+"""
+
+from __future__ import annotations
+
+import httpx
+from provide.foundation import logger
+
+from tofusoup.registry.base import BaseTfRegistry, RegistryConfig  # type: ignore
+from tofusoup.tf.components.registry.mirrors import MirrorSelector, ObservedTransport
+
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+class RegistryClientPool:
+    """Long-lived, connection-pooled registry clients keyed by registry URL."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        selector: MirrorSelector | None = None,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.selector = selector or MirrorSelector()
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+        self._registries: dict[tuple[type[BaseTfRegistry], str], BaseTfRegistry] = {}
+
+    def http_client(self, base_url: str) -> httpx.AsyncClient:
+        """Return the shared HTTP client for a registry URL, creating it on first use."""
+        client = self._http_clients.get(base_url)
+        if client is None or client.is_closed:
+            transport = ObservedTransport(httpx.AsyncHTTPTransport(limits=self.limits), self.selector, base_url)
+            client = httpx.AsyncClient(base_url=base_url, transport=transport)
+            self._http_clients[base_url] = client
+            logger.debug(
+                "Created pooled registry HTTP client",
+                base_url=base_url,
+                max_connections=self.limits.max_connections,
+            )
+        return client
+
+    def get(self, registry_class: type[BaseTfRegistry], base_url: str) -> BaseTfRegistry:
+        """Return a registry client bound to the pooled HTTP client for ``base_url``.
+
+        The returned object must not be used as an async context manager, since
+        leaving the context would close the shared HTTP client.
+        """
+        key = (registry_class, base_url)
+        registry = self._registries.get(key)
+        client = self.http_client(base_url)
+        if registry is None:
+            registry = registry_class(RegistryConfig(base_url=base_url))
+            self._registries[key] = registry
+        registry._client = client
+        return registry
+
+    async def aclose(self) -> None:
+        """Close every pooled HTTP client."""
+        clients = list(self._http_clients.values())
+        self._http_clients.clear()
+        self._registries.clear()
+        for client in clients:
+            await client.aclose()
+        if clients:
+            logger.debug("Closed pooled registry HTTP clients", count=len(clients))
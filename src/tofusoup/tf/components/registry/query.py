@@ -0,0 +1,98 @@
+"""Shared request path for the registry data sources."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from provide.foundation import logger
+
+from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry, RegistryConfig  # type: ignore
+from tofusoup.tf.components.registry.cache import cache_key
+from tofusoup.tf.components.registry.mirrors import MirrorAttempt, current_attempt
+from tofusoup.tf.components.registry.pool import RegistryClientPool
+from tofusoup.tf.components.runtime import active_provider
+
+T = TypeVar("T")
+
+
+def registry_urls(registry: str | None) -> list[str]:
+    """Return the candidate base URLs for a registry, primary URL first.
+
+    Uses the running provider's configuration when there is one, otherwise the
+    public registry defaults.
+    """
+    provider = active_provider()
+    if provider is not None:
+        return provider.registry_urls(registry)  # type: ignore[no-any-return]
+    return [OPENTOFU_REGISTRY_URL if registry == "opentofu" else TERRAFORM_REGISTRY_URL]
+
+
+async def query_registry(
+    registry_class: type[BaseTfRegistry],
+    registry: str | None,
+    endpoint: str,
+    params: dict[str, Any],
+    fetch: Callable[[BaseTfRegistry], Awaitable[T]],
+) -> T:
+    """Run ``fetch`` against a registry client, going through the provider's response cache.
+
+    When a TofuSoup provider is running, concurrent identical requests share a single
+    call, the client comes from its connection pool and the request goes to the
+    fastest healthy mirror, failing over to the next one on connection errors or
+    5xx responses. Otherwise a one-off client is opened for the duration of the call.
+
+    ``endpoint`` and ``params`` identify the request for caching purposes; ``fetch``
+    must return JSON-serializable data. Empty results are never cached because the
+    registry clients report failures as empty lists/dicts.
+    """
+    urls = registry_urls(registry)
+    # Mirrors serve the same content, so requests are identified by the primary URL.
+    primary_url = urls[0]
+
+    provider = active_provider()
+    if provider is None:
+        async with registry_class(RegistryConfig(base_url=primary_url)) as client:
+            return await fetch(client)
+
+    cache = provider.registry_cache
+    if cache is not None:
+        cached = cache.get(primary_url, endpoint, params)
+        if cached is not None:
+            return cached  # type: ignore[no-any-return]
+
+    async def load() -> T:
+        pool = provider.registry_pool
+        result = await _fetch_with_failover(pool, registry_class, pool.selector.order(urls), fetch)
+        if cache is not None and result:
+            cache.set(primary_url, endpoint, params, result)
+        return result
+
+    result: T = await provider.registry_singleflight.do(cache_key(primary_url, endpoint, params), load)
+    return result
+
+
+async def _fetch_with_failover(
+    pool: RegistryClientPool,
+    registry_class: type[BaseTfRegistry],
+    urls: list[str],
+    fetch: Callable[[BaseTfRegistry], Awaitable[T]],
+) -> T:
+    """Try each mirror in order; the last one's answer is returned whatever its outcome."""
+    for base_url in urls[:-1]:
+        attempt = MirrorAttempt(base_url=base_url)
+        token = current_attempt.set(attempt)
+        try:
+            result = await fetch(pool.get(registry_class, base_url))
+        except Exception:
+            if not attempt.failed:
+                raise
+        else:
+            if not attempt.failed:
+                return result
+        finally:
+            current_attempt.reset(token)
+        logger.warning("Registry mirror failed, trying next mirror", base_url=base_url)
+
+    return await fetch(pool.get(registry_class, urls[-1]))
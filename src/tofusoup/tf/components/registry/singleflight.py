@@ -0,0 +1,71 @@
+"""In-flight request coalescing for registry queries.
+
+Terraform reads many data source instances concurrently, and several of them
+often ask the registry the same question. ``SingleFlight`` lets the first caller
+for a key start the request while concurrent callers with the same key wait
+for, and share, its result.
+
+The request runs in a task owned by the single-flight entry rather than in the
+first caller, so cancelling any one caller, the first included, only stops
+that caller from waiting; the others still get the result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from attrs import define, field
+from provide.foundation import logger
+
+T = TypeVar("T")
+
+
+@define
+class SingleFlightStats:
+    """Counters describing how much work the single-flight layer saved."""
+
+    executed: int = 0
+    coalesced: int = 0
+
+
+@define
+class SingleFlight:
+    """Share one in-flight call, and its result or error, among concurrent callers with the same key."""
+
+    stats: SingleFlightStats = field(factory=SingleFlightStats)
+    _inflight: dict[str, asyncio.Task[Any]] = field(factory=dict, init=False)
+
+    @property
+    def inflight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._inflight)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call`` for ``key`` unless an identical call is already running, then wait for that one."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            logger.debug("Coalesced registry request", key=key, coalesced=self.stats.coalesced)
+        else:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            self.stats.executed += 1
+        try:
+            result: T = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if task.cancelled() and (current is None or not current.cancelling()):
+                # The shared call was cancelled from outside; this caller was not.
+                raise RuntimeError(f"Registry request was cancelled: {key}") from None
+            raise
+        return result
+
+    def _finished(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Calls nobody waits for any more must not trigger "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,11 @@
+"""Access to the running TofuSoup provider from data source code."""
+
+from typing import Any
+
+from pyvider.hub import hub  # type: ignore
+
+
+def active_provider() -> Any | None:
+    """Return the running TofuSoup provider instance, if one is registered with the hub."""
+    provider = hub.get_component("singleton", "provider")
+    return provider if hasattr(provider, "registry_cache") else None
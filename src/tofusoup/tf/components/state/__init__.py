@@ -0,0 +1,176 @@
+"""State file access helpers shared by the TofuSoup state data sources."""
+
+from tofusoup.tf.components.state.aggregate import (
+    GROUP_DIMENSIONS,
+    ResourceHistogram,
+    read_histogram,
+    resource_histogram,
+)
+from tofusoup.tf.components.state.diff import (
+    StateDiff,
+    attributes_digest,
+    diff_states,
+    instance_address,
+    iter_instance_digests,
+)
+from tofusoup.tf.components.state.graph import (
+    StateGraph,
+    StateGraphCache,
+    build_graph,
+    graph_cache,
+    read_graph,
+    resource_dependency_address,
+    resource_graph_address,
+    strip_instance_keys,
+)
+from tofusoup.tf.components.state.index import StateIndex, StateIndexStore, state_index_store
+from tofusoup.tf.components.state.inventory import (
+    InventoryEntry,
+    find_state_files,
+    inventory_totals,
+    summarize_state_files,
+)
+from tofusoup.tf.components.state.loader import (
+    ParsedStateCache,
+    ParsedStateCacheStats,
+    SignatureCache,
+    StateSignature,
+    StateSource,
+    cached_state,
+    detect_compression,
+    load_state,
+    map_files_in,
+    open_state,
+    open_state_source,
+    open_state_stream,
+    resolve_state_path,
+    state_cache,
+)
+from tofusoup.tf.components.state.outputs import (
+    OutputFilter,
+    encode_bounded,
+    iter_outputs,
+    output_entry,
+    read_outputs,
+    select_type,
+)
+from tofusoup.tf.components.state.paths import ValuePath, parse_value_path, select_value
+from tofusoup.tf.components.state.remote import (
+    RemoteState,
+    RemoteStateClient,
+    is_remote_location,
+    remote_state_client,
+    resolve_state,
+    resolve_state_prefix,
+)
+from tofusoup.tf.components.state.resources import (
+    SORT_ORDERS,
+    ResourceFilter,
+    ResourcePage,
+    iter_resources,
+    read_resources,
+    resource_address,
+    resource_entry,
+)
+from tofusoup.tf.components.state.scanner import StateEvent, scan_state
+from tofusoup.tf.components.state.summary import (
+    StateSummary,
+    StateSummaryCache,
+    parse_summary,
+    read_cached_summary,
+    read_header_summary,
+    read_summary,
+    scan_header,
+    scan_summary,
+    summarize_state,
+    summarize_state_file,
+    summary_cache,
+)
+from tofusoup.tf.components.state.workers import (
+    DEFAULT_STATE_PARSE_PROCESSES,
+    DEFAULT_STATE_WORKERS,
+    run_in_parse_pool,
+    run_in_state_pool,
+    state_process_pool,
+)
+
+__all__ = [
+    "DEFAULT_STATE_PARSE_PROCESSES",
+    "DEFAULT_STATE_WORKERS",
+    "GROUP_DIMENSIONS",
+    "SORT_ORDERS",
+    "InventoryEntry",
+    "OutputFilter",
+    "ParsedStateCache",
+    "ParsedStateCacheStats",
+    "RemoteState",
+    "RemoteStateClient",
+    "ResourceFilter",
+    "ResourceHistogram",
+    "ResourcePage",
+    "SignatureCache",
+    "StateDiff",
+    "StateEvent",
+    "StateGraph",
+    "StateGraphCache",
+    "StateIndex",
+    "StateIndexStore",
+    "StateSignature",
+    "StateSource",
+    "StateSummary",
+    "StateSummaryCache",
+    "ValuePath",
+    "attributes_digest",
+    "build_graph",
+    "cached_state",
+    "detect_compression",
+    "diff_states",
+    "encode_bounded",
+    "find_state_files",
+    "graph_cache",
+    "instance_address",
+    "inventory_totals",
+    "is_remote_location",
+    "iter_instance_digests",
+    "iter_outputs",
+    "iter_resources",
+    "load_state",
+    "map_files_in",
+    "open_state",
+    "open_state_source",
+    "open_state_stream",
+    "output_entry",
+    "parse_summary",
+    "parse_value_path",
+    "read_cached_summary",
+    "read_graph",
+    "read_header_summary",
+    "read_histogram",
+    "read_outputs",
+    "read_resources",
+    "read_summary",
+    "remote_state_client",
+    "resolve_state",
+    "resolve_state_path",
+    "resolve_state_prefix",
+    "resource_address",
+    "resource_dependency_address",
+    "resource_entry",
+    "resource_graph_address",
+    "resource_histogram",
+    "run_in_parse_pool",
+    "run_in_state_pool",
+    "scan_header",
+    "scan_state",
+    "scan_summary",
+    "select_type",
+    "select_value",
+    "state_cache",
+    "state_index_store",
+    "state_process_pool",
+    "strip_instance_keys",
+    "summarize_state",
+    "summarize_state_file",
+    "summarize_state_files",
+    "summary_cache",
+]
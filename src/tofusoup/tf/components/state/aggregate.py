@@ -0,0 +1,86 @@
+"""Grouped resource counts over a Terraform state file.
+
+A histogram counts the resources of a state per mode, type, provider and
+module, plus their instances, in a single pass over ``iter_resources``: a
+streamed state is never held in memory, and only the counters are kept. Only
+the requested dimensions are counted, and the same push-down filters as
+``tofusoup_state_resources`` (and its state index) narrow the resources first.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from attrs import define, field
+
+from tofusoup.tf.components.state.loader import open_state_source
+from tofusoup.tf.components.state.resources import ResourceFilter, iter_resources
+
+GROUP_DIMENSIONS = ("mode", "type", "provider", "module")
+ROOT_MODULE_KEY = "root"
+
+
+def _group_key(resource: dict[str, Any], dimension: str) -> str:
+    if dimension == "module":
+        return str(resource.get("module") or ROOT_MODULE_KEY)
+    return str(resource.get(dimension) or "unknown")
+
+
+@define
+class ResourceHistogram:
+    """Resource counts per group for each dimension, and instance totals."""
+
+    group_by: tuple[str, ...] = GROUP_DIMENSIONS
+    resources_count: int = 0
+    instances_count: int = 0
+    resources_by: dict[str, Counter[str]] = field(init=False)
+    instances_by_type: Counter[str] = field(factory=Counter)
+
+    def __attrs_post_init__(self) -> None:
+        self.resources_by = {dimension: Counter() for dimension in self.group_by}
+
+    def add(self, resource: dict[str, Any]) -> None:
+        """Count one state resource."""
+        instances = len(resource.get("instances") or ())
+        self.resources_count += 1
+        self.instances_count += instances
+        for dimension, counts in self.resources_by.items():
+            counts[_group_key(resource, dimension)] += 1
+        if "type" in self.resources_by:
+            self.instances_by_type[_group_key(resource, "type")] += instances
+
+    def counts(self, dimension: str) -> dict[str, int] | None:
+        """Resource counts per group of ``dimension``, or None if it was not grouped."""
+        counts = self.resources_by.get(dimension)
+        return dict(sorted(counts.items())) if counts is not None else None
+
+    def instance_counts(self) -> dict[str, int] | None:
+        """Instance counts per resource type, or None if types were not grouped."""
+        return dict(sorted(self.instances_by_type.items())) if "type" in self.resources_by else None
+
+
+def resource_histogram(
+    resources: Iterable[dict[str, Any]],
+    resource_filter: ResourceFilter | None = None,
+    group_by: Iterable[str] = GROUP_DIMENSIONS,
+) -> ResourceHistogram:
+    """Count the resources matching ``resource_filter`` along the ``group_by`` dimensions."""
+    resource_filter = resource_filter or ResourceFilter()
+    histogram = ResourceHistogram(group_by=tuple(dict.fromkeys(group_by)))
+    for resource in resources:
+        if resource_filter.matches(resource):
+            histogram.add(resource)
+    return histogram
+
+
+def read_histogram(
+    path: Path,
+    resource_filter: ResourceFilter | None = None,
+    group_by: Iterable[str] = GROUP_DIMENSIONS,
+) -> ResourceHistogram:
+    """Return the resource histogram of the state at ``path``; see ``resource_histogram``."""
+    with open_state_source(path) as source:
+        return resource_histogram(iter_resources(source, resource_filter), resource_filter, group_by)
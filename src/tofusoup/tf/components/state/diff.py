@@ -0,0 +1,88 @@
+"""Structural diff between two Terraform state files.
+
+Each resource instance is reduced to its address and a 16-byte digest of its
+canonicalized attributes (keys sorted, compact separators), so comparing two
+states keeps one small digest per instance of the old state in memory, never
+the attributes themselves. Both files are read one resource at a time through
+``iter_resources``, so large streamed states are never materialized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from attrs import define
+
+from tofusoup.tf.components.state.graph import resource_graph_address
+from tofusoup.tf.components.state.loader import StateSource, open_state_source
+from tofusoup.tf.components.state.resources import iter_resources
+
+DIGEST_SIZE = 16
+
+_CANONICAL = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def instance_address(resource: dict[str, Any], instance: dict[str, Any]) -> str:
+    """Return the Terraform address of one resource instance, e.g. ``aws_instance.web[0]``."""
+    address = resource_graph_address(resource)
+    index_key = instance.get("index_key")
+    if isinstance(index_key, str):
+        address = f"{address}[{json.dumps(index_key)}]"
+    elif index_key is not None:
+        address = f"{address}[{index_key}]"
+    deposed = instance.get("deposed")
+    if deposed:
+        address = f"{address} (deposed {deposed})"
+    return address
+
+
+def attributes_digest(attributes: Any) -> bytes:
+    """Digest of the canonical JSON encoding of ``attributes``."""
+    return hashlib.blake2b(_CANONICAL.encode(attributes).encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+def iter_instance_digests(source: StateSource) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(address, digest)`` for every resource instance of the state, in state order."""
+    for resource in iter_resources(source):
+        for instance in resource.get("instances") or ():
+            attributes = instance.get("attributes", instance.get("attributes_flat"))
+            yield instance_address(resource, instance), attributes_digest(attributes)
+
+
+@define(frozen=True)
+class StateDiff:
+    """Instance addresses added, removed and changed between two states.
+
+    ``added`` and ``changed`` follow the order of the new state, ``removed``
+    the order of the old one.
+    """
+
+    added: list[str]
+    removed: list[str]
+    changed: list[str]
+    unchanged_count: int
+
+
+def diff_states(old_path: Path, new_path: Path) -> StateDiff:
+    """Compare the resource instances of the states at ``old_path`` and ``new_path``."""
+    with open_state_source(old_path) as source:
+        remaining = dict(iter_instance_digests(source))
+
+    added = []
+    changed = []
+    unchanged_count = 0
+    with open_state_source(new_path) as source:
+        for address, digest in iter_instance_digests(source):
+            previous = remaining.pop(address, None)
+            if previous is None:
+                added.append(address)
+            elif previous != digest:
+                changed.append(address)
+            else:
+                unchanged_count += 1
+
+    return StateDiff(added=added, removed=list(remaining), changed=changed, unchanged_count=unchanged_count)
@@ -0,0 +1,218 @@
+"""Dependency graph of the resources in a Terraform state file.
+
+Every resource instance in a state records the addresses of the resources it
+depends on. ``build_graph`` turns these into an adjacency index in one pass:
+resources get integer IDs in state order, and forward edges (dependencies) and
+reverse edges (dependents) are both stored in compressed sparse row form, as an
+offsets array and a targets array of unsigned integers. Transitive queries and
+the topological order then walk these arrays, touching each edge once.
+
+Resources are nodes under their full address, module instance keys included
+(``module.net[0].aws_vpc.main``). Terraform writes ``dependencies`` as
+configuration addresses, without instance keys (``module.net.aws_vpc.main``),
+so a dependency is an edge to every node sharing that configuration address:
+a resource depending on a resource of a ``count`` or ``for_each`` module
+depends on it in each instance of the module.
+
+Graphs are cached per state file, validated by the same stat signature as the
+parsed-state cache, so repeated queries against an unchanged state build the
+graph once.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from attrs import define
+
+from tofusoup.tf.components.runtime import active_provider
+from tofusoup.tf.components.state.loader import SignatureCache, StateSignature, open_state_source
+from tofusoup.tf.components.state.resources import iter_resources
+
+DEFAULT_GRAPH_CACHE_ENTRIES = 64
+
+_INSTANCE_KEY = re.compile(r'\[(?:"(?:[^"\\]|\\.)*"|\d+)\]')
+
+
+def resource_graph_address(resource: dict[str, Any]) -> str:
+    """Return the address of ``resource`` as a graph node, module instance keys included."""
+    address = f"{resource.get('type', 'unknown')}.{resource.get('name', 'unknown')}"
+    if resource.get("mode") == "data":
+        address = f"data.{address}"
+    module = resource.get("module")
+    return f"{module}.{address}" if module else address
+
+
+def strip_instance_keys(address: str) -> str:
+    """Return ``address`` without module instance keys, as Terraform writes it in ``dependencies``."""
+    return _INSTANCE_KEY.sub("", address) if "[" in address else address
+
+
+def resource_dependency_address(resource: dict[str, Any]) -> str:
+    """Return the address under which other resources list ``resource`` in their ``dependencies``."""
+    return strip_instance_keys(resource_graph_address(resource))
+
+
+def _csr(edges: list[list[int]]) -> tuple[array[int], array[int]]:
+    offsets = array("I", [0])
+    targets = array("I")
+    for node_edges in edges:
+        targets.extend(node_edges)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+@define(frozen=True)
+class StateGraph:
+    """Resources of a state as integer nodes, with forward and reverse adjacency.
+
+    Node ``n`` is ``addresses[n]``; its dependencies are
+    ``dependency_targets[dependency_offsets[n]:dependency_offsets[n + 1]]``,
+    and its dependents are stored the same way.
+    """
+
+    addresses: tuple[str, ...]
+    ids: dict[str, int]
+    dependency_offsets: array[int]
+    dependency_targets: array[int]
+    dependent_offsets: array[int]
+    dependent_targets: array[int]
+
+    @property
+    def edges_count(self) -> int:
+        return len(self.dependency_targets)
+
+    def node(self, address: str) -> int | None:
+        """Return the ID of the resource at ``address``, or None if it is not in the state."""
+        return self.ids.get(address)
+
+    def dependencies(self, node: int) -> array[int]:
+        """IDs of the resources ``node`` depends on directly."""
+        return self.dependency_targets[self.dependency_offsets[node] : self.dependency_offsets[node + 1]]
+
+    def dependents(self, node: int) -> array[int]:
+        """IDs of the resources that depend on ``node`` directly."""
+        return self.dependent_targets[self.dependent_offsets[node] : self.dependent_offsets[node + 1]]
+
+    def _reachable(self, node: int, offsets: array[int], targets: array[int]) -> list[int]:
+        seen = bytearray(len(self.addresses))
+        seen[node] = 1
+        found = []
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for target in targets[offsets[current] : offsets[current + 1]]:
+                if not seen[target]:
+                    seen[target] = 1
+                    found.append(target)
+                    queue.append(target)
+        return sorted(found)
+
+    def transitive_dependencies(self, node: int) -> list[int]:
+        """IDs of every resource ``node`` depends on, directly or not, in state order."""
+        return self._reachable(node, self.dependency_offsets, self.dependency_targets)
+
+    def transitive_dependents(self, node: int) -> list[int]:
+        """IDs of every resource depending on ``node``, directly or not, in state order."""
+        return self._reachable(node, self.dependent_offsets, self.dependent_targets)
+
+    def topological_order(self) -> tuple[list[int], bool]:
+        """Return every node with dependencies before their dependents, and whether there are cycles.
+
+        Among resources that are ready at the same time, the earliest in the
+        state comes first. Nodes on or behind a cycle cannot be ordered; they
+        come last, in state order.
+        """
+        count = len(self.addresses)
+        pending = [self.dependency_offsets[n + 1] - self.dependency_offsets[n] for n in range(count)]
+        ready = [n for n in range(count) if not pending[n]]
+        order = []
+        while ready:
+            node = heapq.heappop(ready)
+            order.append(node)
+            for dependent in self.dependents(node):
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    heapq.heappush(ready, dependent)
+        if len(order) == count:
+            return order, False
+        return order + [n for n in range(count) if pending[n]], True
+
+
+def build_graph(resources: Iterable[dict[str, Any]]) -> StateGraph:
+    """Build the dependency graph of ``resources`` in one pass.
+
+    A resource depends on the union of its instances' ``dependencies``, each
+    matched against the configuration address of every resource. Dependencies
+    on addresses that are not in the state are dropped.
+    """
+    addresses: list[str] = []
+    ids: dict[str, int] = {}
+    by_config: dict[str, list[int]] = {}
+    wanted: list[set[str]] = []
+    for resource in resources:
+        address = resource_graph_address(resource)
+        if address in ids:
+            continue
+        ids[address] = len(addresses)
+        by_config.setdefault(strip_instance_keys(address), []).append(len(addresses))
+        addresses.append(address)
+        depends_on: set[str] = set()
+        for instance in resource.get("instances") or ():
+            depends_on.update(strip_instance_keys(dependency) for dependency in instance.get("dependencies") or ())
+        wanted.append(depends_on)
+
+    forward: list[list[int]] = []
+    reverse: list[list[int]] = [[] for _ in addresses]
+    for node, depends_on in enumerate(wanted):
+        targets = sorted({target for address in depends_on for target in by_config.get(address, ()) if target != node})
+        forward.append(targets)
+        for target in targets:
+            reverse[target].append(node)
+
+    dependency_offsets, dependency_targets = _csr(forward)
+    dependent_offsets, dependent_targets = _csr(reverse)
+    return StateGraph(
+        addresses=tuple(addresses),
+        ids=ids,
+        dependency_offsets=dependency_offsets,
+        dependency_targets=dependency_targets,
+        dependent_offsets=dependent_offsets,
+        dependent_targets=dependent_targets,
+    )
+
+
+class StateGraphCache(SignatureCache[StateGraph]):
+    """LRU cache of state dependency graphs keyed by path, valid only for the same stat signature."""
+
+    def __init__(self, max_entries: int = DEFAULT_GRAPH_CACHE_ENTRIES) -> None:
+        super().__init__(max_entries)
+
+
+_default_graph_cache = StateGraphCache()
+
+
+def graph_cache() -> StateGraphCache:
+    """Return the graph cache of the running provider, or the process default."""
+    provider = active_provider()
+    if provider is not None:
+        return provider.state_graph_cache  # type: ignore[no-any-return]
+    return _default_graph_cache
+
+
+def read_graph(path: Path) -> StateGraph:
+    """Return the dependency graph of the state at ``path``, from the cache when the file is unchanged."""
+    cached = graph_cache().get(StateSignature.from_stat(path, path.stat()))
+    if cached is not None and os.access(path, os.R_OK):
+        return cached
+    with open_state_source(path) as source:
+        graph = build_graph(iter_resources(source))
+    graph_cache().put(StateSignature.from_stat(path, source.stat), graph)
+    return graph
@@ -0,0 +1,254 @@
+"""Persistent secondary index over the resources of large state files.
+
+An index records the byte range of every resource in a state file, grouped by
+mode, type and module. It is built as a side effect of the first streaming
+read of a state and saved in the index directory, named after the state's
+path. Later reads with filters look the candidates up and seek straight to
+them instead of scanning the whole file; on a memory-mapped state only the
+candidates' pages are touched and decoded.
+
+An index is only used while the state's ``serial``, ``lineage``, size and
+modification time all match the ones it was built from; otherwise it is
+rebuilt on the next read.
+
+Paged reads skip the resources before their offset by position: with a valid
+index those resources are never read at all.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from attrs import define, field
+from provide.foundation import logger
+
+from tofusoup.tf.components.codec import get_codec
+from tofusoup.tf.components.runtime import active_provider
+from tofusoup.tf.components.state.loader import read_span
+from tofusoup.tf.components.state.scanner import ELEMENT, StateEvent, scan_state
+from tofusoup.tf.components.state.summary import scan_header
+
+DEFAULT_INDEX_DIR_NAME = "tofusoup-state-index"
+INDEX_FORMAT = 1
+
+_ROOT_MODULE = ""
+
+
+@define
+class StateIndex:
+    """Byte ranges of a state's resources, grouped by mode, type and module."""
+
+    serial: int | None
+    lineage: str | None
+    size: int
+    mtime_ns: int
+    spans: list[tuple[int, int]] = field(factory=list)
+    modes: dict[str, list[int]] = field(factory=dict)
+    types: dict[str, list[int]] = field(factory=dict)
+    modules: dict[str, list[int]] = field(factory=dict)
+
+    def add(self, resource: dict[str, Any], start: int, end: int) -> None:
+        """Record one resource found at ``start:end``."""
+        position = len(self.spans)
+        self.spans.append((start, end))
+        self.modes.setdefault(str(resource.get("mode")), []).append(position)
+        self.types.setdefault(str(resource.get("type")), []).append(position)
+        self.modules.setdefault(str(resource.get("module") or _ROOT_MODULE), []).append(position)
+
+    def lookup(self, mode: str | None = None, type: str | None = None, module: str | None = None) -> list[int]:
+        """Return the positions of resources matching every given criterion, in file order."""
+        selected: set[int] | None = None
+        for groups, value in ((self.modes, mode), (self.types, type), (self.modules, module)):
+            if not value:
+                continue
+            positions = set(groups.get(value, ()))
+            selected = positions if selected is None else selected & positions
+        if selected is None:
+            return list(range(len(self.spans)))
+        return sorted(selected)
+
+    def matches(self, stat_result: os.stat_result, header: dict[str, Any]) -> bool:
+        """Whether the index still describes the state file with this stat and header."""
+        return (
+            self.size == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+            and self.serial == header.get("serial")
+            and self.lineage == header.get("lineage")
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": INDEX_FORMAT,
+            "serial": self.serial,
+            "lineage": self.lineage,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "spans": self.spans,
+            "modes": self.modes,
+            "types": self.types,
+            "modules": self.modules,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StateIndex:
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported state index format: {data.get('format')}")
+        return cls(
+            serial=data["serial"],
+            lineage=data["lineage"],
+            size=data["size"],
+            mtime_ns=data["mtime_ns"],
+            spans=[(start, end) for start, end in data["spans"]],
+            modes=data["modes"],
+            types=data["types"],
+            modules=data["modules"],
+        )
+
+
+class StateIndexStore:
+    """Directory of state index files, one per state path."""
+
+    def __init__(self, index_dir: str | Path) -> None:
+        self.index_dir = Path(index_dir).expanduser()
+
+    def _index_path(self, state_path: Path) -> Path:
+        digest = hashlib.sha256(str(state_path).encode("utf-8")).hexdigest()
+        return self.index_dir / f"{digest}.json"
+
+    def load(self, state_path: Path, stat_result: os.stat_result, header: dict[str, Any]) -> StateIndex | None:
+        """Return the index for this version of the state, or None if there is no valid one."""
+        path = self._index_path(state_path)
+        try:
+            with path.open("rb") as f:
+                index = StateIndex.from_dict(get_codec().load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding unreadable state index", path=str(path), error=str(e))
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+        if not index.matches(stat_result, header):
+            logger.debug("State index is stale", state_path=str(state_path), serial=header.get("serial"))
+            return None
+        return index
+
+    def save(self, state_path: Path, index: StateIndex) -> None:
+        """Write the index atomically; failures are logged and otherwise ignored."""
+        path = self._index_path(state_path)
+        data = get_codec().dumps_bytes(index.to_dict())
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write state index", path=str(path), error=str(e))
+            return
+        logger.debug("Saved state index", state_path=str(state_path), resources=len(index.spans))
+
+
+def state_index_store() -> StateIndexStore | None:
+    """Return the running provider's state index store, or None when indexing is disabled."""
+    provider = active_provider()
+    return provider.state_index if provider is not None else None
+
+
+def _matches_criteria(resource: Any, mode: str | None, type: str | None, module: str | None) -> bool:
+    """Whether ``resource`` is one ``StateIndex.lookup`` would return for these criteria."""
+    if not isinstance(resource, dict):
+        return False
+    return (
+        (not mode or str(resource.get("mode")) == mode)
+        and (not type or str(resource.get("type")) == type)
+        and (not module or str(resource.get("module") or _ROOT_MODULE) == module)
+    )
+
+
+def _index_event(index: StateIndex, event: StateEvent) -> bool:
+    """Record a resource event in ``index``; returns False if the state cannot be indexed."""
+    if event.kind == ELEMENT:
+        if not isinstance(event.value, dict):
+            return False
+        index.add(event.value, event.start, event.end)
+    elif event.key == "resources":
+        return False
+    return True
+
+
+def iter_indexed_resources(
+    store: StateIndexStore,
+    state_path: Path,
+    stream: BinaryIO,
+    stat_result: os.stat_result,
+    mode: str | None = None,
+    type: str | None = None,
+    module: str | None = None,
+    offset: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """Yield the resources that may match the criteria, using (and maintaining) the index.
+
+    With a valid index only the candidate resources are read. Otherwise every
+    resource is streamed and yielded, and the index is built on the way and
+    saved once the scan completes; closing the iterator early still finishes
+    the scan so the index is saved. Callers still apply their own filters.
+    The first ``offset`` resources matching the criteria are not yielded.
+    """
+    header = scan_header(stream)
+    stream.seek(0)
+    index = store.load(state_path, stat_result, header)
+
+    if index is not None:
+        positions = index.lookup(mode=mode, type=type, module=module)
+        logger.debug("Using state index", state_path=str(state_path), candidates=len(positions))
+        for position in positions[offset:]:
+            start, end = index.spans[position]
+            yield read_span(stream, start, end)
+        return
+
+    index = StateIndex(
+        serial=header.get("serial"),
+        lineage=header.get("lineage"),
+        size=stat_result.st_size,
+        mtime_ns=stat_result.st_mtime_ns,
+    )
+    indexable = True
+    skipped = 0
+    events = scan_state(stream, arrays={"resources"}, skip={"outputs", "check_results"})
+    try:
+        for event in events:
+            indexable = _index_event(index, event) and indexable
+            if event.kind == ELEMENT:
+                resources = [event.value]
+            elif event.key == "resources":
+                resources = event.value
+            else:
+                continue
+            for resource in resources:
+                if skipped < offset and _matches_criteria(resource, mode, type, module):
+                    skipped += 1
+                    continue
+                yield resource
+    except GeneratorExit:
+        # The caller has what it needs (one page, say); finish the scan so later reads find an index.
+        # A malformed remainder just leaves the state unindexed.
+        with contextlib.suppress(ValueError):
+            for event in events:
+                indexable = _index_event(index, event) and indexable
+            if indexable:
+                store.save(state_path, index)
+        raise
+    if indexable:
+        store.save(state_path, index)
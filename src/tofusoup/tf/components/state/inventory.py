@@ -0,0 +1,103 @@
+"""Summaries of many state files at once for ``tofusoup_state_inventory``.
+
+A directory is searched recursively for ``*.tfstate`` files, which covers
+``terraform.tfstate.d`` workspace directories; anything else is treated as a
+glob pattern (``**`` matches across directories). Every matching file is
+summarized concurrently through ``summarize_state_file``, so the worker pools
+and the summary cache apply, and one unreadable file is reported on its own
+entry instead of failing the whole inventory. Parsed documents are reused when
+another data source already cached them, but the documents parsed here are not
+added to the parsed-state cache: only their summaries are read again, and
+hundreds of workspaces would otherwise evict the states other data sources share.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from attrs import define
+
+from tofusoup.tf.components.state.summary import StateSummary, summarize_state_file
+
+DEFAULT_STATE_GLOB = "**/*.tfstate"
+
+COUNT_FIELDS = (
+    "resources_count",
+    "outputs_count",
+    "managed_resources_count",
+    "data_resources_count",
+    "modules_count",
+)
+
+
+def find_state_files(pattern: str) -> list[Path]:
+    """Expand a directory or glob pattern into the state files it matches, in path order."""
+    path = Path(pattern).expanduser()
+    if path.is_dir():
+        pattern = str(path / DEFAULT_STATE_GLOB)
+    else:
+        pattern = str(path)
+    files = {Path(match).resolve() for match in glob.iglob(pattern, recursive=True)}
+    return sorted(file for file in files if file.is_file())
+
+
+@define(frozen=True)
+class InventoryEntry:
+    """Outcome of summarizing one state file: a summary, or the error that prevented it."""
+
+    path: Path
+    summary: StateSummary | None = None
+    stat: os.stat_result | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build the ``tofusoup_state_inventory`` representation of this file."""
+        summary = self.summary or StateSummary()
+        return {
+            "state_path": str(self.path),
+            "version": summary.version,
+            "terraform_version": summary.terraform_version,
+            "serial": summary.serial,
+            "lineage": summary.lineage,
+            **{field: getattr(summary, field) for field in COUNT_FIELDS},
+            "state_file_size": self.stat.st_size if self.stat else None,
+            "state_file_modified": datetime.fromtimestamp(self.stat.st_mtime).isoformat() if self.stat else None,
+            "error": self.error,
+        }
+
+
+async def _summarize_entry(path: Path) -> InventoryEntry:
+    try:
+        summary, stat_result = await summarize_state_file(path, cache_document=False)
+    except json.JSONDecodeError as e:
+        return InventoryEntry(path=path, error=f"Invalid JSON in state file: {e}")
+    except PermissionError:
+        return InventoryEntry(path=path, error="Permission denied reading state file")
+    except Exception as e:
+        # Reported on the file's entry, so one bad file does not fail the whole inventory.
+        return InventoryEntry(path=path, error=str(e))
+    return InventoryEntry(path=path, summary=summary, stat=stat_result)
+
+
+async def summarize_state_files(paths: list[Path]) -> list[InventoryEntry]:
+    """Summarize every file concurrently, keeping the order of ``paths``."""
+    return list(await asyncio.gather(*(_summarize_entry(path) for path in paths)))
+
+
+def inventory_totals(entries: list[InventoryEntry]) -> dict[str, int]:
+    """Sum the counts and file sizes of the files that were summarized successfully."""
+    totals = dict.fromkeys(COUNT_FIELDS, 0)
+    totals["state_files_size"] = 0
+    for entry in entries:
+        if entry.summary is None:
+            continue
+        for field in COUNT_FIELDS:
+            totals[field] += getattr(entry.summary, field) or 0
+        totals["state_files_size"] += entry.stat.st_size if entry.stat else 0
+    return totals
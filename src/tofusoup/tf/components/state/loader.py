@@ -0,0 +1,390 @@
+"""Shared loading of Terraform state files for the state data sources.
+
+Parsed documents are kept in a process-wide, in-memory cache keyed by the
+file's stat signature (path, inode, size, modification time), so several data
+sources reading the same state during one plan parse it only once. A changed
+signature means the file was rewritten and the entry is ignored. The cache is
+bounded by a memory budget measured in source-file bytes; the least recently
+used documents are evicted first.
+
+``open_state_source`` decides how a data source reads a state: from the cache
+when this version of the file is already parsed, parsed whole (and cached)
+when it is small, and otherwise as a byte stream for the incremental scanner,
+so very large states are never materialized.
+
+Compressed states (gzip, bzip2 and zstd, recognized by their magic bytes
+rather than their file name) are decompressed incrementally as they are read,
+both when parsed whole and when streamed; nothing is written to disk. Their
+decompressed size is estimated from the compressed size to choose between the
+two, and they are never read through the state index, which seeks.
+
+Uncompressed states in directories registered with ``map_files_in`` are
+memory-mapped rather than read into buffers. The map serves as the byte stream
+for the scanner, and whole-document parses and index lookups decode straight
+from the mapped pages, so a resource is copied out of the page cache only when
+it is actually decoded. Only files that are replaced whole, never rewritten in
+place, may be mapped: reading a map whose file was truncated underneath it
+kills the process with SIGBUS instead of raising an error, and Terraform's
+local backend truncates and rewrites ``terraform.tfstate``. So working state
+files are always read through buffers, as are files that cannot be mapped
+(empty files, pipes, some network file systems).
+
+Cached documents are shared between callers and must be treated as read-only.
+``SignatureCache`` applies the same stat-signature validation to smaller values
+derived from a state, such as its summary or dependency graph.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import importlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Generic, TypeVar
+
+from attrs import define
+from provide.foundation import logger
+from pyvider.exceptions import DataSourceError  # type: ignore
+
+from tofusoup.tf.components.codec import get_codec
+from tofusoup.tf.components.runtime import active_provider
+
+if TYPE_CHECKING:
+    from tofusoup.tf.components.state.remote import RemoteState
+
+DEFAULT_STATE_CACHE_MAX_MB = 512
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+# State JSON usually compresses 10-20x; assume the low end when sizing compressed files.
+COMPRESSION_RATIO_ESTIMATE = 10
+
+GZIP = "gzip"
+BZIP2 = "bzip2"
+ZSTD = "zstd"
+_MAGIC_BYTES = ((GZIP, b"\x1f\x8b"), (BZIP2, b"BZh"), (ZSTD, b"\x28\xb5\x2f\xfd"))
+
+T = TypeVar("T")
+
+
+def resolve_state_path(state_path: str) -> Path:
+    """Resolve a configured ``state_path`` (``~`` and relative paths) to an existing file."""
+    path = Path(state_path).expanduser().resolve()
+    if not path.exists():
+        raise DataSourceError(f"State file not found: {state_path}")
+    if not path.is_file():
+        raise DataSourceError(f"Path is not a file: {state_path}")
+    return path
+
+
+@define(frozen=True)
+class StateSignature:
+    """Identity of one version of a state file on disk."""
+
+    path: str
+    inode: int
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def from_stat(cls, path: Path, stat_result: os.stat_result) -> StateSignature:
+        return cls(
+            path=str(path),
+            inode=stat_result.st_ino,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+        )
+
+
+@define
+class ParsedStateCacheStats:
+    """Counters describing how often parsed states were reused."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ParsedStateCache:
+    """Memory-bounded LRU cache of parsed state documents keyed by path."""
+
+    def __init__(self, max_size_bytes: int) -> None:
+        self.max_size_bytes = max_size_bytes
+        self.stats = ParsedStateCacheStats()
+        self._entries: OrderedDict[str, tuple[StateSignature, Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size charged for the cached documents (their decompressed source size)."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, signature: StateSignature) -> Any | None:
+        """Return the document parsed from exactly this version of the file, if cached."""
+        with self._lock:
+            entry = self._entries.get(signature.path)
+            if entry is None or entry[0] != signature:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(signature.path)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, signature: StateSignature, document: Any, size: int | None = None) -> None:
+        """Cache a parsed document, evicting least recently used ones to stay within budget.
+
+        The document is charged ``size`` bytes, by default the size of the file;
+        compressed files pass their decompressed size.
+        """
+        size = signature.size if size is None else size
+        if size > self.max_size_bytes:
+            logger.debug("State file larger than parsed-state cache budget", path=signature.path, size=size)
+            return
+        with self._lock:
+            previous = self._entries.pop(signature.path, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[signature.path] = (signature, document, size)
+            self._size += size
+            while self._size > self.max_size_bytes:
+                _, (evicted, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.stats.evictions += 1
+                logger.debug("Evicted parsed state", path=evicted.path, size=evicted_size)
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class SignatureCache(Generic[T]):
+    """LRU cache of values derived from state files, keyed by path, valid only for the same stat signature."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.stats = ParsedStateCacheStats()
+        self._entries: OrderedDict[str, tuple[StateSignature, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, signature: StateSignature) -> T | None:
+        """Return the value derived from exactly this version of the file, if cached."""
+        with self._lock:
+            entry = self._entries.get(signature.path)
+            if entry is None or entry[0] != signature:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(signature.path)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, signature: StateSignature, value: T) -> None:
+        """Cache a value, evicting the least recently used ones beyond ``max_entries``."""
+        with self._lock:
+            self._entries.pop(signature.path, None)
+            self._entries[signature.path] = (signature, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+
+_default_cache = ParsedStateCache(DEFAULT_STATE_CACHE_MAX_MB * 1024 * 1024)
+
+
+def state_cache() -> ParsedStateCache:
+    """Return the parsed-state cache of the running provider, or the process default."""
+    provider = active_provider()
+    if provider is not None:
+        return provider.state_cache  # type: ignore[no-any-return]
+    return _default_cache
+
+
+def detect_compression(head: bytes) -> str | None:
+    """Return the compression format whose magic bytes start ``head``, or None for plain files."""
+    for name, magic in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def decompressing(f: BinaryIO, compression: str) -> BinaryIO:
+    """Wrap ``f`` in a reader that decompresses ``compression`` as it is read."""
+    if compression == GZIP:
+        return gzip.GzipFile(fileobj=f, mode="rb")  # type: ignore[return-value]
+    if compression == BZIP2:
+        return bz2.BZ2File(f)  # type: ignore[return-value]
+    try:
+        zstandard = importlib.import_module("zstandard")
+    except ImportError as e:
+        raise DataSourceError(
+            "Reading zstd-compressed state files requires the 'zstandard' package (install the 'zstd' extra)."
+        ) from e
+    return zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)  # type: ignore[no-any-return]
+
+
+def expected_size(stat_result: os.stat_result, compression: str | None) -> int:
+    """Estimated size of the state document, in bytes, once decompressed."""
+    if compression is None:
+        return stat_result.st_size
+    return stat_result.st_size * COMPRESSION_RATIO_ESTIMATE
+
+
+_replaced_dirs: set[str] = set()
+
+
+def map_files_in(directory: Path) -> None:
+    """Memory-map the uncompressed states directly in ``directory`` from now on.
+
+    Every file there must only ever be replaced whole (written under another
+    name and renamed into place), never truncated or rewritten in place.
+    """
+    _replaced_dirs.add(os.path.abspath(directory))
+
+
+def _mappable(path: Path) -> bool:
+    return bool(_replaced_dirs) and os.path.dirname(os.path.abspath(path)) in _replaced_dirs
+
+
+def _map_file(f: BinaryIO) -> mmap.mmap | None:
+    """Map an open file read-only, or return None if it cannot be mapped."""
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty files cannot be mapped, nor can pipes and some special files.
+        return None
+
+
+def read_span(stream: BinaryIO, start: int, end: int) -> Any:
+    """Decode the JSON value at bytes ``start:end`` of a state stream.
+
+    On a memory-mapped state the value is decoded from the mapped pages
+    without seeking; other streams are seeked and read.
+    """
+    codec = get_codec()
+    if isinstance(stream, mmap.mmap):
+        with memoryview(stream) as view, view[start:end] as span:
+            return codec.loads(span)
+    stream.seek(start)
+    return codec.loads(stream.read(end - start))
+
+
+@contextmanager
+def open_state_stream(path: Path) -> Iterator[tuple[BinaryIO, os.stat_result, str | None]]:
+    """Open a state file for reading as (decompressed) bytes, with the stat of the file and its compression.
+
+    Uncompressed files in a directory registered with ``map_files_in`` are
+    memory-mapped when possible; the map is file-like (``read``, ``seek`` and
+    ``tell``) and closed on exit.
+    """
+    with path.open("rb") as f:
+        stat_result = os.fstat(f.fileno())
+        compression = detect_compression(f.peek(4)[:4])
+        if compression is None:
+            mapped = _map_file(f) if _mappable(path) else None
+            if mapped is None:
+                yield f, stat_result, None
+                return
+            with mapped:
+                yield mapped, stat_result, None  # type: ignore[misc]
+            return
+        with decompressing(f, compression) as stream:
+            yield stream, stat_result, compression
+
+
+@contextmanager
+def open_state(path: Path) -> Iterator[tuple[BinaryIO, os.stat_result]]:
+    """Open a state file for reading as bytes, together with the stat of the opened file.
+
+    Compressed files are decompressed as they are read.
+    """
+    with open_state_stream(path) as (f, stat_result, _):
+        yield f, stat_result
+
+
+def cached_state(path: Path) -> tuple[Any | None, os.stat_result]:
+    """Return the cached parsed document for the current version of ``path`` (or None) and its stat."""
+    stat_result = path.stat()
+    document = state_cache().get(StateSignature.from_stat(path, stat_result))
+    if document is not None and not os.access(path, os.R_OK):
+        # Do not serve a cached copy of a file the process can no longer read.
+        return None, stat_result
+    return document, stat_result
+
+
+def load_state(path: Path) -> tuple[Any, os.stat_result]:
+    """Return the parsed state document at ``path`` and the stat it was read with.
+
+    Raises ``json.JSONDecodeError`` for malformed files and ``OSError`` (including
+    ``PermissionError``) when the file cannot be read.
+    """
+    document, stat_result = cached_state(path)
+    if document is not None:
+        logger.debug("Reusing parsed state", path=str(path))
+        return document, stat_result
+    return _parse_state(path)
+
+
+def _parse_state(path: Path) -> tuple[Any, os.stat_result]:
+    with open_state(path) as (f, stat_result):
+        return _parse_stream(path, f, stat_result), stat_result
+
+
+def _parse_stream(path: Path, f: BinaryIO, stat_result: os.stat_result) -> Any:
+    document = get_codec().load(f)
+    # The signature comes from the open file so it describes the bytes actually parsed;
+    # the position after reading is the decompressed size.
+    state_cache().put(StateSignature.from_stat(path, stat_result), document, size=f.tell())
+    return document
+
+
+@define(frozen=True)
+class StateSource:
+    """An opened state: either a parsed ``document`` or a ``stream`` to scan, plus the file's stat.
+
+    ``compression`` names the format a streamed file is decompressed from; such
+    a stream cannot seek cheaply. The stream of an uncompressed file may be an
+    ``mmap.mmap``. A ``RemoteState`` path means the stream reads a remote
+    object with ranged requests.
+    """
+
+    path: Path | RemoteState
+    stat: os.stat_result
+    document: Any | None = None
+    stream: BinaryIO | None = None
+    compression: str | None = None
+
+
+@contextmanager
+def open_state_source(path: Path) -> Iterator[StateSource]:
+    """Open a state for reading, parsing it whole only when that is cheap or already done."""
+    document, stat_result = cached_state(path)
+    if document is not None:
+        logger.debug("Reusing parsed state", path=str(path))
+        yield StateSource(path=path, stat=stat_result, document=document)
+        return
+    with open_state_stream(path) as (f, stat_result, compression):
+        if expected_size(stat_result, compression) <= STREAMING_THRESHOLD_BYTES:
+            document = _parse_stream(path, f, stat_result)
+            yield StateSource(path=path, stat=stat_result, document=document)
+        else:
+            logger.debug(
+                "Streaming large state file", path=str(path), size=stat_result.st_size, compression=compression
+            )
+            yield StateSource(path=path, stat=stat_result, stream=f, compression=compression)
@@ -0,0 +1,241 @@
+"""Filtered iteration over the outputs of a Terraform state file.
+
+Terraform writes ``outputs`` ahead of the (usually much larger) ``resources``
+array, so a streamed state is only read until the ``outputs`` object closes,
+or until every requested output name has been found. Reading outputs from a
+huge state therefore costs about as much as the outputs themselves. Remote
+states are read the same way, with ranged requests, so only the bytes up to the
+end of the outputs are downloaded.
+
+Output filters combine exact names with glob patterns (``vpc_*``); the patterns
+are compiled into one regular expression, so every output is matched in a
+single pass whatever the number of filters.
+
+Values are encoded lazily: with a size limit, encoding stops as soon as the
+limit is passed, so an oversized value is never serialized in full and is
+reported as truncated instead. A value path (``cluster.endpoint``,
+``nodes[0].ip``) selects a subtree of each value before anything is encoded,
+and the output's type is narrowed along the same path.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from attrs import Factory, define, field
+from provide.foundation import logger
+
+from tofusoup.tf.components.codec import JsonCodec, get_codec
+from tofusoup.tf.components.state.loader import StateSource, open_state_source
+from tofusoup.tf.components.state.paths import ValuePath, select_value
+from tofusoup.tf.components.state.remote import RemoteState, open_remote_state_source
+from tofusoup.tf.components.state.scanner import MEMBER, scan_state
+
+_GLOB_CHARS = frozenset("*?[")
+_ENCODER = json.JSONEncoder()
+
+
+def _compile_patterns(output_filter: OutputFilter) -> re.Pattern[str] | None:
+    if not output_filter.patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in output_filter.patterns))
+
+
+@define(frozen=True)
+class OutputFilter:
+    """Filter on output names by exact name or glob pattern; an empty filter matches every output."""
+
+    names: frozenset[str] = frozenset()
+    patterns: tuple[str, ...] = ()
+    _regex: re.Pattern[str] | None = field(
+        init=False, eq=False, repr=False, default=Factory(_compile_patterns, takes_self=True)
+    )
+
+    @classmethod
+    def from_names(cls, items: Iterable[str | None]) -> OutputFilter:
+        """Build a filter from names and glob patterns, telling them apart by glob characters."""
+        names = set()
+        patterns = []
+        for item in items:
+            if not item:
+                continue
+            if _GLOB_CHARS.intersection(item):
+                patterns.append(item)
+            else:
+                names.add(item)
+        return cls(names=frozenset(names), patterns=tuple(dict.fromkeys(patterns)))
+
+    @property
+    def active(self) -> bool:
+        """Whether any filter is set."""
+        return bool(self.names or self.patterns)
+
+    def matches(self, name: str) -> bool:
+        if not self.active or name in self.names:
+            return True
+        return self._regex is not None and self._regex.match(name) is not None
+
+    def complete(self, found: int) -> bool:
+        """Whether ``found`` matches already account for every requested output.
+
+        Never true with glob patterns, which may match any number of outputs.
+        """
+        return bool(self.names) and not self.patterns and found >= len(self.names)
+
+
+def iter_outputs(source: StateSource, output_filter: OutputFilter | None = None) -> Iterator[tuple[str, Any]]:
+    """Yield ``(name, output)`` for the outputs matching ``output_filter``, in state order.
+
+    Streamed states are read no further than needed: up to the end of the
+    ``outputs`` object, or up to the last requested output.
+    """
+    output_filter = output_filter or OutputFilter()
+    found = 0
+
+    if source.document is not None:
+        for name, output in (source.document.get("outputs") or {}).items():
+            if output_filter.matches(name):
+                yield name, output
+                found += 1
+                if output_filter.complete(found):
+                    return
+        return
+
+    events = scan_state(
+        source.stream,  # type: ignore[arg-type]
+        objects={"outputs"},
+        skip={"resources", "check_results"},
+        stop_after={"outputs"},
+    )
+    try:
+        for event in events:
+            if event.kind != MEMBER or not output_filter.matches(event.name):  # type: ignore[arg-type]
+                continue
+            yield event.name, event.value  # type: ignore[misc]
+            found += 1
+            if output_filter.complete(found):
+                return
+    finally:
+        events.close()
+
+
+def select_type(type_expr: Any, steps: ValuePath) -> Any:
+    """Narrow a Terraform type expression along ``steps``; unknown structure becomes ``dynamic``."""
+    for step in steps:
+        if not isinstance(type_expr, list) or len(type_expr) != 2:
+            return "dynamic"
+        kind, inner = type_expr
+        if kind == "object" and isinstance(inner, dict) and isinstance(step, str):
+            type_expr = inner.get(step, "dynamic")
+        elif (kind == "map" and isinstance(step, str)) or (kind in ("list", "set") and str(step).lstrip("-").isdigit()):
+            type_expr = inner
+        elif kind == "tuple" and isinstance(inner, list):
+            try:
+                type_expr = inner[int(step)]
+            except (ValueError, IndexError):
+                return "dynamic"
+        else:
+            return "dynamic"
+    return type_expr
+
+
+def encode_bounded(value: Any, max_bytes: int) -> str | None:
+    """Encode ``value`` exactly as ``json.dumps`` does, or return None if that exceeds ``max_bytes``.
+
+    Encoding stops as soon as the limit is passed.
+    """
+    if isinstance(value, str) and len(value) + 2 > max_bytes:
+        return None
+    chunks = []
+    size = 0
+    # The default encoder escapes non-ASCII, so characters and bytes coincide.
+    for chunk in _ENCODER.iterencode(value):
+        size += len(chunk)
+        if size > max_bytes:
+            return None
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+def output_entry(
+    name: str,
+    output_info: dict[str, Any],
+    codec: JsonCodec,
+    values: bool = True,
+    max_value_bytes: int | None = None,
+    value_path: ValuePath = (),
+) -> dict[str, Any]:
+    """Build the ``tofusoup_state_outputs`` representation of one state output.
+
+    With ``values`` false the value is left null; with ``max_value_bytes`` a value
+    whose encoding is larger is left null and flagged as truncated. With a
+    ``value_path`` only the selected subtree (and its type) is returned; the
+    value is null when the path does not exist.
+    """
+    # Handle both Terraform state formats
+    value = output_info.get("value")
+    output_type = output_info.get("type", "unknown")
+    sensitive = output_info.get("sensitive", False)
+
+    found = True
+    if value_path:
+        found, value = select_value(value, value_path)
+        output_type = select_type(output_type, value_path)
+
+    # Convert value to JSON string for consistent handling
+    value_str: str | None
+    value_truncated = False
+    if not values or not found:
+        value_str = None
+    elif value is None:
+        value_str = "null"
+    elif max_value_bytes is None:
+        value_str = codec.dumps(value)
+    else:
+        value_str = encode_bounded(value, max_value_bytes)
+        value_truncated = value_str is None
+
+    # Convert type to string representation
+    # Type can be a string ("string", "number") or array (["list", "string"])
+    if isinstance(output_type, list):
+        type_str = codec.dumps(output_type)
+    else:
+        type_str = str(output_type)
+
+    return {
+        "name": name,
+        "value": value_str,
+        "value_truncated": value_truncated,
+        "type": type_str,
+        "sensitive": bool(sensitive),
+    }
+
+
+def read_outputs(
+    path: Path | RemoteState,
+    output_filter: OutputFilter | None = None,
+    values: bool = True,
+    max_value_bytes: int | None = None,
+    value_path: ValuePath = (),
+) -> list[dict[str, Any]]:
+    """Return the output entries of the state at ``path`` that match ``output_filter``; see ``output_entry``."""
+    codec = get_codec()
+    opened = open_remote_state_source(path) if isinstance(path, RemoteState) else open_state_source(path)
+    with opened as source:
+        entries = [
+            output_entry(name, output, codec, values=values, max_value_bytes=max_value_bytes, value_path=value_path)
+            for name, output in iter_outputs(source, output_filter)
+        ]
+    if output_filter is not None and output_filter.active:
+        logger.debug(
+            "Filtered outputs by name",
+            names=sorted(output_filter.names),
+            patterns=list(output_filter.patterns),
+            matched=len(entries),
+        )
+    return entries
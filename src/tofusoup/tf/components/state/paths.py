@@ -0,0 +1,65 @@
+"""Paths into nested state values, shared by output and resource attribute projections.
+
+A path is written with dotted keys, ``[n]`` list indexes and quoted keys for
+names containing dots (``endpoint.hostname``, ``nodes[0].ip``,
+``tags["kubernetes.io/role"]``). It is parsed once into steps and then applied to
+each value.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_PATH_STEP = re.compile(r"""\.?([^.\[\]"']+)|\[(-?\d+)\]|\[("(?:[^"\\]|\\.)*"|'[^']*')\]""")
+
+ValuePath = tuple[str | int, ...]
+
+
+def parse_value_path(path: str) -> ValuePath:
+    """Parse ``cluster.endpoint``, ``nodes[0].ip`` or ``tags["kubernetes.io/role"]`` into steps.
+
+    A leading ``$`` (as in JSONPath) is accepted. Raises ValueError on malformed paths.
+    """
+    text = path.strip()
+    if text.startswith("$"):
+        text = text[1:].lstrip(".") if text[1:2] == "." else text[1:]
+    steps: list[str | int] = []
+    pos = 0
+    while pos < len(text):
+        match = _PATH_STEP.match(text, pos)
+        # Keys are separated by dots: none before the first step, one before every later key.
+        if match is None or (match.group(1) is not None and (text[pos] == ".") == (pos == 0)):
+            raise ValueError(f"Invalid value path {path!r} at position {pos}")
+        key, index, quoted = match.groups()
+        if key is not None:
+            steps.append(key)
+        elif index is not None:
+            steps.append(int(index))
+        else:
+            steps.append(json.loads(quoted) if quoted.startswith('"') else quoted[1:-1])
+        pos = match.end()
+    if not steps:
+        raise ValueError(f"Invalid value path {path!r}: no steps")
+    return tuple(steps)
+
+
+def select_value(value: Any, steps: ValuePath) -> tuple[bool, Any]:
+    """Follow ``steps`` into ``value``; returns ``(found, subtree)``.
+
+    Numeric keys also index lists, so ``nodes.0`` and ``nodes[0]`` are equivalent.
+    """
+    for step in steps:
+        if isinstance(value, dict) and isinstance(step, str):
+            if step not in value:
+                return False, None
+            value = value[step]
+        elif isinstance(value, list) and (isinstance(step, int) or step.lstrip("-").isdigit()):
+            index = int(step)
+            if not -len(value) <= index < len(value):
+                return False, None
+            value = value[index]
+        else:
+            return False, None
+    return True, value
@@ -0,0 +1,471 @@
+"""Reading Terraform state files from S3-compatible object storage and HTTP(S).
+
+A ``state_path`` may be an ``s3://bucket/key`` location or an ``http(s)://``
+URL instead of a local path. Remote states are read through one long-lived,
+connection-pooled ``httpx.Client`` per provider, in one of two ways:
+
+- Reads that need the whole state (resources, summaries, graphs, diffs) fetch
+  the object into a local copy, one per location. Each fetch sends the ETag of
+  the copy in ``If-None-Match``; an unchanged object is answered with ``304 Not
+  Modified`` and the copy is reused untouched, so its parsed document, summary,
+  graph and index in the other caches stay valid as well.
+- Reads that only need the beginning of a state (the header and the outputs,
+  which Terraform writes before the resources) use ranged GETs. A
+  ``RangedReader`` requests bytes as the scanner consumes them, in ranges that
+  double in size, and stops when the scanner does. Later ranges carry
+  ``If-Match`` so an object rewritten in the middle of a read is reported
+  instead of read torn. Servers that ignore ``Range`` are read as one plain
+  stream, closed as soon as the scanner is done.
+
+``s3://`` locations go to ``state_s3_endpoint`` in path style when it is set
+(MinIO and other S3-compatible stores) and to the regional AWS endpoint
+otherwise. Requests are signed with AWS Signature Version 4 when the usual
+``AWS_ACCESS_KEY_ID`` and ``AWS_SECRET_ACCESS_KEY`` (and optionally
+``AWS_SESSION_TOKEN``) environment variables are set, and sent unsigned, for
+public buckets, otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+import os
+import re
+import stat
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import parse_qsl, quote, urlsplit
+
+import httpx
+from attrs import define
+from provide.foundation import logger
+from pyvider.exceptions import DataSourceError  # type: ignore
+
+from tofusoup.tf.components.runtime import active_provider
+from tofusoup.tf.components.state.loader import (
+    StateSource,
+    decompressing,
+    detect_compression,
+    map_files_in,
+    resolve_state_path,
+)
+from tofusoup.tf.components.state.workers import run_in_state_pool
+
+REMOTE_SCHEMES = ("s3://", "http://", "https://")
+DEFAULT_REMOTE_DIR_NAME = "tofusoup-remote-state"
+DEFAULT_S3_REGION = "us-east-1"
+DEFAULT_REMOTE_MAX_CONNECTIONS = 10
+DEFAULT_REMOTE_TIMEOUT_SECONDS = 30.0
+INITIAL_RANGE_BYTES = 64 * 1024
+MAX_RANGE_BYTES = 8 * 1024 * 1024
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_CONTENT_RANGE = re.compile(r"bytes \d+-\d+/(\d+)")
+
+
+def is_remote_location(state_path: str) -> bool:
+    """Whether ``state_path`` names a remote state rather than a local file."""
+    return state_path.startswith(REMOTE_SCHEMES)
+
+
+@define(frozen=True)
+class RemoteState:
+    """A state object in remote storage: the configured location and the URL it is read from."""
+
+    location: str
+    url: str
+    s3: bool = False
+
+
+@define(frozen=True)
+class AwsCredentials:
+    """Credentials used to sign S3 requests."""
+
+    access_key: str
+    secret_key: str
+    session_token: str | None = None
+
+    @classmethod
+    def from_env(cls) -> AwsCredentials | None:
+        """Read the standard AWS environment variables; None when no key pair is set."""
+        access_key = os.environ.get("AWS_ACCESS_KEY_ID")
+        secret_key = os.environ.get("AWS_SECRET_ACCESS_KEY")
+        if not access_key or not secret_key:
+            return None
+        return cls(access_key=access_key, secret_key=secret_key, session_token=os.environ.get("AWS_SESSION_TOKEN"))
+
+
+def _uri_encode(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def sign_s3_request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    credentials: AwsCredentials,
+    region: str,
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """Return ``headers`` with the AWS Signature Version 4 headers of an S3 request added.
+
+    Every header given is signed, along with ``host``. The payload is declared
+    unsigned unless ``headers`` sets ``x-amz-content-sha256``.
+    """
+    parts = urlsplit(url)
+    amz_date = (now or datetime.now(UTC)).strftime("%Y%m%dT%H%M%SZ")
+    signed = {name.lower(): value.strip() for name, value in headers.items()}
+    signed.setdefault("x-amz-content-sha256", UNSIGNED_PAYLOAD)
+    signed["host"] = parts.netloc
+    signed["x-amz-date"] = amz_date
+    if credentials.session_token:
+        signed["x-amz-security-token"] = credentials.session_token
+
+    names = sorted(signed)
+    query = "&".join(
+        sorted(f"{_uri_encode(k)}={_uri_encode(v)}" for k, v in parse_qsl(parts.query, keep_blank_values=True))
+    )
+    canonical_request = "\n".join(
+        [
+            method,
+            parts.path or "/",
+            query,
+            "".join(f"{name}:{signed[name]}\n" for name in names),
+            ";".join(names),
+            signed["x-amz-content-sha256"],
+        ]
+    )
+    scope = f"{amz_date[:8]}/{region}/s3/aws4_request"
+    string_to_sign = "\n".join(
+        ["AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()]
+    )
+    key = f"AWS4{credentials.secret_key}".encode()
+    for part in (amz_date[:8], region, "s3", "aws4_request"):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+    result = dict(headers)
+    result.update({name: signed[name] for name in names if name.startswith("x-amz-")})
+    result["Authorization"] = (
+        f"AWS4-HMAC-SHA256 Credential={credentials.access_key}/{scope}, "
+        f"SignedHeaders={';'.join(names)}, Signature={signature}"
+    )
+    return result
+
+
+def _last_modified(response: httpx.Response) -> float | None:
+    """The ``Last-Modified`` time of a response as a timestamp, if it has a valid one."""
+    value = response.headers.get("Last-Modified")
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _remote_stat(size: int, mtime: float | None) -> os.stat_result:
+    """A stat result describing a remote object, for callers that report size and modification time."""
+    mtime = mtime or 0.0
+    return os.stat_result((stat.S_IFREG | 0o444, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
+
+def _raise_for_status(response: httpx.Response, remote: RemoteState) -> None:
+    """Raise a ``DataSourceError`` for an unsuccessful response, closing it."""
+    if response.is_success:
+        return
+    response.close()
+    status = response.status_code
+    if status == 404:
+        raise DataSourceError(f"State file not found: {remote.location}")
+    if status in (401, 403):
+        raise DataSourceError(f"Permission denied reading state file: {remote.location}")
+    if status == 412:
+        raise DataSourceError(f"State file changed while it was being read: {remote.location}")
+    raise DataSourceError(f"Failed to fetch state file '{remote.location}': HTTP {status}")
+
+
+class RemoteStateClient:
+    """Connection-pooled reads of remote state objects, with an ETag-validated local copy per object."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        s3_endpoint: str | None = None,
+        s3_region: str | None = None,
+        max_connections: int = DEFAULT_REMOTE_MAX_CONNECTIONS,
+        credentials: AwsCredentials | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        # Copies are only ever replaced with os.replace, so they are safe to memory-map.
+        map_files_in(self.cache_dir)
+        self.s3_endpoint = s3_endpoint.rstrip("/") if s3_endpoint else None
+        self.s3_region = (
+            s3_region or os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or DEFAULT_S3_REGION
+        )
+        self._credentials = credentials
+        self._client = httpx.Client(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=DEFAULT_REMOTE_TIMEOUT_SECONDS,
+            transport=transport,
+        )
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def resolve(self, location: str) -> RemoteState:
+        """Return the ``RemoteState`` for an ``s3://`` or ``http(s)://`` location."""
+        if not location.startswith("s3://"):
+            return RemoteState(location=location, url=location)
+        bucket, _, key = location[len("s3://") :].partition("/")
+        if not bucket or not key:
+            raise DataSourceError(f"Invalid S3 location (expected s3://bucket/key): {location}")
+        path = quote(key, safe="/-_.~")
+        if self.s3_endpoint:
+            url = f"{self.s3_endpoint}/{bucket}/{path}"
+        else:
+            url = f"https://{bucket}.s3.{self.s3_region}.amazonaws.com/{path}"
+        return RemoteState(location=location, url=url, s3=True)
+
+    def get(self, remote: RemoteState, headers: dict[str, str]) -> httpx.Response:
+        """Send a GET for ``remote``, signed when needed, and return the response with its body not yet read."""
+        if remote.s3:
+            credentials = self._credentials or AwsCredentials.from_env()
+            if credentials is not None:
+                headers = sign_s3_request("GET", remote.url, headers, credentials, self.s3_region)
+        request = self._client.build_request("GET", remote.url, headers=headers)
+        return self._client.send(request, stream=True)
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def local_copy(self, remote: RemoteState) -> Path:
+        """Path of the local copy of ``remote`` (which may not exist yet)."""
+        return self.cache_dir / f"{hashlib.sha256(remote.url.encode()).hexdigest()[:32]}.tfstate"
+
+    def fetch(self, remote: RemoteState) -> Path:
+        """Bring the local copy of ``remote`` up to date and return its path.
+
+        The copy is only rewritten when the object's ETag changed; otherwise the
+        server answers ``304 Not Modified`` without sending the body.
+        """
+        target = self.local_copy(remote)
+        etag_path = target.with_suffix(".etag")
+        with self._lock(str(target)):
+            headers = {}
+            if target.exists() and etag_path.exists():
+                headers["If-None-Match"] = etag_path.read_text()
+            response = self.get(remote, headers)
+            try:
+                if response.status_code == 304:
+                    logger.debug("Remote state unchanged", location=remote.location, etag=headers["If-None-Match"])
+                    return target
+                _raise_for_status(response, remote)
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        for chunk in response.iter_bytes():
+                            f.write(chunk)
+                    mtime = _last_modified(response)
+                    if mtime is not None:
+                        # The copy reports the object's modification time, not the download time.
+                        os.utime(tmp_name, (mtime, mtime))
+                    os.replace(tmp_name, target)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+            finally:
+                response.close()
+            etag = response.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+        logger.debug("Fetched remote state", location=remote.location, size=target.stat().st_size, etag=etag)
+        return target
+
+    @contextmanager
+    def open_stream(self, remote: RemoteState) -> Iterator[tuple[BinaryIO, os.stat_result, str | None]]:
+        """Open ``remote`` for reading from the start with ranged GETs, like ``open_state_stream``."""
+        with RangedReader(self, remote) as f:
+            stat_result = f.stat
+            compression = detect_compression(f.peek()[:4])
+            if compression is None:
+                yield f, stat_result, None  # type: ignore[misc]
+                return
+            with decompressing(f, compression) as stream:  # type: ignore[arg-type]
+                yield stream, stat_result, compression
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+
+
+class RangedReader(io.RawIOBase):
+    """Seekable, read-only view of a remote object that fetches byte ranges as they are read.
+
+    The first range is requested on construction, which also reads the object's
+    size, ETag and modification time. Each further range is twice as large as
+    the one before, up to ``MAX_RANGE_BYTES``. A read returns at most what is
+    left of the current range, so a reader asking for a large chunk only causes
+    the next range to be requested, not the whole chunk.
+    """
+
+    def __init__(self, client: RemoteStateClient, remote: RemoteState) -> None:
+        super().__init__()
+        self._client = client
+        self._remote = remote
+        self._range_size = INITIAL_RANGE_BYTES
+        self._buffer = b""
+        self._buffer_start = 0
+        self._pos = 0
+        self._etag: str | None = None
+        self._response: httpx.Response | None = None
+        self._chunks: Iterator[bytes] | None = None
+        self.size: int | None = None
+        self._stat = _remote_stat(0, None)
+        self._fetch(0)
+
+    @property
+    def stat(self) -> os.stat_result:
+        return self._stat
+
+    def _fetch(self, start: int) -> None:
+        headers = {"Range": f"bytes={start}-{start + self._range_size - 1}", "Accept-Encoding": "identity"}
+        if self._etag and not self._etag.startswith("W/"):
+            headers["If-Match"] = self._etag
+        response = self._client.get(self._remote, headers)
+        self._range_size = min(self._range_size * 2, MAX_RANGE_BYTES)
+
+        if response.status_code == 416 and start == 0:
+            # An empty object has no first byte to return.
+            response.close()
+            self.size = 0
+            self._stat = _remote_stat(0, _last_modified(response))
+            return
+        _raise_for_status(response, self._remote)
+
+        if response.status_code == 206:
+            try:
+                self._buffer = response.read()
+            finally:
+                response.close()
+            self._buffer_start = start
+            match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+            if match:
+                self.size = int(match.group(1))
+        elif start == 0:
+            # The server ignored the range; read the body as one stream instead.
+            logger.debug("Remote state server ignores ranges, streaming", location=self._remote.location)
+            self._response = response
+            self._chunks = response.iter_bytes()
+            self._buffer = next(self._chunks, b"")
+            self._buffer_start = 0
+            length = response.headers.get("Content-Length")
+            self.size = int(length) if length is not None else None
+        else:
+            response.close()
+            raise DataSourceError(f"Server stopped honouring ranged reads of state file: {self._remote.location}")
+
+        if start == 0:
+            self._etag = response.headers.get("ETag")
+            self._stat = _remote_stat(self.size or 0, _last_modified(response))
+
+    def peek(self) -> bytes:
+        """Return the bytes already fetched from the current position on, without consuming them."""
+        offset = self._pos - self._buffer_start
+        return self._buffer[offset:] if offset >= 0 else b""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._chunks is None
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self._chunks is not None:
+            raise io.UnsupportedOperation("seek")
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size or 0
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer: memoryview) -> int:  # type: ignore[override]
+        offset = self._pos - self._buffer_start
+        if not 0 <= offset < len(self._buffer):
+            if self._chunks is not None:
+                self._buffer = next(self._chunks, b"")
+                self._buffer_start = self._pos
+            elif self.size is not None and self._pos >= self.size:
+                return 0
+            else:
+                self._fetch(self._pos)
+            offset = self._pos - self._buffer_start
+            if not 0 <= offset < len(self._buffer):
+                return 0
+        count = min(len(buffer), len(self._buffer) - offset)
+        buffer[:count] = self._buffer[offset : offset + count]
+        self._pos += count
+        return count
+
+    def close(self) -> None:
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+        super().close()
+
+
+_default_client: RemoteStateClient | None = None
+_default_client_lock = threading.Lock()
+
+
+def remote_state_client() -> RemoteStateClient:
+    """Return the remote state client of the running provider, or a process default."""
+    global _default_client
+    provider = active_provider()
+    if provider is not None:
+        return provider.remote_state_client  # type: ignore[no-any-return]
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = RemoteStateClient(Path(tempfile.gettempdir()) / DEFAULT_REMOTE_DIR_NAME)
+        return _default_client
+
+
+async def resolve_state(state_path: str) -> Path:
+    """Resolve a configured ``state_path`` to a local file, fetching remote states into their local copy."""
+    if not is_remote_location(state_path):
+        return resolve_state_path(state_path)
+    client = remote_state_client()
+    return await run_in_state_pool(client.fetch, client.resolve(state_path))
+
+
+def resolve_state_prefix(state_path: str) -> Path | RemoteState:
+    """Resolve ``state_path`` for reads of its header or outputs only.
+
+    Remote states are not fetched: they are read with ranged GETs up to where
+    the reader stops.
+    """
+    if not is_remote_location(state_path):
+        return resolve_state_path(state_path)
+    return remote_state_client().resolve(state_path)
+
+
+@contextmanager
+def open_remote_state_source(remote: RemoteState) -> Iterator[StateSource]:
+    """Open a remote state as a ranged stream for the scanner."""
+    with remote_state_client().open_stream(remote) as (stream, stat_result, compression):
+        yield StateSource(path=remote, stat=stat_result, stream=stream, compression=compression)
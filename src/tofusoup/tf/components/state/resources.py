@@ -0,0 +1,277 @@
+"""Filtered iteration over the resources of a Terraform state file.
+
+Resources come one at a time from a ``StateSource``, either from the parsed
+document or straight from the scanner, and every filter is applied to each
+resource in a single pass. Output dicts are built only for the resources that
+match, so memory follows the number of matches rather than the state size.
+When the provider keeps a state index, filtered reads of streamed states only
+read the resources the index points at (compressed states are always scanned).
+On a memory-mapped state, a filter value that never occurs in the file's bytes
+ends the read before any resource is decoded.
+
+An attribute projection expands each matching resource into its instances
+(with their ``index_key``) and copies out only the requested attributes, each
+given as a path into the instance attributes (``arn``, ``tags.Name``).
+
+Results can be read a page at a time. In state order the matches before the
+offset are only counted, never turned into output dicts, and the read stops as
+soon as the page is full; with a valid state index they are not even read. In
+``resource_id`` order every match is considered, but only the resources up to
+the end of the page are kept.
+"""
+
+from __future__ import annotations
+
+import heapq
+import mmap
+import re
+from collections.abc import Generator, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from attrs import define
+
+from tofusoup.tf.components.codec import JsonCodec, get_codec
+from tofusoup.tf.components.state.index import iter_indexed_resources, state_index_store
+from tofusoup.tf.components.state.loader import StateSource, open_state_source
+from tofusoup.tf.components.state.paths import ValuePath, parse_value_path, select_value
+from tofusoup.tf.components.state.scanner import ELEMENT, scan_state
+
+SORT_STATE = "state"
+SORT_RESOURCE_ID = "resource_id"
+SORT_ORDERS = (SORT_STATE, SORT_RESOURCE_ID)
+
+# Filter values made only of these characters are written verbatim by every JSON encoder.
+_VERBATIM_VALUE = re.compile(r"[A-Za-z0-9_.\-]+")
+
+
+@define(frozen=True)
+class ResourceFilter:
+    """Exact-match filters on resource mode, type and module; unset (or empty) filters match everything."""
+
+    mode: str | None = None
+    type: str | None = None
+    module: str | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether any filter is set."""
+        return bool(self.mode or self.type or self.module)
+
+    def matches(self, resource: dict[str, Any]) -> bool:
+        if self.mode and resource.get("mode") != self.mode:
+            return False
+        if self.type and resource.get("type") != self.type:
+            return False
+        return not (self.module and resource.get("module") != self.module)
+
+
+def _skip_matches(
+    resources: Iterable[dict[str, Any]], resource_filter: ResourceFilter, offset: int
+) -> Iterator[dict[str, Any]]:
+    """Yield ``resources`` except the first ``offset`` that match ``resource_filter``."""
+    for resource in resources:
+        if offset and resource_filter.matches(resource):
+            offset -= 1
+            continue
+        yield resource
+
+
+def _cannot_match(buffer: mmap.mmap, resource_filter: ResourceFilter) -> bool:
+    """Whether some filter value never occurs as a JSON string in the mapped state."""
+    for value in (resource_filter.mode, resource_filter.type, resource_filter.module):
+        if value and _VERBATIM_VALUE.fullmatch(value) and buffer.find(f'"{value}"'.encode()) == -1:
+            return True
+    return False
+
+
+def _scan_resources(source: StateSource) -> Iterator[dict[str, Any]]:
+    for event in scan_state(source.stream, arrays={"resources"}, skip={"outputs", "check_results"}):  # type: ignore[arg-type]
+        if event.kind == ELEMENT:
+            yield event.value
+        elif event.key == "resources":
+            # Present but not an array; hand it over as the full parse would.
+            yield from event.value
+
+
+def iter_resources(
+    source: StateSource, resource_filter: ResourceFilter | None = None, offset: int = 0
+) -> Generator[dict[str, Any], None, None]:
+    """Yield the resources of the state in file order.
+
+    Every resource is yielded unless ``resource_filter`` is given and a state
+    index can narrow the candidates down; callers still apply the filter.
+    The first ``offset`` resources matching the filter are passed over; with a
+    valid state index they are not even read.
+    """
+    resource_filter = resource_filter or ResourceFilter()
+    if source.document is not None:
+        yield from _skip_matches(source.document.get("resources", []), resource_filter, offset)
+        return
+    if isinstance(source.stream, mmap.mmap) and _cannot_match(source.stream, resource_filter):
+        return
+    store = state_index_store()
+    seekable = source.compression is None and isinstance(source.path, Path)
+    if store is not None and seekable and (resource_filter.active or offset):
+        yield from iter_indexed_resources(
+            store,
+            source.path,  # type: ignore[arg-type]
+            source.stream,  # type: ignore[arg-type]
+            source.stat,
+            mode=resource_filter.mode,
+            type=resource_filter.type,
+            module=resource_filter.module,
+            offset=offset,
+        )
+        return
+    yield from _skip_matches(_scan_resources(source), resource_filter, offset)
+
+
+def resource_address(resource: dict[str, Any]) -> str:
+    """Return the ``resource_id`` of a state resource: mode, module (if any), type and name."""
+    mode = resource.get("mode", "unknown")
+    type_ = resource.get("type", "unknown")
+    name = resource.get("name", "unknown")
+    module = resource.get("module")
+    if module:
+        return f"{mode}.{module}.{type_}.{name}"
+    return f"{mode}.{type_}.{name}"
+
+
+def instance_entries(
+    instances: list[dict[str, Any]], attribute_paths: dict[str, ValuePath], codec: JsonCodec
+) -> list[dict[str, Any]]:
+    """Project each instance onto the requested attributes, JSON-encoded; missing ones are null."""
+    entries = []
+    for instance in instances:
+        attributes = instance.get("attributes") or {}
+        projected = {}
+        for name, steps in attribute_paths.items():
+            found, value = select_value(attributes, steps)
+            projected[name] = codec.dumps(value) if found else None
+        index_key = instance.get("index_key")
+        entries.append(
+            {
+                "index_key": codec.dumps(index_key) if index_key is not None else None,
+                "attributes": projected,
+            }
+        )
+    return entries
+
+
+def resource_entry(
+    resource: dict[str, Any],
+    attribute_paths: dict[str, ValuePath] | None = None,
+    codec: JsonCodec | None = None,
+) -> dict[str, Any]:
+    """Build the ``tofusoup_state_resources`` representation of one state resource.
+
+    ``instances`` is only filled in when ``attribute_paths`` asks for a projection.
+    """
+    mode = resource.get("mode", "unknown")
+    type_ = resource.get("type", "unknown")
+    name = resource.get("name", "unknown")
+    module = resource.get("module")
+    provider = resource.get("provider", "")
+    instances = resource.get("instances", [])
+
+    resource_id = resource_address(resource)
+
+    # Get ID from first instance if available
+    instance_id = None
+    if instances and len(instances) > 0:
+        attributes = instances[0].get("attributes", {})
+        if attributes:
+            instance_id = attributes.get("id")
+
+    return {
+        "mode": mode,
+        "type": type_,
+        "name": name,
+        "provider": provider,
+        "module": module,
+        "instance_count": len(instances),
+        "has_multiple_instances": len(instances) > 1,
+        "resource_id": resource_id,
+        "id": instance_id,
+        "instances": instance_entries(instances, attribute_paths, codec or get_codec()) if attribute_paths else None,
+    }
+
+
+@define(frozen=True)
+class ResourcePage:
+    """The output entries of one page of matching resources.
+
+    ``scanned`` counts the resources checked against the filter for this page;
+    ``next_offset`` is the offset of the following page, or None when this
+    page is the last.
+    """
+
+    resources: list[dict[str, Any]]
+    scanned: int
+    next_offset: int | None = None
+
+
+def _page_in_state_order(resources: Iterable[dict[str, Any]], limit: int | None) -> tuple[list[dict[str, Any]], bool]:
+    page: list[dict[str, Any]] = []
+    for resource in resources:
+        if limit is not None and len(page) == limit:
+            return page, True
+        page.append(resource)
+    return page, False
+
+
+def _page_by_resource_id(
+    resources: Iterable[dict[str, Any]], offset: int, limit: int | None
+) -> tuple[list[dict[str, Any]], bool]:
+    # The position breaks ties, so equal addresses keep their state order and
+    # resources themselves are never compared.
+    keyed = ((resource_address(resource), position, resource) for position, resource in enumerate(resources))
+    if limit is None:
+        return [resource for _, _, resource in sorted(keyed)[offset:]], False
+    window = heapq.nsmallest(offset + limit + 1, keyed)
+    return [resource for _, _, resource in window[offset : offset + limit]], len(window) > offset + limit
+
+
+def read_resources(
+    path: Path,
+    resource_filter: ResourceFilter,
+    attributes: tuple[str, ...] = (),
+    offset: int = 0,
+    limit: int | None = None,
+    sort_by: str = SORT_STATE,
+) -> ResourcePage:
+    """Return one page of the resources matching ``resource_filter``, ordered by ``sort_by``.
+
+    The page holds up to ``limit`` resources (all of them when None), starting
+    at ``offset``. With ``attributes``, each entry lists its instances
+    projected onto those attribute paths.
+    """
+    if sort_by not in SORT_ORDERS:
+        raise ValueError(f"Unknown resource sort order: {sort_by}")
+    attribute_paths = {attribute: parse_value_path(attribute) for attribute in attributes}
+    codec = get_codec()
+    scanned = 0
+
+    def matching(resources: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        nonlocal scanned
+        for resource in resources:
+            scanned += 1
+            if resource_filter.matches(resource):
+                yield resource
+
+    with open_state_source(path) as source:
+        if sort_by == SORT_STATE:
+            resources = iter_resources(source, resource_filter, offset)
+            try:
+                page, more = _page_in_state_order(matching(resources), limit)
+            finally:
+                resources.close()
+        else:
+            page, more = _page_by_resource_id(matching(iter_resources(source, resource_filter)), offset, limit)
+        entries = [resource_entry(resource, attribute_paths, codec) for resource in page]
+    return ResourcePage(
+        resources=entries,
+        scanned=scanned,
+        next_offset=offset + len(entries) if more else None,
+    )
@@ -0,0 +1,230 @@
+"""Incremental, event-based reader for Terraform state files.
+
+``scan_state`` walks the top-level object of a state file and yields one
+``StateEvent`` per top-level member. Members named in ``arrays`` (typically
+``resources``) or ``objects`` (typically ``outputs``) are not materialized as a
+whole: each array element or object member is decoded and yielded on its own,
+so memory stays proportional to the largest single resource rather than to the
+file. Members named in ``skip`` are passed over the same way without yielding
+anything, and the scan ends as soon as every member named in ``stop_after`` has
+been read. Every event carries the byte range of its value in the source, which the
+index and filtering code use to come back to individual resources later.
+
+The file is read in chunks and decoded with ``json.JSONDecoder.raw_decode``,
+so each value is still parsed by the C decoder. A value that straddles the end
+of the buffered text is retried after reading more input; reads grow
+geometrically so large values are not re-decoded more than a few times.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Generator, Iterator
+from typing import Any, BinaryIO
+
+from attrs import define
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+FIELD = "field"
+ELEMENT = "element"
+MEMBER = "member"
+
+_BOM = "\ufeff"
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@define(frozen=True)
+class StateEvent:
+    """One decoded value from a state file.
+
+    ``kind`` is ``"field"`` for a whole top-level member, ``"element"`` for one
+    element of a streamed array and ``"member"`` for one member of a streamed
+    object. ``key`` is the top-level key the value belongs to; ``name`` is the
+    member name and ``index`` the element position where they apply. ``start``
+    and ``end`` are byte offsets of the value in the source.
+    """
+
+    kind: str
+    key: str
+    value: Any
+    start: int
+    end: int
+    name: str | None = None
+    index: int | None = None
+
+
+class _Reader:
+    """Buffered UTF-8 text over a binary stream, tracking byte offsets."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.byte_pos = 0
+        self.eof = False
+        self._ascii = True
+        self._started = False
+
+    def _fill(self) -> bool:
+        """Read more input, keeping unconsumed text. Returns False at end of input."""
+        if self.eof:
+            return False
+        size = max(self._chunk_size, len(self.buf) - self.pos)
+        data = self._stream.read(size)
+        final = not data
+        text = self._decoder.decode(data, final=final)
+        if text and not self._started:
+            self._started = True
+            if text[0] == _BOM:
+                # Skip a leading byte order mark, as json.load does for binary input.
+                text = text[1:]
+                self.byte_pos += len(_BOM.encode("utf-8"))
+        self.buf = self.buf[self.pos :] + text
+        self.pos = 0
+        self._ascii = self.buf.isascii()
+        self.eof = final
+        return bool(text) or not final
+
+    def _advance(self, new_pos: int) -> None:
+        if self._ascii:
+            self.byte_pos += new_pos - self.pos
+        else:
+            self.byte_pos += len(self.buf[self.pos : new_pos].encode("utf-8"))
+        self.pos = new_pos
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buf, self.pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at end of input)."""
+        while True:
+            pos = _WHITESPACE.match(self.buf, self.pos).end()  # type: ignore[union-attr]
+            self._advance(pos)
+            if pos < len(self.buf):
+                return self.buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            raise self._error(f"Expecting {expected}")
+        self._advance(self.pos + 1)
+        return char
+
+    def value(self) -> tuple[Any, int, int]:
+        """Decode the next JSON value and return it with its byte range."""
+        if not self.peek():
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending exactly at the buffer end may continue in the next chunk, and a
+            # number cut right after ".", "e" or its sign decodes as a shorter number one or two characters
+            # before the end; read more and decode again.
+            if not self.eof and (
+                end == len(self.buf)
+                or (end >= len(self.buf) - 2 and isinstance(value, int | float) and not isinstance(value, bool))
+            ):
+                self._fill()
+                continue
+            start = self.byte_pos
+            self._advance(end)
+            return value, start, self.byte_pos
+
+    def string(self) -> str:
+        """Decode the next value, which must be an object key."""
+        if self.peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        key, _, _ = self.value()
+        return key  # type: ignore[no-any-return]
+
+
+def scan_state(
+    stream: BinaryIO,
+    arrays: frozenset[str] | set[str] = frozenset(),
+    objects: frozenset[str] | set[str] = frozenset(),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    skip: frozenset[str] | set[str] = frozenset(),
+    stop_after: frozenset[str] | set[str] = frozenset(),
+) -> Generator[StateEvent, None, None]:
+    """Yield the top-level members of the state document read from ``stream``.
+
+    Raises ``json.JSONDecodeError`` for malformed input. Closing the iterator
+    early, or reading every member in ``stop_after``, stops reading; nothing
+    past the last value read is parsed.
+    """
+    pending = set(stop_after)
+    reader = _Reader(stream, chunk_size)
+    if reader.peek() != "{":
+        # Not an object: decode it whole so malformed input reports a JSON error.
+        value, _, _ = reader.value()
+        raise TypeError(f"State file must contain a JSON object, not {type(value).__name__}")
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            key = reader.string()
+            reader.expect(":")
+            opener = reader.peek()
+            if key in skip and opener in ("[", "{"):
+                for _ in _scan_array(reader, key) if opener == "[" else _scan_object(reader, key):
+                    pass
+            elif key in skip:
+                reader.value()
+            elif key in arrays and opener == "[":
+                yield from _scan_array(reader, key)
+            elif key in objects and opener == "{":
+                yield from _scan_object(reader, key)
+            else:
+                value, start, end = reader.value()
+                yield StateEvent(kind=FIELD, key=key, value=value, start=start, end=end)
+            if key in pending:
+                pending.discard(key)
+                if not pending:
+                    return
+            if reader.expect(",}") == "}":
+                break
+    if reader.peek():
+        raise reader._error("Extra data")
+
+
+def _scan_array(reader: _Reader, key: str) -> Iterator[StateEvent]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    index = 0
+    while True:
+        value, start, end = reader.value()
+        yield StateEvent(kind=ELEMENT, key=key, value=value, start=start, end=end, index=index)
+        index += 1
+        if reader.expect(",]") == "]":
+            return
+
+
+def _scan_object(reader: _Reader, key: str) -> Iterator[StateEvent]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+        return
+    while True:
+        name = reader.string()
+        reader.expect(":")
+        value, start, end = reader.value()
+        yield StateEvent(kind=MEMBER, key=key, value=value, start=start, end=end, name=name)
+        if reader.expect(",}") == "}":
+            return
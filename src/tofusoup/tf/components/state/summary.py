@@ -0,0 +1,262 @@
+"""Header fields and resource/output counts of a Terraform state file.
+
+The same counting is applied to an already parsed document (``summarize_state``)
+and to a streamed file (``scan_summary``), so both paths report identical
+numbers; the streaming path keeps only one resource in memory at a time.
+``scan_header`` reads only as far as needed to find the header fields, which
+Terraform writes ahead of ``outputs`` and ``resources``; for a remote state,
+only those first bytes are requested.
+
+``summarize_state_file`` is the entry point for the data sources. Summaries are
+kept in a small cache keyed by the file's stat signature, so an unchanged file
+is not read again; otherwise a parsed document from the state cache is reused
+when there is one, and the file is parsed in the state parse processes (when
+configured), which send back only the summary.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from attrs import define
+
+from tofusoup.tf.components.codec import get_codec
+from tofusoup.tf.components.runtime import active_provider
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.loader import (
+    SignatureCache,
+    StateSignature,
+    cached_state,
+    expected_size,
+    open_state,
+    open_state_source,
+    open_state_stream,
+)
+from tofusoup.tf.components.state.remote import RemoteState, remote_state_client
+from tofusoup.tf.components.state.scanner import ELEMENT, MEMBER, scan_state
+from tofusoup.tf.components.state.workers import run_in_parse_pool, run_in_state_pool, state_process_pool
+
+HEADER_FIELDS = ("version", "terraform_version", "serial", "lineage")
+HEADER_CHUNK_SIZE = 64 * 1024
+DEFAULT_SUMMARY_CACHE_ENTRIES = 10_000
+
+
+@define(frozen=True)
+class StateSummary:
+    """Metadata and counts reported by the ``tofusoup_state_info`` data source."""
+
+    version: int | None = None
+    terraform_version: str | None = None
+    serial: int | None = None
+    lineage: str | None = None
+    resources_count: int | None = None
+    outputs_count: int | None = None
+    managed_resources_count: int | None = None
+    data_resources_count: int | None = None
+    modules_count: int | None = None
+
+    @classmethod
+    def from_header(cls, header: dict[str, Any]) -> StateSummary:
+        """Summary carrying only the header fields, with the counts left unset."""
+        return cls(**{field: header.get(field) for field in HEADER_FIELDS})
+
+
+class StateSummaryCache(SignatureCache[StateSummary]):
+    """LRU cache of state summaries keyed by path, valid only for the same stat signature."""
+
+    def __init__(self, max_entries: int = DEFAULT_SUMMARY_CACHE_ENTRIES) -> None:
+        super().__init__(max_entries)
+
+
+_default_summary_cache = StateSummaryCache()
+
+
+def summary_cache() -> StateSummaryCache:
+    """Return the summary cache of the running provider, or the process default."""
+    provider = active_provider()
+    if provider is not None:
+        return provider.state_summary_cache  # type: ignore[no-any-return]
+    return _default_summary_cache
+
+
+class _ResourceCounter:
+    """Accumulates resource counts one resource at a time."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.managed = 0
+        self.data = 0
+        self.modules: set[Any] = set()
+
+    def add(self, resource: Any) -> None:
+        self.total += 1
+        mode = resource.get("mode")
+        if mode == "managed":
+            self.managed += 1
+        elif mode == "data":
+            self.data += 1
+
+        # Track unique modules
+        if "module" in resource:
+            self.modules.add(resource["module"])
+
+    def add_all(self, resources: Iterable[Any]) -> None:
+        for resource in resources:
+            self.add(resource)
+
+
+def _build(header: dict[str, Any], counter: _ResourceCounter, outputs_count: int) -> StateSummary:
+    return StateSummary(
+        version=header.get("version"),
+        terraform_version=header.get("terraform_version"),
+        serial=header.get("serial"),
+        lineage=header.get("lineage"),
+        resources_count=counter.total,
+        outputs_count=outputs_count,
+        managed_resources_count=counter.managed,
+        data_resources_count=counter.data,
+        modules_count=len(counter.modules),
+    )
+
+
+def summarize_state(state: dict[str, Any]) -> StateSummary:
+    """Summarize a parsed state document."""
+    counter = _ResourceCounter()
+    counter.add_all(state.get("resources", []))
+    return _build(state, counter, len(state.get("outputs", {})))
+
+
+def scan_summary(stream: BinaryIO) -> StateSummary:
+    """Summarize a state file while streaming it, without materializing resources or outputs."""
+    header: dict[str, Any] = {}
+    counter = _ResourceCounter()
+    output_names: set[str] = set()
+    outputs: Any = {}
+
+    for event in scan_state(stream, arrays={"resources"}, objects={"outputs"}):
+        if event.kind == ELEMENT:
+            counter.add(event.value)
+        elif event.kind == MEMBER:
+            output_names.add(event.name)  # type: ignore[arg-type]
+        elif event.key == "resources":
+            # Present but not an array; count it the way the full parse would.
+            counter = _ResourceCounter()
+            counter.add_all(event.value)
+        elif event.key == "outputs":
+            outputs = event.value
+        elif event.key in HEADER_FIELDS:
+            header[event.key] = event.value
+
+    outputs_count = len(output_names) if output_names else len(outputs)
+    return _build(header, counter, outputs_count)
+
+
+def scan_header(stream: BinaryIO, chunk_size: int = HEADER_CHUNK_SIZE) -> dict[str, Any]:
+    """Return the header fields present in a state file, reading no further than the last of them.
+
+    Fields written after ``outputs``/``resources`` are still found: those members
+    are streamed past without being materialized.
+    """
+    header: dict[str, Any] = {}
+    events = scan_state(stream, chunk_size=chunk_size, skip={"outputs", "resources", "check_results"})
+    try:
+        for event in events:
+            if event.key in HEADER_FIELDS:
+                header[event.key] = event.value
+                if len(header) == len(HEADER_FIELDS):
+                    break
+    finally:
+        events.close()
+    return header
+
+
+def read_summary(path: Path, header_only: bool = False) -> tuple[StateSummary, os.stat_result]:
+    """Summarize the state file at ``path`` and return the stat it was read with.
+
+    Small or already-parsed states are summarized from the shared parsed document;
+    large ones are streamed. With ``header_only`` only the header fields are read.
+    """
+    if header_only:
+        return read_header_summary(path)
+
+    with open_state_source(path) as source:
+        if source.document is not None:
+            return summarize_state(source.document), source.stat
+        return scan_summary(source.stream), source.stat  # type: ignore[arg-type]
+
+
+def read_header_summary(path: Path | RemoteState) -> tuple[StateSummary, os.stat_result]:
+    """Summarize only the header fields of a local or remote state, and return its stat."""
+    if isinstance(path, RemoteState):
+        with remote_state_client().open_stream(path) as (f, stat_result, _):
+            return StateSummary.from_header(scan_header(f)), stat_result
+    state, stat_result = cached_state(path)
+    if state is None:
+        with open_state(path) as (f, stat_result):
+            state = scan_header(f)
+    return StateSummary.from_header(state), stat_result
+
+
+def read_cached_summary(path: Path) -> tuple[StateSummary, os.stat_result] | None:
+    """Return the summary of an unchanged file from the caches, or None if it must be parsed.
+
+    Checks the summary cache first, then summarizes an already parsed document.
+    """
+    stat_result = path.stat()
+    cached = summary_cache().get(StateSignature.from_stat(path, stat_result))
+    if cached is not None and os.access(path, os.R_OK):
+        return cached, stat_result
+
+    state, stat_result = cached_state(path)
+    if state is None:
+        return None
+    return _remember(path, summarize_state(state), stat_result)
+
+
+def _remember(path: Path, summary: StateSummary, stat_result: os.stat_result) -> tuple[StateSummary, os.stat_result]:
+    summary_cache().put(StateSignature.from_stat(path, stat_result), summary)
+    return summary, stat_result
+
+
+def parse_summary(path: Path, streaming_threshold: int) -> tuple[StateSummary, os.stat_result]:
+    """Summarize the state file at ``path`` without going through the parsed-state cache.
+
+    Runs in the state parse processes: the parsed document stays in the worker
+    and only the summary is sent back. Files above ``streaming_threshold`` bytes
+    (once decompressed) are streamed.
+    """
+    with open_state_stream(path) as (f, stat_result, compression):
+        if expected_size(stat_result, compression) <= streaming_threshold:
+            return summarize_state(get_codec().load(f)), stat_result
+        return scan_summary(f), stat_result
+
+
+async def summarize_state_file(
+    path: Path | RemoteState, header_only: bool = False, cache_document: bool = True
+) -> tuple[StateSummary, os.stat_result]:
+    """Summarize the state file at ``path`` off the event loop; see ``read_summary``.
+
+    A remote ``path`` is read with ranged requests for ``header_only``, and
+    fetched into its local copy otherwise. Without ``cache_document`` a file
+    that must be parsed is parsed as by ``parse_summary``, leaving only its
+    summary behind, for callers that will not read the document again.
+    """
+    if header_only:
+        return await run_in_state_pool(read_header_summary, path)
+    if isinstance(path, RemoteState):
+        path = await run_in_state_pool(remote_state_client().fetch, path)
+
+    cached = await run_in_state_pool(read_cached_summary, path)
+    if cached is not None:
+        return cached
+    if state_process_pool() is None:
+        if cache_document:
+            summary, stat_result = await run_in_state_pool(read_summary, path)
+        else:
+            summary, stat_result = await run_in_state_pool(parse_summary, path, loader.STREAMING_THRESHOLD_BYTES)
+    else:
+        summary, stat_result = await run_in_parse_pool(parse_summary, path, loader.STREAMING_THRESHOLD_BYTES)
+    return _remember(path, summary, stat_result)
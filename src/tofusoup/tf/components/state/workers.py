@@ -0,0 +1,49 @@
+"""Bounded worker pools for blocking state file reads.
+
+Reading and decoding a large state takes seconds of blocking I/O and CPU. The
+state data sources run that work in the provider's state worker pool, sized by
+the ``state_workers`` setting, so the event loop keeps serving other data
+source reads, including registry requests in flight, in the meantime.
+
+Threads share the GIL, so many states decoded at once still use a single core.
+With ``state_parse_processes`` set, CPU-bound parsing is submitted to a pool of
+worker processes instead; functions sent there must be importable at module
+level and should return compact results rather than parsed documents, since
+everything crossing the process boundary is pickled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from tofusoup.tf.components.runtime import active_provider
+
+DEFAULT_STATE_WORKERS = 4
+DEFAULT_STATE_PARSE_PROCESSES = 0
+
+T = TypeVar("T")
+
+
+async def run_in_state_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func(*args, **kwargs)`` in the provider's state worker pool (the loop's default executor without one)."""
+    provider = active_provider()
+    executor = provider.state_executor if provider is not None else None
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def state_process_pool() -> ProcessPoolExecutor | None:
+    """Return the provider's state parse process pool, or None when parsing stays in threads."""
+    provider = active_provider()
+    return provider.state_process_pool if provider is not None else None
+
+
+async def run_in_parse_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run CPU-bound ``func(*args, **kwargs)`` in the state parse processes, or the state worker pool without them."""
+    pool = state_process_pool()
+    if pool is None:
+        return await run_in_state_pool(func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(pool, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,42 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Shared test fixtures."""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.hub import hub  # type: ignore
+from pyvider.providers.context import ProviderContext  # type: ignore
+
+from tofusoup.tf.components.provider import TofuSoupProvider, TofuSoupProviderConfig
+from tofusoup.tf.components.state import loader
+
+
+@pytest.fixture
+def configured_provider(tmp_path: Any) -> Iterator[Callable[..., TofuSoupProvider]]:
+    """Register a TofuSoup provider (and its configuration) with the hub for the duration of a test."""
+
+    def _configure(**config_values: Any) -> TofuSoupProvider:
+        config_values.setdefault("cache_dir", str(tmp_path / "cache"))
+        provider = TofuSoupProvider()
+        hub.register("singleton", "provider", provider)
+        hub.register("singleton", "provider_context", ProviderContext(config=TofuSoupProviderConfig(**config_values)))
+        return provider
+
+    yield _configure
+
+    hub.unregister("singleton", "provider")
+    hub.unregister("singleton", "provider_context")
+
+
+@pytest.fixture
+def mapped_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Register ``tmp_path`` as a directory of replace-only states, which are memory-mapped."""
+    monkeypatch.setattr(loader, "_replaced_dirs", set())
+    loader.map_files_in(tmp_path)
+    return tmp_path
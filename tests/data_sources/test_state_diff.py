@@ -0,0 +1,85 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the state_diff data source."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_diff import StateDiffConfig, StateDiffDataSource, StateDiffState
+
+
+def write_state(path: Path, ids: list[str]) -> Path:
+    resources = [
+        {"mode": "managed", "type": "null_resource", "name": name, "instances": [{"attributes": {"id": value}}]}
+        for name, value in (item.split("=") for item in ids)
+    ]
+    path.write_text(json.dumps({"version": 4, "resources": resources}))
+    return path
+
+
+async def read(old: Path, new: Path) -> StateDiffState:
+    config = StateDiffConfig(old_state_path=str(old), new_state_path=str(new))
+    return await StateDiffDataSource().read(ResourceContext(config=config))
+
+
+class TestStateDiffSchema:
+    """Structure of the state_diff data source."""
+
+    def test_classes_are_set(self) -> None:
+        assert StateDiffDataSource.config_class == StateDiffConfig
+        assert StateDiffDataSource.state_class == StateDiffState
+
+    def test_schema_attributes(self) -> None:
+        attrs = StateDiffDataSource.get_schema().block.attributes
+
+        assert attrs["old_state_path"].required is True
+        assert attrs["new_state_path"].required is True
+        for name in ("added", "removed", "changed", "added_count", "unchanged_count"):
+            assert attrs[name].computed is True
+
+    @pytest.mark.asyncio
+    async def test_validation(self) -> None:
+        errors = await StateDiffDataSource()._validate_config(StateDiffConfig(old_state_path="", new_state_path=""))
+        assert errors == [
+            "'old_state_path' is required and cannot be empty.",
+            "'new_state_path' is required and cannot be empty.",
+        ]
+
+
+class TestStateDiffRead:
+    """Comparing two state files."""
+
+    @pytest.mark.asyncio
+    async def test_diff(self, tmp_path: Path) -> None:
+        old = write_state(tmp_path / "old.tfstate", ["a=1", "b=1", "c=1"])
+        new = write_state(tmp_path / "new.tfstate", ["a=1", "b=2", "d=1"])
+
+        state = await read(old, new)
+
+        assert state.added == ["null_resource.d"]
+        assert state.removed == ["null_resource.c"]
+        assert state.changed == ["null_resource.b"]
+        assert (state.added_count, state.removed_count, state.changed_count, state.unchanged_count) == (1, 1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, tmp_path: Path) -> None:
+        old = write_state(tmp_path / "old.tfstate", ["a=1"])
+
+        with pytest.raises(DataSourceError, match="State file not found"):
+            await read(old, tmp_path / "missing.tfstate")
+
+    @pytest.mark.asyncio
+    async def test_invalid_json(self, tmp_path: Path) -> None:
+        old = write_state(tmp_path / "old.tfstate", ["a=1"])
+        new = tmp_path / "new.tfstate"
+        new.write_text('{"version": 4, "resources": [')
+
+        with pytest.raises(DataSourceError, match="Invalid JSON"):
+            await read(old, new)
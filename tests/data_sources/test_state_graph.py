@@ -0,0 +1,109 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the state_graph data source."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_graph import StateGraphConfig, StateGraphDataSource, StateGraphState
+from tofusoup.tf.components.state.graph import graph_cache
+
+RESOURCES = [
+    {"mode": "managed", "type": "aws_vpc", "name": "main", "instances": [{"attributes": {}}]},
+    {
+        "mode": "managed",
+        "type": "aws_subnet",
+        "name": "a",
+        "module": "module.net",
+        "instances": [{"attributes": {}, "dependencies": ["aws_vpc.main"]}],
+    },
+    {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "web",
+        "instances": [{"attributes": {}, "dependencies": ["module.net.aws_subnet.a"]}],
+    },
+]
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    path = tmp_path / "terraform.tfstate"
+    path.write_text(json.dumps({"version": 4, "resources": RESOURCES}))
+    graph_cache().clear()
+    return path
+
+
+async def read(path: Path, **settings: Any) -> StateGraphState:
+    return await StateGraphDataSource().read(ResourceContext(config=StateGraphConfig(state_path=str(path), **settings)))
+
+
+class TestStateGraphSchema:
+    """Structure of the state_graph data source."""
+
+    def test_classes_are_set(self) -> None:
+        assert StateGraphDataSource.config_class == StateGraphConfig
+        assert StateGraphDataSource.state_class == StateGraphState
+
+    def test_schema_attributes(self) -> None:
+        attrs = StateGraphDataSource.get_schema().block.attributes
+
+        assert attrs["state_path"].required is True
+        assert attrs["address"].optional is True
+        for name in ("resources_count", "edges_count", "has_cycles", "order", "dependencies", "dependents"):
+            assert attrs[name].computed is True
+
+    @pytest.mark.asyncio
+    async def test_validation(self) -> None:
+        errors = await StateGraphDataSource()._validate_config(StateGraphConfig(state_path="", address=""))
+        assert errors == ["'state_path' is required and cannot be empty.", "'address' cannot be empty."]
+
+
+class TestStateGraphRead:
+    """Reading the dependency graph of a state file."""
+
+    @pytest.mark.asyncio
+    async def test_whole_graph(self, state_file: Path) -> None:
+        state = await read(state_file)
+
+        assert state.resources_count == 3
+        assert state.edges_count == 2
+        assert state.has_cycles is False
+        assert state.order == ["aws_vpc.main", "module.net.aws_subnet.a", "aws_instance.web"]
+        assert state.dependencies is None
+        assert state.dependents is None
+
+    @pytest.mark.asyncio
+    async def test_transitive_query(self, state_file: Path) -> None:
+        state = await read(state_file, address="aws_vpc.main")
+
+        assert state.dependents == ["module.net.aws_subnet.a", "aws_instance.web"]
+        assert state.dependencies == []
+
+    @pytest.mark.asyncio
+    async def test_direct_query(self, state_file: Path) -> None:
+        state = await read(state_file, address="aws_vpc.main", transitive=False)
+
+        assert state.transitive is False
+        assert state.dependents == ["module.net.aws_subnet.a"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_address(self, state_file: Path) -> None:
+        with pytest.raises(DataSourceError, match="Resource not found in state: aws_vpc.other"):
+            await read(state_file, address="aws_vpc.other")
+
+    @pytest.mark.asyncio
+    async def test_invalid_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text('{"version": 4, "resources": [')
+
+        with pytest.raises(DataSourceError, match="Invalid JSON"):
+            await read(path)
@@ -170,3 +170,48 @@ class TestStateInfoRead:
         state = await ds.read(ctx)
 
         assert state.version == 4
+
+    @pytest.mark.asyncio
+    async def test_read_header_only(self, sample_state_with_resources):
+        """Test header-only mode returns header fields and leaves counts unset."""
+        ds = StateInfoDataSource()
+        config = StateInfoConfig(state_path=str(sample_state_with_resources), header_only=True)
+        ctx = ResourceContext(config=config, state=None)
+
+        state = await ds.read(ctx)
+
+        assert state.header_only is True
+        assert state.version == 4
+        assert state.terraform_version == "1.10.2"
+        assert state.serial == 3
+        assert state.lineage == "test-lineage-resources"
+        assert state.resources_count is None
+        assert state.outputs_count is None
+        assert state.state_file_size > 0
+
+    @pytest.mark.asyncio
+    async def test_read_header_only_with_fields_after_resources(self, tmp_path):
+        """Test header-only mode finds header fields written after the resources array."""
+        import json
+
+        state_file = tmp_path / "terraform.tfstate"
+        state_file.write_text(
+            json.dumps(
+                {
+                    "resources": [{"mode": "managed", "type": "null_resource", "name": "a", "instances": []}],
+                    "version": 4,
+                    "serial": 9,
+                    "lineage": "late-header",
+                }
+            )
+        )
+
+        ds = StateInfoDataSource()
+        config = StateInfoConfig(state_path=str(state_file), header_only=True)
+        ctx = ResourceContext(config=config, state=None)
+
+        state = await ds.read(ctx)
+
+        assert state.serial == 9
+        assert state.lineage == "late-header"
+        assert state.terraform_version is None
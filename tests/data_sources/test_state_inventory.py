@@ -0,0 +1,187 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the state_inventory data source."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_inventory import (
+    StateInventoryConfig,
+    StateInventoryDataSource,
+    StateInventoryState,
+)
+from tofusoup.tf.components.state import loader, summary
+from tofusoup.tf.components.state.summary import summary_cache
+
+
+def write_state(path: Path, resources: int, serial: int = 1) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = {
+        "version": 4,
+        "terraform_version": "1.10.6",
+        "serial": serial,
+        "lineage": path.parent.name,
+        "outputs": {"o": {"value": 1, "type": "number"}},
+        "resources": [
+            {"mode": "managed" if i % 2 else "data", "type": "null_resource", "name": f"r{i}", "module": "module.m"}
+            for i in range(resources)
+        ],
+    }
+    path.write_text(json.dumps(state))
+    return path
+
+
+@pytest.fixture
+def fleet(tmp_path: Path) -> Path:
+    """Three environments, one with two workspaces."""
+    write_state(tmp_path / "envs" / "dev" / "terraform.tfstate", resources=2)
+    write_state(tmp_path / "envs" / "prod" / "terraform.tfstate", resources=4)
+    write_state(tmp_path / "envs" / "prod" / "terraform.tfstate.d" / "blue" / "terraform.tfstate", resources=1)
+    (tmp_path / "envs" / "notes.txt").write_text("not a state")
+    summary_cache().clear()
+    loader.state_cache().clear()
+    return tmp_path
+
+
+@pytest.fixture
+def count_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every state file actually read and summarized."""
+    reads: list[Path] = []
+    real_parse_summary = summary.parse_summary
+
+    def recording_parse_summary(path: Path, *args: Any) -> Any:
+        reads.append(path)
+        return real_parse_summary(path, *args)
+
+    monkeypatch.setattr(summary, "parse_summary", recording_parse_summary)
+    return reads
+
+
+async def read(path: Path | str) -> StateInventoryState:
+    return await StateInventoryDataSource().read(ResourceContext(config=StateInventoryConfig(path=str(path))))
+
+
+class TestStateInventorySchema:
+    """Structure of the state_inventory data source."""
+
+    def test_classes_are_set(self) -> None:
+        assert StateInventoryDataSource.config_class == StateInventoryConfig
+        assert StateInventoryDataSource.state_class == StateInventoryState
+
+    def test_schema_attributes(self) -> None:
+        attrs = StateInventoryDataSource.get_schema().block.attributes
+
+        assert attrs["path"].required is True
+        for name in ("files_count", "errors_count", "resources_count", "state_files_size", "states"):
+            assert attrs[name].computed is True
+
+    @pytest.mark.asyncio
+    async def test_validate_empty_path(self) -> None:
+        errors = await StateInventoryDataSource()._validate_config(StateInventoryConfig(path=""))
+        assert errors == ["'path' is required and cannot be empty."]
+
+
+class TestStateInventoryRead:
+    """Reading an inventory of state files."""
+
+    @pytest.mark.asyncio
+    async def test_glob_pattern(self, fleet: Path) -> None:
+        state = await read(fleet / "envs" / "*" / "terraform.tfstate")
+
+        assert state.files_count == 2
+        assert [Path(s["state_path"]).parent.name for s in state.states] == ["dev", "prod"]
+        assert [s["resources_count"] for s in state.states] == [2, 4]
+        assert state.resources_count == 6
+        assert state.managed_resources_count == 3
+        assert state.data_resources_count == 3
+        assert state.outputs_count == 2
+        assert state.modules_count == 2
+        assert state.errors_count == 0
+
+    @pytest.mark.asyncio
+    async def test_directory_includes_workspaces(self, fleet: Path) -> None:
+        state = await read(fleet / "envs" / "prod")
+
+        assert state.files_count == 2
+        assert {s["lineage"] for s in state.states} == {"prod", "blue"}
+        assert state.resources_count == 5
+
+    @pytest.mark.asyncio
+    async def test_recursive_glob(self, fleet: Path) -> None:
+        state = await read(fleet / "**" / "terraform.tfstate")
+
+        assert state.files_count == 3
+        assert state.state_files_size == sum(s["state_file_size"] for s in state.states)
+
+    @pytest.mark.asyncio
+    async def test_matches_state_info_counts(self, fleet: Path) -> None:
+        from tofusoup.tf.components.data_sources.state_info import StateInfoConfig, StateInfoDataSource
+
+        path = fleet / "envs" / "prod" / "terraform.tfstate"
+        info = await StateInfoDataSource().read(ResourceContext(config=StateInfoConfig(state_path=str(path))))
+        (entry,) = (await read(path)).states
+
+        for name in ("version", "serial", "lineage", "resources_count", "modules_count", "state_file_modified"):
+            assert entry[name] == getattr(info, name)
+
+    @pytest.mark.asyncio
+    async def test_no_matches_is_empty(self, tmp_path: Path) -> None:
+        state = await read(tmp_path / "missing" / "*.tfstate")
+
+        assert state.files_count == 0
+        assert state.resources_count == 0
+        assert state.states == []
+
+    @pytest.mark.asyncio
+    async def test_bad_file_reported_per_entry(self, fleet: Path) -> None:
+        (fleet / "envs" / "dev" / "terraform.tfstate").write_text("{not json")
+
+        state = await read(fleet / "envs")
+
+        assert state.files_count == 3
+        assert state.errors_count == 1
+        broken = next(s for s in state.states if s["error"] is not None)
+        assert broken["error"].startswith("Invalid JSON in state file")
+        assert broken["resources_count"] is None
+        assert state.resources_count == 5
+
+
+class TestStateInventoryCaching:
+    """Unchanged files are not read again."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_skipped(self, fleet: Path, count_reads: list[Path]) -> None:
+        first = await read(fleet / "envs")
+        hits = summary_cache().stats.hits
+        second = await read(fleet / "envs")
+
+        assert second == first
+        assert len(count_reads) == 3
+        assert summary_cache().stats.hits == hits + 3
+
+    @pytest.mark.asyncio
+    async def test_parsed_documents_are_not_cached(self, fleet: Path) -> None:
+        state = await read(fleet / "envs")
+
+        assert state.files_count == 3
+        assert len(loader.state_cache()) == 0
+        assert len(summary_cache()) == 3
+
+    @pytest.mark.asyncio
+    async def test_changed_file_read_again(self, fleet: Path, count_reads: list[Path]) -> None:
+        await read(fleet / "envs")
+        changed = write_state(fleet / "envs" / "dev" / "terraform.tfstate", resources=7, serial=2)
+        os.utime(changed, ns=(1, 1))
+
+        state = await read(fleet / "envs")
+
+        assert count_reads[3:] == [changed]
+        assert state.resources_count == 12
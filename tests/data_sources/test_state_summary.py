@@ -0,0 +1,151 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the state_summary data source."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_summary import (
+    StateSummaryConfig,
+    StateSummaryDataSource,
+    StateSummaryState,
+)
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.aggregate import resource_histogram
+
+AWS = 'provider["registry.terraform.io/hashicorp/aws"]'
+NULL = 'provider["registry.terraform.io/hashicorp/null"]'
+
+RESOURCES = [
+    {"mode": "managed", "type": "aws_instance", "name": "web", "provider": AWS, "instances": [{}, {}, {}]},
+    {"mode": "data", "type": "aws_ami", "name": "ubuntu", "provider": AWS, "instances": [{}]},
+    {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "node",
+        "module": "module.cluster",
+        "provider": AWS,
+        "instances": [{}, {}],
+    },
+    {"mode": "managed", "type": "null_resource", "name": "n", "module": "module.cluster", "provider": NULL},
+]
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    path = tmp_path / "terraform.tfstate"
+    path.write_text(json.dumps({"version": 4, "outputs": {}, "resources": RESOURCES}))
+    loader.state_cache().clear()
+    return path
+
+
+async def read(path: Path, **settings: Any) -> StateSummaryState:
+    return await StateSummaryDataSource().read(
+        ResourceContext(config=StateSummaryConfig(state_path=str(path), **settings))
+    )
+
+
+class TestResourceHistogram:
+    """Unit tests for resource_histogram."""
+
+    def test_counts_every_dimension(self) -> None:
+        histogram = resource_histogram(RESOURCES)
+
+        assert histogram.resources_count == 4
+        assert histogram.instances_count == 6
+        assert histogram.counts("mode") == {"data": 1, "managed": 3}
+        assert histogram.counts("type") == {"aws_ami": 1, "aws_instance": 2, "null_resource": 1}
+        assert histogram.counts("provider") == {AWS: 3, NULL: 1}
+        assert histogram.counts("module") == {"module.cluster": 2, "root": 2}
+        assert histogram.instance_counts() == {"aws_ami": 1, "aws_instance": 5, "null_resource": 0}
+
+    def test_only_requested_dimensions(self) -> None:
+        histogram = resource_histogram(RESOURCES, group_by=["module"])
+
+        assert histogram.counts("module") == {"module.cluster": 2, "root": 2}
+        assert histogram.counts("type") is None
+        assert histogram.instance_counts() is None
+        assert histogram.instances_count == 6
+
+
+class TestStateSummarySchema:
+    """Structure of the state_summary data source."""
+
+    def test_classes_are_set(self) -> None:
+        assert StateSummaryDataSource.config_class == StateSummaryConfig
+        assert StateSummaryDataSource.state_class == StateSummaryState
+
+    def test_schema_attributes(self) -> None:
+        attrs = StateSummaryDataSource.get_schema().block.attributes
+
+        assert attrs["state_path"].required is True
+        for name in ("resources_count", "instances_count", "resources_by_type", "instances_by_type"):
+            assert attrs[name].computed is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("settings", "message"),
+        [
+            ({"state_path": ""}, "'state_path' is required and cannot be empty."),
+            ({"filter_mode": "other"}, "'filter_mode' must be either 'managed' or 'data'."),
+            (
+                {"group_by": ["name"]},
+                "'group_by' entry 'name' must be one of 'mode', 'type', 'provider' or 'module'.",
+            ),
+        ],
+    )
+    async def test_validation(self, settings: dict[str, Any], message: str) -> None:
+        config = StateSummaryConfig(**{"state_path": "terraform.tfstate", **settings})
+        assert await StateSummaryDataSource()._validate_config(config) == [message]
+
+
+class TestStateSummaryRead:
+    """Reading grouped counts from a state file."""
+
+    @pytest.mark.asyncio
+    async def test_all_dimensions(self, state_file: Path) -> None:
+        state = await read(state_file)
+
+        assert state.resources_count == 4
+        assert state.instances_count == 6
+        assert state.resources_by_mode == {"data": 1, "managed": 3}
+        assert state.resources_by_provider == {AWS: 3, NULL: 1}
+        assert state.resources_by_module == {"module.cluster": 2, "root": 2}
+        assert state.instances_by_type == {"aws_ami": 1, "aws_instance": 5, "null_resource": 0}
+
+    @pytest.mark.asyncio
+    async def test_filters_and_group_by(self, state_file: Path) -> None:
+        state = await read(state_file, filter_mode="managed", group_by=["type"])
+
+        assert state.group_by == ["type"]
+        assert state.resources_count == 3
+        assert state.resources_by_type == {"aws_instance": 2, "null_resource": 1}
+        assert state.resources_by_module is None
+        assert state.resources_by_provider is None
+
+    @pytest.mark.asyncio
+    async def test_streamed_matches_parsed(self, state_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        parsed = await read(state_file, filter_module="module.cluster")
+
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        loader.state_cache().clear()
+        streamed = await read(state_file, filter_module="module.cluster")
+
+        assert streamed == parsed
+        assert streamed.resources_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text('{"version": 4, "resources": [')
+
+        with pytest.raises(DataSourceError, match="Invalid JSON"):
+            await read(path)
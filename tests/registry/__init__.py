@@ -0,0 +1 @@
+"""Tests for the shared registry access helpers."""
@@ -0,0 +1,160 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the on-disk registry response cache."""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.provider_info import ProviderInfoConfig, ProviderInfoDataSource
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.registry.cache import RegistryCache, cache_key
+
+REGISTRY_URL = "https://registry.terraform.io"
+
+
+class TestRegistryCache:
+    """Unit tests for RegistryCache."""
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1024 * 1024)
+        assert cache.get(REGISTRY_URL, "list_provider_versions", {"provider_id": "hashicorp/aws"}) is None
+
+    def test_set_then_get_round_trips_payload(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1024 * 1024)
+        payload = [{"version": "6.8.0", "protocols": ["6"], "platforms": []}]
+
+        cache.set(REGISTRY_URL, "list_provider_versions", {"provider_id": "hashicorp/aws"}, payload)
+
+        assert cache.get(REGISTRY_URL, "list_provider_versions", {"provider_id": "hashicorp/aws"}) == payload
+
+    def test_key_depends_on_registry_endpoint_and_params(self) -> None:
+        base = cache_key(REGISTRY_URL, "list_modules", {"query": "vpc"})
+        assert base == cache_key(REGISTRY_URL + "/", "list_modules", {"query": "vpc"})
+        assert base != cache_key("https://registry.opentofu.org", "list_modules", {"query": "vpc"})
+        assert base != cache_key(REGISTRY_URL, "search", {"query": "vpc"})
+        assert base != cache_key(REGISTRY_URL, "list_modules", {"query": "eks"})
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=0, max_size_bytes=1024 * 1024)
+        cache.set(REGISTRY_URL, "get_provider_details", {"namespace": "hashicorp", "name": "aws"}, {"version": "1"})
+
+        assert cache.get(REGISTRY_URL, "get_provider_details", {"namespace": "hashicorp", "name": "aws"}) is None
+        assert list(tmp_path.glob("*/*.json")) == []
+
+    def test_corrupt_entry_is_discarded(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1024 * 1024)
+        cache.set(REGISTRY_URL, "list_modules", {"query": "vpc"}, [{"id": "a"}])
+        (entry,) = tmp_path.glob("*/*.json")
+        entry.write_text("{not json")
+
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "vpc"}) is None
+        assert not entry.exists()
+
+    def test_writes_leave_no_temporary_files(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1024 * 1024)
+        for i in range(5):
+            cache.set(REGISTRY_URL, "list_modules", {"query": f"q{i}"}, [{"id": i}])
+
+        assert list(tmp_path.rglob(".tmp-*")) == []
+        assert len(list(tmp_path.glob("*/*.json"))) == 5
+
+    def test_eviction_removes_least_recently_used(self, tmp_path: Path) -> None:
+        payload = [{"blob": "x" * 400}]
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1500)
+        for i in range(3):
+            cache.set(REGISTRY_URL, "list_modules", {"query": f"q{i}"}, payload)
+            path = cache._entry_path(cache_key(REGISTRY_URL, "list_modules", {"query": f"q{i}"}))
+            os.utime(path, (1000 + i, 1000 + i))
+
+        # Touch q0 so q1 becomes the least recently used entry.
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "q0"}) == payload
+        cache.set(REGISTRY_URL, "list_modules", {"query": "q3"}, payload)
+
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "q1"}) is None
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "q0"}) == payload
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "q3"}) == payload
+        assert sum(p.stat().st_size for p in tmp_path.glob("*/*.json")) <= 1500
+
+    def test_clear_removes_all_entries(self, tmp_path: Path) -> None:
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=1024 * 1024)
+        cache.set(REGISTRY_URL, "list_modules", {"query": "vpc"}, [{"id": "a"}])
+
+        cache.clear()
+
+        assert cache.get(REGISTRY_URL, "list_modules", {"query": "vpc"}) is None
+
+    def test_only_shard_directories_hold_entries(self, tmp_path: Path) -> None:
+        foreign = tmp_path / "state-index" / "index.json"
+        foreign.parent.mkdir()
+        foreign.write_text("{}")
+        cache = RegistryCache(tmp_path, ttl_seconds=60, max_size_bytes=64)
+
+        cache.set(REGISTRY_URL, "list_modules", {"query": "vpc"}, ["x" * 10])
+        cache.set(REGISTRY_URL, "list_modules", {"query": "eks"}, ["y" * 10])
+        cache.clear()
+
+        assert foreign.read_text() == "{}"
+
+
+class TestProviderRegistryCache:
+    """Tests for the provider-owned cache used by the registry data sources."""
+
+    def test_cache_uses_provider_config(
+        self, configured_provider: Callable[..., TofuSoupProvider], tmp_path: Path
+    ) -> None:
+        provider = configured_provider(cache_dir=str(tmp_path / "custom"), cache_ttl_hours=2, cache_max_size_mb=1)
+
+        cache = provider.registry_cache
+
+        assert cache is not None
+        assert cache.cache_dir == tmp_path / "custom" / "registry"
+        assert cache.ttl_seconds == 7200
+        assert cache.max_size_bytes == 1024 * 1024
+
+    def test_zero_ttl_disables_cache(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        provider = configured_provider(cache_ttl_hours=0)
+        assert provider.registry_cache is None
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache(
+        self,
+        configured_provider: Callable[..., TofuSoupProvider],
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        configured_provider()
+        httpx_mock.add_response(
+            url="https://registry.terraform.io/v1/providers/hashicorp/aws",
+            json={"namespace": "hashicorp", "name": "aws", "version": "5.31.0"},
+        )
+        ds = ProviderInfoDataSource()
+        ctx = ResourceContext(config=ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform"))
+
+        first = await ds.read(ctx)
+        second = await ds.read(ctx)
+
+        assert first == second
+        assert second.latest_version == "5.31.0"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_responses_are_not_cached(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        provider = configured_provider()
+        httpx_mock.add_response(url="https://registry.terraform.io/v1/providers/hashicorp/missing", status_code=404)
+        ds = ProviderInfoDataSource()
+        ctx = ResourceContext(config=ProviderInfoConfig(namespace="hashicorp", name="missing", registry="terraform"))
+
+        with pytest.raises(Exception, match="not found"):
+            await ds.read(ctx)
+
+        assert provider.registry_cache is not None
+        assert list(provider.registry_cache.cache_dir.glob("*/*.json")) == []
@@ -0,0 +1,158 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for configured registry URLs, mirror selection and failover."""
+
+from collections.abc import Callable
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.provider_info import ProviderInfoConfig, ProviderInfoDataSource
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.registry.mirrors import MirrorSelector
+from tofusoup.tf.components.registry.query import registry_urls
+
+PRIMARY = "https://registry.internal.example.com"
+MIRROR = "https://mirror.internal.example.com"
+DETAILS = {"namespace": "hashicorp", "name": "aws", "version": "5.31.0"}
+
+
+def _provider_info_context() -> ResourceContext:
+    return ResourceContext(config=ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform"))
+
+
+class TestMirrorSelector:
+    """Unit tests for MirrorSelector ordering."""
+
+    def test_unmeasured_mirrors_keep_configured_order(self) -> None:
+        selector = MirrorSelector()
+        assert selector.order([PRIMARY, MIRROR]) == [PRIMARY, MIRROR]
+
+    def test_fastest_mirror_goes_first(self) -> None:
+        selector = MirrorSelector()
+        selector.record_success(PRIMARY, 0.200)
+        selector.record_success(MIRROR, 0.005)
+
+        assert selector.order([PRIMARY, MIRROR]) == [MIRROR, PRIMARY]
+
+    def test_latency_is_smoothed(self) -> None:
+        selector = MirrorSelector(smoothing=0.5)
+        selector.record_success(PRIMARY, 0.100)
+        selector.record_success(PRIMARY, 0.300)
+
+        assert selector.stats(PRIMARY).latency == pytest.approx(0.200)
+        assert selector.stats(PRIMARY).successes == 2
+
+    def test_recently_failed_mirror_goes_last(self) -> None:
+        selector = MirrorSelector()
+        selector.record_success(PRIMARY, 0.001)
+        selector.record_success(MIRROR, 0.100)
+        selector.record_failure(PRIMARY)
+
+        assert selector.order([PRIMARY, MIRROR]) == [MIRROR, PRIMARY]
+
+    def test_failed_mirror_recovers_after_cooldown(self) -> None:
+        selector = MirrorSelector(failure_cooldown=0.0)
+        selector.record_success(PRIMARY, 0.001)
+        selector.record_success(MIRROR, 0.100)
+        selector.record_failure(PRIMARY)
+
+        assert selector.order([PRIMARY, MIRROR]) == [PRIMARY, MIRROR]
+
+    def test_cooled_mirror_without_latency_goes_after_measured(self) -> None:
+        selector = MirrorSelector(failure_cooldown=0.0)
+        selector.record_failure(PRIMARY)
+        selector.record_success(MIRROR, 0.100)
+
+        assert selector.order([PRIMARY, MIRROR]) == [MIRROR, PRIMARY]
+
+
+class TestConfiguredRegistryUrls:
+    """Tests for routing provider configuration through to the data sources."""
+
+    def test_defaults_without_provider(self) -> None:
+        assert registry_urls("terraform") == ["https://registry.terraform.io"]
+        assert registry_urls("opentofu") == ["https://registry.opentofu.org"]
+
+    def test_provider_urls_and_mirrors(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        configured_provider(
+            terraform_registry_url=PRIMARY + "/",
+            terraform_registry_mirrors=[MIRROR, PRIMARY],
+            opentofu_registry_url="https://tofu.internal.example.com",
+        )
+
+        assert registry_urls("terraform") == [PRIMARY, MIRROR]
+        assert registry_urls(None) == [PRIMARY, MIRROR]
+        assert registry_urls("opentofu") == ["https://tofu.internal.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_read_uses_configured_registry_url(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        configured_provider(cache_ttl_hours=0, terraform_registry_url=PRIMARY)
+        httpx_mock.add_response(url=f"{PRIMARY}/v1/providers/hashicorp/aws", json=DETAILS)
+
+        result = await ProviderInfoDataSource().read(_provider_info_context())
+
+        assert result.latest_version == "5.31.0"
+
+    @pytest.mark.asyncio
+    async def test_fails_over_on_server_error(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        provider = configured_provider(
+            cache_ttl_hours=0, terraform_registry_url=PRIMARY, terraform_registry_mirrors=[MIRROR]
+        )
+        httpx_mock.add_response(url=f"{PRIMARY}/v1/providers/hashicorp/aws", status_code=503)
+        httpx_mock.add_response(url=f"{MIRROR}/v1/providers/hashicorp/aws", json=DETAILS)
+
+        result = await ProviderInfoDataSource().read(_provider_info_context())
+
+        assert result.latest_version == "5.31.0"
+        assert provider.registry_pool.selector.stats(PRIMARY).failures == 1
+        assert provider.registry_pool.selector.order([PRIMARY, MIRROR]) == [MIRROR, PRIMARY]
+
+    @pytest.mark.asyncio
+    async def test_fails_over_on_connection_error(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        configured_provider(cache_ttl_hours=0, terraform_registry_url=PRIMARY, terraform_registry_mirrors=[MIRROR])
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=f"{PRIMARY}/v1/providers/hashicorp/aws")
+        httpx_mock.add_response(url=f"{MIRROR}/v1/providers/hashicorp/aws", json=DETAILS)
+
+        result = await ProviderInfoDataSource().read(_provider_info_context())
+
+        assert result.latest_version == "5.31.0"
+
+    @pytest.mark.asyncio
+    async def test_not_found_does_not_fail_over(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        configured_provider(cache_ttl_hours=0, terraform_registry_url=PRIMARY, terraform_registry_mirrors=[MIRROR])
+        httpx_mock.add_response(url=f"{PRIMARY}/v1/providers/hashicorp/aws", status_code=404)
+
+        with pytest.raises(Exception, match="not found"):
+            await ProviderInfoDataSource().read(_provider_info_context())
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_prefers_fastest_mirror(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        provider = configured_provider(
+            cache_ttl_hours=0, terraform_registry_url=PRIMARY, terraform_registry_mirrors=[MIRROR]
+        )
+        provider.registry_pool.selector.record_success(PRIMARY, 0.200)
+        provider.registry_pool.selector.record_success(MIRROR, 0.005)
+        httpx_mock.add_response(url=f"{MIRROR}/v1/providers/hashicorp/aws", json=DETAILS)
+
+        result = await ProviderInfoDataSource().read(_provider_info_context())
+
+        assert result.latest_version == "5.31.0"
+        assert str(httpx_mock.get_requests()[0].url).startswith(MIRROR)
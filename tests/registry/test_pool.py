@@ -0,0 +1,98 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the provider-scoped registry client pool."""
+
+from collections.abc import Callable
+
+import pytest
+from pytest_httpx import HTTPXMock
+from pyvider.resources.context import ResourceContext  # type: ignore
+from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
+from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
+
+from tofusoup.tf.components.data_sources.provider_versions import (
+    ProviderVersionsConfig,
+    ProviderVersionsDataSource,
+)
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.registry.pool import RegistryClientPool
+
+TERRAFORM_URL = "https://registry.terraform.io"
+OPENTOFU_URL = "https://registry.opentofu.org"
+
+
+class TestRegistryClientPool:
+    """Unit tests for RegistryClientPool."""
+
+    @pytest.mark.asyncio
+    async def test_same_url_shares_one_http_client(self) -> None:
+        pool = RegistryClientPool()
+
+        first = pool.get(IBMTerraformRegistry, TERRAFORM_URL)
+        second = pool.get(IBMTerraformRegistry, TERRAFORM_URL)
+
+        assert first is second
+        assert first._client is pool.http_client(TERRAFORM_URL)
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_different_urls_get_separate_clients(self) -> None:
+        pool = RegistryClientPool()
+
+        terraform = pool.get(IBMTerraformRegistry, TERRAFORM_URL)
+        opentofu = pool.get(OpenTofuRegistry, OPENTOFU_URL)
+
+        assert terraform._client is not opentofu._client
+        assert str(opentofu._client.base_url).rstrip("/") == OPENTOFU_URL
+        await pool.aclose()
+
+    def test_max_connections_is_applied(self) -> None:
+        pool = RegistryClientPool(max_connections=3)
+
+        assert pool.limits.max_connections == 3
+        assert pool.limits.max_keepalive_connections == 3
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_and_recreates_on_demand(self) -> None:
+        pool = RegistryClientPool()
+        client = pool.http_client(TERRAFORM_URL)
+
+        await pool.aclose()
+
+        assert client.is_closed
+        replacement = pool.get(IBMTerraformRegistry, TERRAFORM_URL)._client
+        assert replacement is not client
+        assert not replacement.is_closed
+        await pool.aclose()
+
+
+class TestProviderRegistryPool:
+    """Tests for pooled clients used by registry data sources."""
+
+    @pytest.mark.asyncio
+    async def test_reads_reuse_the_pooled_client(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        provider = configured_provider(cache_ttl_hours=0, registry_max_connections=4)
+        httpx_mock.add_response(
+            url="https://registry.terraform.io/v1/providers/hashicorp/aws/versions",
+            json={"versions": [{"version": "6.8.0", "protocols": ["6"], "platforms": []}]},
+            is_reusable=True,
+        )
+        ds = ProviderVersionsDataSource()
+        ctx = ResourceContext(config=ProviderVersionsConfig(namespace="hashicorp", name="aws", registry="terraform"))
+
+        await ds.read(ctx)
+        client = provider.registry_pool.http_client(TERRAFORM_URL)
+        result = await ds.read(ctx)
+
+        assert result.version_count == 1
+        assert len(httpx_mock.get_requests()) == 2
+        assert provider.registry_pool.http_client(TERRAFORM_URL) is client
+        assert not client.is_closed
+        assert provider.registry_pool.limits.max_connections == 4
+        await provider.shutdown()
+        assert client.is_closed
@@ -0,0 +1,155 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for in-flight registry request coalescing."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.provider_versions import (
+    ProviderVersionsConfig,
+    ProviderVersionsDataSource,
+)
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.registry.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Unit tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def call() -> list[str]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ["6.8.0"]
+
+        tasks = [asyncio.create_task(flight.do("aws", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.inflight == 1
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [["6.8.0"]] * 5
+        assert calls == 1
+        assert flight.stats.executed == 1
+        assert flight.stats.coalesced == 4
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self) -> None:
+        flight = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(flight.do("a", call), flight.do("b", call))
+
+        assert flight.stats.executed == 2
+        assert flight.stats.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self) -> None:
+        flight = SingleFlight()
+
+        async def call() -> int:
+            return 1
+
+        await flight.do("a", call)
+        await flight.do("a", call)
+
+        assert flight.stats.executed == 2
+        assert flight.stats.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_with_waiters(self) -> None:
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call() -> int:
+            await release.wait()
+            raise RuntimeError("registry unavailable")
+
+        tasks = [asyncio.create_task(flight.do("a", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_waiters(self) -> None:
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call() -> list[str]:
+            await release.wait()
+            return ["6.8.0"]
+
+        leader = asyncio.create_task(flight.do("aws", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("aws", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == ["6.8.0"]
+        assert leader.cancelled()
+        assert flight.stats.executed == 1
+        assert flight.inflight == 0
+
+    @pytest.mark.asyncio
+    async def test_abandoned_call_fails_waiters_with_an_error(self) -> None:
+        flight = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.Event().wait()
+            return 1
+
+        waiters = [asyncio.create_task(flight.do("a", call)) for _ in range(2)]
+        await asyncio.sleep(0)
+        flight._inflight["a"].cancel()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.inflight == 0
+
+
+class TestProviderSingleFlight:
+    """Tests for coalescing identical registry data source reads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_reads_issue_one_request(
+        self, configured_provider: Callable[..., TofuSoupProvider], httpx_mock: HTTPXMock
+    ) -> None:
+        provider = configured_provider(cache_ttl_hours=0)
+
+        async def slow_versions(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"versions": [{"version": "6.8.0", "protocols": ["6"], "platforms": []}]})
+
+        httpx_mock.add_callback(slow_versions, url="https://registry.terraform.io/v1/providers/hashicorp/aws/versions")
+        ds = ProviderVersionsDataSource()
+        ctx = ResourceContext(config=ProviderVersionsConfig(namespace="hashicorp", name="aws", registry="terraform"))
+
+        results = await asyncio.gather(*(ds.read(ctx) for _ in range(5)))
+
+        assert all(r.version_count == 1 for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+        assert provider.registry_singleflight.stats.executed == 1
+        assert provider.registry_singleflight.stats.coalesced == 4
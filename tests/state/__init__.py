@@ -0,0 +1 @@
+"""Tests for the shared state file access helpers."""
@@ -0,0 +1,119 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the structural state diff."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.diff import attributes_digest, diff_states, instance_address
+
+
+def write_state(path: Path, resources: list[dict[str, Any]], indent: int | None = None) -> Path:
+    path.write_text(json.dumps({"version": 4, "resources": resources}, indent=indent))
+    return path
+
+
+OLD = [
+    {
+        "mode": "managed",
+        "type": "aws_vpc",
+        "name": "main",
+        "instances": [{"attributes": {"id": "vpc-1", "cidr": "10/8"}}],
+    },
+    {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "web",
+        "instances": [
+            {"index_key": 0, "attributes": {"id": "i-0", "tags": {"a": "1", "b": "2"}}},
+            {"index_key": 1, "attributes": {"id": "i-1"}},
+        ],
+    },
+    {"mode": "data", "type": "aws_ami", "name": "ubuntu", "instances": [{"attributes": {"id": "ami-1"}}]},
+]
+
+NEW = [
+    # Same attributes, different key order: unchanged.
+    {
+        "mode": "managed",
+        "type": "aws_vpc",
+        "name": "main",
+        "instances": [{"attributes": {"cidr": "10/8", "id": "vpc-1"}}],
+    },
+    {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "web",
+        "instances": [
+            {"index_key": 0, "attributes": {"id": "i-0", "tags": {"a": "1", "b": "3"}}},
+            {"index_key": 2, "attributes": {"id": "i-2"}},
+        ],
+    },
+    {
+        "mode": "managed",
+        "type": "aws_s3_bucket",
+        "name": "logs",
+        "module": "module.app",
+        "instances": [{"index_key": "eu", "attributes": {"id": "logs-eu"}}],
+    },
+]
+
+
+class TestInstanceAddress:
+    """Instance addresses follow Terraform's syntax."""
+
+    @pytest.mark.parametrize(
+        ("resource", "instance", "address"),
+        [
+            (OLD[0], {}, "aws_vpc.main"),
+            (OLD[1], {"index_key": 1}, "aws_instance.web[1]"),
+            (NEW[2], {"index_key": "eu"}, 'module.app.aws_s3_bucket.logs["eu"]'),
+            (OLD[2], {}, "data.aws_ami.ubuntu"),
+            (OLD[0], {"deposed": "00abc"}, "aws_vpc.main (deposed 00abc)"),
+        ],
+    )
+    def test_address(self, resource: dict[str, Any], instance: dict[str, Any], address: str) -> None:
+        assert instance_address(resource, instance) == address
+
+
+class TestAttributesDigest:
+    """Digests depend on content, not on key order."""
+
+    def test_canonical(self) -> None:
+        assert attributes_digest({"a": 1, "b": [1, {"y": 2, "x": 1}]}) == attributes_digest(
+            {"b": [1, {"x": 1, "y": 2}], "a": 1}
+        )
+        assert attributes_digest({"a": 1}) != attributes_digest({"a": 2})
+        assert len(attributes_digest(None)) == 16
+
+
+class TestDiffStates:
+    """diff_states reports added, removed and changed instances."""
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_diff(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, streamed: bool) -> None:
+        if streamed:
+            monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        old = write_state(tmp_path / "old.tfstate", OLD)
+        new = write_state(tmp_path / "new.tfstate", NEW, indent=2)
+
+        diff = diff_states(old, new)
+
+        assert diff.added == ["aws_instance.web[2]", 'module.app.aws_s3_bucket.logs["eu"]']
+        assert diff.removed == ["aws_instance.web[1]", "data.aws_ami.ubuntu"]
+        assert diff.changed == ["aws_instance.web[0]"]
+        assert diff.unchanged_count == 1
+
+    def test_identical(self, tmp_path: Path) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", OLD)
+        diff = diff_states(path, path)
+
+        assert diff.added == diff.removed == diff.changed == []
+        assert diff.unchanged_count == 4
@@ -0,0 +1,197 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the state dependency graph."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tofusoup.tf.components.state import graph as graph_module
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.graph import (
+    build_graph,
+    graph_cache,
+    read_graph,
+    resource_dependency_address,
+    resource_graph_address,
+    strip_instance_keys,
+)
+
+
+def resource(address: str, *depends_on: str, mode: str = "managed", module: str | None = None) -> dict[str, Any]:
+    type_, name = address.split(".")
+    entry: dict[str, Any] = {
+        "mode": mode,
+        "type": type_,
+        "name": name,
+        "instances": [{"attributes": {}, "dependencies": list(depends_on)}],
+    }
+    if module:
+        entry["module"] = module
+    return entry
+
+
+# vpc <- subnet <- instance <- eip; ami (data) <- instance; a module resource depends on the subnet.
+RESOURCES = [
+    resource("aws_eip.ip", "aws_instance.web"),
+    resource("aws_instance.web", "aws_subnet.a", "data.aws_ami.ubuntu", "aws_gone.missing"),
+    resource("aws_subnet.a", "aws_vpc.main"),
+    resource("aws_vpc.main"),
+    resource("aws_ami.ubuntu", mode="data"),
+    resource("aws_route.r", "aws_subnet.a", module="module.net"),
+]
+
+
+def names(graph: Any, nodes: Any) -> list[str]:
+    return [graph.addresses[node] for node in nodes]
+
+
+class TestResourceDependencyAddress:
+    """Addresses match the ones Terraform writes in ``dependencies``."""
+
+    @pytest.mark.parametrize(
+        ("entry", "address"),
+        [
+            (resource("aws_vpc.main"), "aws_vpc.main"),
+            (resource("aws_ami.ubuntu", mode="data"), "data.aws_ami.ubuntu"),
+            (resource("aws_route.r", module="module.net"), "module.net.aws_route.r"),
+            (resource("aws_ami.u", mode="data", module='module.x["a"]'), "module.x.data.aws_ami.u"),
+            (resource("aws_vpc.main", module='module.a[0].module.b["k]"]'), "module.a.module.b.aws_vpc.main"),
+        ],
+    )
+    def test_address(self, entry: dict[str, Any], address: str) -> None:
+        assert resource_dependency_address(entry) == address
+
+    def test_graph_address_keeps_instance_keys(self) -> None:
+        entry = resource("aws_ami.u", mode="data", module='module.x["a"]')
+
+        assert resource_graph_address(entry) == 'module.x["a"].data.aws_ami.u'
+        assert strip_instance_keys(resource_graph_address(entry)) == resource_dependency_address(entry)
+
+
+class TestStateGraph:
+    """Adjacency, transitive queries and ordering."""
+
+    def test_adjacency_both_directions(self) -> None:
+        graph = build_graph(RESOURCES)
+        web = graph.node("aws_instance.web")
+
+        assert names(graph, graph.dependencies(web)) == ["aws_subnet.a", "data.aws_ami.ubuntu"]
+        assert names(graph, graph.dependents(web)) == ["aws_eip.ip"]
+        assert graph.edges_count == 5
+        assert graph.node("aws_gone.missing") is None
+
+    def test_transitive_queries(self) -> None:
+        graph = build_graph(RESOURCES)
+        vpc = graph.node("aws_vpc.main")
+        eip = graph.node("aws_eip.ip")
+
+        assert names(graph, graph.transitive_dependents(vpc)) == [
+            "aws_eip.ip",
+            "aws_instance.web",
+            "aws_subnet.a",
+            "module.net.aws_route.r",
+        ]
+        assert names(graph, graph.transitive_dependencies(eip)) == [
+            "aws_instance.web",
+            "aws_subnet.a",
+            "aws_vpc.main",
+            "data.aws_ami.ubuntu",
+        ]
+
+    def test_topological_order(self) -> None:
+        graph = build_graph(RESOURCES)
+        order, has_cycles = graph.topological_order()
+
+        assert not has_cycles
+        assert names(graph, order) == [
+            "aws_vpc.main",
+            "aws_subnet.a",
+            "data.aws_ami.ubuntu",
+            "aws_instance.web",
+            "aws_eip.ip",
+            "module.net.aws_route.r",
+        ]
+
+    def test_cycles_come_last(self) -> None:
+        graph = build_graph(
+            [
+                resource("a.x", "b.y"),
+                resource("b.y", "a.x"),
+                resource("c.z", "a.x"),
+                resource("d.w"),
+                resource("e.v", "e.v"),
+            ]
+        )
+        order, has_cycles = graph.topological_order()
+
+        assert has_cycles
+        assert names(graph, order) == ["d.w", "e.v", "a.x", "b.y", "c.z"]
+
+    def test_dependencies_merged_across_instances(self) -> None:
+        counted = resource("aws_instance.web")
+        counted["instances"] = [{"dependencies": ["aws_vpc.main"]}, {"dependencies": ["aws_subnet.a", "aws_vpc.main"]}]
+        graph = build_graph([counted, resource("aws_subnet.a"), resource("aws_vpc.main")])
+
+        assert names(graph, graph.dependencies(0)) == ["aws_subnet.a", "aws_vpc.main"]
+
+    def test_module_instances_match_config_addresses(self) -> None:
+        graph = build_graph(
+            [
+                resource("aws_vpc.main", module="module.net[0]"),
+                resource("aws_vpc.main", module="module.net[1]"),
+                resource("aws_subnet.a", "module.net.aws_vpc.main", module="module.net[0]"),
+                resource("aws_instance.web", "module.net.aws_subnet.a"),
+            ]
+        )
+        web = graph.node("aws_instance.web")
+        order, has_cycles = graph.topological_order()
+
+        assert graph.edges_count == 3
+        assert not has_cycles
+        assert names(graph, graph.transitive_dependencies(web)) == [
+            "module.net[0].aws_vpc.main",
+            "module.net[1].aws_vpc.main",
+            "module.net[0].aws_subnet.a",
+        ]
+        assert names(graph, order)[-1] == "aws_instance.web"
+
+
+class TestReadGraph:
+    """Graphs are read in one pass and cached per version of the file."""
+
+    @pytest.fixture
+    def state_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text(json.dumps({"version": 4, "serial": 1, "resources": RESOURCES}))
+        graph_cache().clear()
+        loader.state_cache().clear()
+        return path
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_matches_build_graph(self, state_file: Path, monkeypatch: pytest.MonkeyPatch, streamed: bool) -> None:
+        if streamed:
+            monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        assert read_graph(state_file) == build_graph(RESOURCES)
+
+    def test_cached_until_file_changes(self, state_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        builds: list[int] = []
+        real_build = graph_module.build_graph
+
+        def counting_build(resources: Any) -> Any:
+            builds.append(1)
+            return real_build(resources)
+
+        monkeypatch.setattr(graph_module, "build_graph", counting_build)
+        first = read_graph(state_file)
+        assert read_graph(state_file) is first
+        assert len(builds) == 1
+
+        state_file.write_text(json.dumps({"version": 4, "serial": 2, "resources": RESOURCES[:2]}))
+        assert len(read_graph(state_file).addresses) == 2
+        assert len(builds) == 2
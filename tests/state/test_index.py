@@ -0,0 +1,163 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the persistent state resource index."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_resources import StateResourcesConfig, StateResourcesDataSource
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.state import index as index_module
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.index import StateIndex
+
+RESOURCES = [
+    {"mode": "managed", "type": "aws_route53_record", "name": f"r{i}", "instances": [{"attributes": {"id": f"{i}"}}]}
+    for i in range(10)
+] + [
+    {"mode": "data", "type": "aws_route53_zone", "name": "zone", "module": "module.dns", "instances": []},
+    {"mode": "managed", "type": "aws_route53_record", "name": "mod", "module": "module.dns", "instances": []},
+]
+
+
+def write_state(path: Path, serial: int) -> Path:
+    path.write_text(json.dumps({"version": 4, "serial": serial, "lineage": "idx", "resources": RESOURCES}, indent=2))
+    return path
+
+
+@pytest.fixture
+def indexed_provider(
+    configured_provider: Callable[..., TofuSoupProvider], monkeypatch: pytest.MonkeyPatch
+) -> TofuSoupProvider:
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+    return configured_provider(state_index=True)
+
+
+@pytest.fixture
+def count_scans(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count full scans made while building an index."""
+    calls: list[int] = []
+    real_scan = index_module.scan_state
+
+    def counting_scan(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        return real_scan(*args, **kwargs)
+
+    monkeypatch.setattr(index_module, "scan_state", counting_scan)
+    return calls
+
+
+async def read(path: Path, **filters: Any) -> list[str]:
+    state = await StateResourcesDataSource().read(
+        ResourceContext(config=StateResourcesConfig(state_path=str(path), **filters))
+    )
+    return [r["name"] for r in state.resources]
+
+
+class TestStateIndex:
+    """Unit tests for StateIndex."""
+
+    def test_lookup_intersects_criteria(self) -> None:
+        index = StateIndex(serial=1, lineage="l", size=0, mtime_ns=0)
+        for position, resource in enumerate(RESOURCES):
+            index.add(resource, position * 10, position * 10 + 5)
+
+        assert index.lookup(type="aws_route53_zone") == [10]
+        assert index.lookup(type="aws_route53_record", module="module.dns") == [11]
+        assert index.lookup(mode="data", type="aws_route53_record") == []
+        assert len(index.lookup()) == len(RESOURCES)
+
+    def test_round_trips_through_dict(self) -> None:
+        index = StateIndex(serial=3, lineage="l", size=10, mtime_ns=20)
+        index.add(RESOURCES[0], 1, 9)
+
+        assert StateIndex.from_dict(json.loads(json.dumps(index.to_dict()))) == index
+
+
+class TestIndexedReads:
+    """state_resources builds, uses and refreshes the index."""
+
+    @pytest.mark.asyncio
+    async def test_index_built_then_used(
+        self, tmp_path: Path, indexed_provider: TofuSoupProvider, count_scans: list[int]
+    ) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", serial=1)
+
+        first = await read(path, filter_module="module.dns")
+        second = await read(path, filter_module="module.dns")
+        by_type = await read(path, filter_type="aws_route53_zone")
+
+        assert first == second == ["zone", "mod"]
+        assert by_type == ["zone"]
+        assert len(count_scans) == 1
+        assert len(list((tmp_path / "cache" / "state-index").glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_when_serial_changes(
+        self, tmp_path: Path, indexed_provider: TofuSoupProvider, count_scans: list[int]
+    ) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", serial=1)
+        await read(path, filter_type="aws_route53_zone")
+
+        write_state(path, serial=2)
+        assert await read(path, filter_type="aws_route53_zone") == ["zone"]
+
+        assert len(count_scans) == 2
+        (index_file,) = (tmp_path / "cache" / "state-index").glob("*.json")
+        assert json.loads(index_file.read_text())["serial"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_reads_do_not_use_index(
+        self, tmp_path: Path, indexed_provider: TofuSoupProvider, count_scans: list[int]
+    ) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", serial=1)
+
+        assert len(await read(path)) == len(RESOURCES)
+        assert count_scans == []
+
+    @pytest.mark.asyncio
+    async def test_paged_reads_build_then_seek(
+        self, tmp_path: Path, indexed_provider: TofuSoupProvider, count_scans: list[int]
+    ) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", serial=1)
+
+        names: list[str] = []
+        offset = 0
+        while offset is not None:
+            state = await StateResourcesDataSource().read(
+                ResourceContext(
+                    config=StateResourcesConfig(
+                        state_path=str(path), filter_type="aws_route53_record", limit=4, offset=offset
+                    )
+                )
+            )
+            names += [r["name"] for r in state.resources]
+            offset = state.next_offset
+
+        assert names == [f"r{i}" for i in range(10)] + ["mod"]
+        # The first page stops early but still finishes the scan that builds the index.
+        assert len(count_scans) == 1
+        assert len(list((tmp_path / "cache" / "state-index").glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self,
+        tmp_path: Path,
+        configured_provider: Callable[..., TofuSoupProvider],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        provider = configured_provider()
+        path = write_state(tmp_path / "terraform.tfstate", serial=1)
+
+        assert await read(path, filter_type="aws_route53_zone") == ["zone"]
+        assert provider.state_index is None
+        assert not (tmp_path / "cache" / "state-index").exists()
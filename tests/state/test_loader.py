@@ -0,0 +1,364 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the shared parsed-state cache."""
+
+import bz2
+import gzip
+import importlib
+import json
+import mmap
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.exceptions import DataSourceError  # type: ignore
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.codec import JsonCodec
+from tofusoup.tf.components.data_sources.state_info import StateInfoConfig, StateInfoDataSource
+from tofusoup.tf.components.data_sources.state_outputs import StateOutputsConfig, StateOutputsDataSource
+from tofusoup.tf.components.data_sources.state_resources import StateResourcesConfig, StateResourcesDataSource
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.loader import (
+    ParsedStateCache,
+    StateSignature,
+    detect_compression,
+    load_state,
+    open_state_source,
+    resolve_state_path,
+)
+
+STATE = {
+    "version": 4,
+    "terraform_version": "1.10.6",
+    "serial": 7,
+    "lineage": "loader-lineage",
+    "outputs": {"vpc_id": {"value": "vpc-123", "type": "string"}},
+    "resources": [
+        {"mode": "managed", "type": "aws_vpc", "name": "main", "instances": [{"attributes": {"id": "vpc-123"}}]},
+    ],
+}
+
+
+def write_state(path: Path, state: dict[str, Any]) -> Path:
+    path.write_text(json.dumps(state))
+    return path
+
+
+def signature(path: str, size: int, mtime_ns: int = 1) -> StateSignature:
+    return StateSignature(path=path, inode=1, size=size, mtime_ns=mtime_ns)
+
+
+@pytest.fixture
+def count_parses(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count full parses of state files."""
+    calls: list[int] = []
+    real_load = JsonCodec.load
+
+    def counting_load(self: JsonCodec, f: Any) -> Any:
+        calls.append(1)
+        return real_load(self, f)
+
+    monkeypatch.setattr(JsonCodec, "load", counting_load)
+    return calls
+
+
+class TestParsedStateCache:
+    """Unit tests for ParsedStateCache."""
+
+    def test_hit_requires_identical_signature(self) -> None:
+        cache = ParsedStateCache(max_size_bytes=1024)
+        cache.put(signature("/a", 10), {"serial": 1})
+
+        assert cache.get(signature("/a", 10)) == {"serial": 1}
+        assert cache.get(signature("/a", 10, mtime_ns=2)) is None
+        assert cache.get(signature("/a", 11)) is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    def test_evicts_least_recently_used_beyond_budget(self) -> None:
+        cache = ParsedStateCache(max_size_bytes=100)
+        cache.put(signature("/a", 40), "a")
+        cache.put(signature("/b", 40), "b")
+        cache.get(signature("/a", 40))
+        cache.put(signature("/c", 40), "c")
+
+        assert cache.get(signature("/b", 40)) is None
+        assert cache.get(signature("/a", 40)) == "a"
+        assert cache.get(signature("/c", 40)) == "c"
+        assert cache.size_bytes == 80
+        assert cache.stats.evictions == 1
+
+    def test_replacing_a_path_releases_its_budget(self) -> None:
+        cache = ParsedStateCache(max_size_bytes=100)
+        cache.put(signature("/a", 60), "old")
+        cache.put(signature("/a", 70, mtime_ns=2), "new")
+
+        assert len(cache) == 1
+        assert cache.size_bytes == 70
+
+    def test_documents_larger_than_budget_are_not_cached(self) -> None:
+        cache = ParsedStateCache(max_size_bytes=10)
+        cache.put(signature("/a", 11), "big")
+
+        assert len(cache) == 0
+
+
+class TestLoadState:
+    """Tests for load_state and resolve_state_path."""
+
+    def test_second_load_reuses_parsed_document(self, tmp_path: Path, count_parses: list[int]) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", STATE)
+
+        first, _ = load_state(path)
+        second, stat_result = load_state(path)
+
+        assert first is second
+        assert first == STATE
+        assert stat_result.st_size == path.stat().st_size
+        assert len(count_parses) == 1
+
+    def test_rewritten_file_is_parsed_again(self, tmp_path: Path, count_parses: list[int]) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", STATE)
+        load_state(path)
+
+        write_state(path, {**STATE, "serial": 8})
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        document, _ = load_state(path)
+
+        assert document["serial"] == 8
+        assert len(count_parses) == 2
+
+    def test_resolve_state_path_errors(self, tmp_path: Path) -> None:
+        with pytest.raises(DataSourceError, match="State file not found"):
+            resolve_state_path(str(tmp_path / "missing.tfstate"))
+        with pytest.raises(DataSourceError, match="Path is not a file"):
+            resolve_state_path(str(tmp_path))
+
+
+class TestSharedAcrossDataSources:
+    """The state data sources share one parse of the same file."""
+
+    @pytest.mark.asyncio
+    async def test_state_data_sources_parse_once(
+        self,
+        tmp_path: Path,
+        count_parses: list[int],
+        configured_provider: Callable[..., TofuSoupProvider],
+    ) -> None:
+        provider = configured_provider()
+        path = str(write_state(tmp_path / "terraform.tfstate", STATE))
+
+        resources = await StateResourcesDataSource().read(ResourceContext(config=StateResourcesConfig(state_path=path)))
+        outputs = await StateOutputsDataSource().read(ResourceContext(config=StateOutputsConfig(state_path=path)))
+        info = await StateInfoDataSource().read(ResourceContext(config=StateInfoConfig(state_path=path)))
+
+        assert info.serial == 7
+        assert resources.resource_count == 1
+        assert outputs.output_count == 1
+        assert len(count_parses) == 1
+        assert provider.state_cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_budget_disables_caching(
+        self,
+        tmp_path: Path,
+        count_parses: list[int],
+        configured_provider: Callable[..., TofuSoupProvider],
+    ) -> None:
+        configured_provider(state_cache_max_mb=0)
+        path = str(write_state(tmp_path / "terraform.tfstate", STATE))
+
+        config = StateOutputsConfig(state_path=path)
+        await StateOutputsDataSource().read(ResourceContext(config=config))
+        await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        assert len(count_parses) == 2
+
+
+class TestMemoryMappedStates:
+    """Uncompressed states are read through a read-only memory map."""
+
+    def test_streamed_state_is_mapped(self, mapped_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = write_state(mapped_dir / "terraform.tfstate", STATE)
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+        with open_state_source(path) as source:
+            stream = source.stream
+            assert isinstance(stream, mmap.mmap)
+            assert json.loads(stream.read()) == STATE
+        assert stream.closed
+
+    def test_parsed_from_map(self, mapped_dir: Path, count_parses: list[int]) -> None:
+        path = write_state(mapped_dir / "terraform.tfstate", STATE)
+        cache = loader.state_cache()
+        cache.clear()
+
+        document, _ = load_state(path)
+
+        assert document == STATE
+        assert len(count_parses) == 1
+        assert cache.size_bytes == path.stat().st_size
+
+    def test_read_span(self, mapped_dir: Path) -> None:
+        path = write_state(mapped_dir / "terraform.tfstate", STATE)
+        data = path.read_bytes()
+        start = data.index(b'{"mode"')
+        end = data.index(b"]}", start) + 2
+
+        with loader.open_state_stream(path) as (stream, _, _):
+            assert isinstance(stream, mmap.mmap)
+            assert loader.read_span(stream, start, end) == STATE["resources"][0]
+        with path.open("rb") as f:
+            assert loader.read_span(f, start, end) == STATE["resources"][0]
+
+    def test_working_state_is_not_mapped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Terraform rewrites these in place; truncating a mapped file would kill the process with SIGBUS.
+        path = write_state(tmp_path / "terraform.tfstate", STATE)
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+        with open_state_source(path) as source:
+            assert not isinstance(source.stream, mmap.mmap)
+            assert json.loads(source.stream.read()) == STATE
+
+    def test_empty_file_is_not_mapped(self, mapped_dir: Path) -> None:
+        path = mapped_dir / "terraform.tfstate"
+        path.touch()
+
+        with loader.open_state_stream(path) as (stream, stat_result, compression):
+            assert not isinstance(stream, mmap.mmap)
+            assert stream.read() == b""
+            assert stat_result.st_size == 0
+            assert compression is None
+
+
+def zstd_compress(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)  # type: ignore[no-any-return]
+
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bzip2": bz2.compress,
+    "zstd": zstd_compress,
+}
+
+
+class TestCompressedStates:
+    """Compressed states are detected by magic bytes and decompressed while read."""
+
+    @pytest.fixture(params=sorted(COMPRESSORS))
+    def compressed_state(self, request: pytest.FixtureRequest, tmp_path: Path) -> tuple[str, Path]:
+        path = tmp_path / "archived.tfstate"
+        path.write_bytes(COMPRESSORS[request.param](json.dumps(STATE).encode()))
+        return request.param, path
+
+    @pytest.mark.parametrize(
+        ("head", "compression"),
+        [
+            (b"\x1f\x8b\x08\x00", "gzip"),
+            (b"BZh9", "bzip2"),
+            (b"\x28\xb5\x2f\xfd", "zstd"),
+            (b'{"ve', None),
+            (b"", None),
+        ],
+    )
+    def test_detect_compression(self, head: bytes, compression: str | None) -> None:
+        assert detect_compression(head) == compression
+
+    def test_parsed_whole(self, compressed_state: tuple[str, Path]) -> None:
+        _, path = compressed_state
+        document, _ = load_state(path)
+        assert document == STATE
+
+    def test_streamed(self, compressed_state: tuple[str, Path], monkeypatch: pytest.MonkeyPatch) -> None:
+        compression, path = compressed_state
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+        with open_state_source(path) as source:
+            assert source.compression == compression
+            assert source.stream is not None
+            assert json.loads(source.stream.read()) == STATE
+
+    def test_cache_charges_decompressed_size(self, tmp_path: Path) -> None:
+        path = tmp_path / "terraform.tfstate.gz"
+        data = json.dumps(STATE).encode()
+        path.write_bytes(gzip.compress(data))
+
+        cache = loader.state_cache()
+        cache.clear()
+        load_state(path)
+        assert cache.size_bytes == len(data)
+
+    def test_size_estimate_picks_streaming(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "terraform.tfstate.gz"
+        path.write_bytes(gzip.compress(json.dumps(STATE).encode()))
+        loader.state_cache().clear()
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", path.stat().st_size * 2)
+
+        with open_state_source(path) as source:
+            assert source.stream is not None
+
+    def test_zstd_requires_zstandard(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "terraform.tfstate.zst"
+        path.write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 16)
+        real_import = importlib.import_module
+
+        def no_zstandard(name: str, *args: Any) -> Any:
+            if name == "zstandard":
+                raise ImportError(name)
+            return real_import(name, *args)
+
+        monkeypatch.setattr(importlib, "import_module", no_zstandard)
+        with pytest.raises(DataSourceError, match="'zstandard' package"):
+            load_state(path)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streamed", [False, True])
+    async def test_state_data_sources(
+        self, compressed_state: tuple[str, Path], monkeypatch: pytest.MonkeyPatch, streamed: bool
+    ) -> None:
+        _, path = compressed_state
+        loader.state_cache().clear()
+        if streamed:
+            monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+        resources = await StateResourcesDataSource().read(
+            ResourceContext(config=StateResourcesConfig(state_path=str(path), filter_type="aws_vpc"))
+        )
+        outputs = await StateOutputsDataSource().read(ResourceContext(config=StateOutputsConfig(state_path=str(path))))
+        info = await StateInfoDataSource().read(ResourceContext(config=StateInfoConfig(state_path=str(path))))
+        header = await StateInfoDataSource().read(
+            ResourceContext(config=StateInfoConfig(state_path=str(path), header_only=True))
+        )
+
+        assert resources.resources[0]["id"] == "vpc-123"
+        assert outputs.outputs[0]["value"] == '"vpc-123"'
+        assert (info.serial, info.resources_count) == (7, 1)
+        assert header.lineage == "loader-lineage"
+
+    @pytest.mark.asyncio
+    async def test_index_is_not_used(
+        self,
+        tmp_path: Path,
+        configured_provider: Callable[..., TofuSoupProvider],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        configured_provider(state_index=True)
+        path = tmp_path / "terraform.tfstate.gz"
+        path.write_bytes(gzip.compress(json.dumps(STATE).encode()))
+
+        state = await StateResourcesDataSource().read(
+            ResourceContext(config=StateResourcesConfig(state_path=str(path), filter_type="aws_vpc", offset=0))
+        )
+
+        assert state.resource_count == 1
+        assert not (tmp_path / "cache" / "state-index").exists()
@@ -0,0 +1,329 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for state output reads: early termination, name filters, bounded values and value paths."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.codec import get_codec
+from tofusoup.tf.components.data_sources.state_outputs import StateOutputsConfig, StateOutputsDataSource
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state.loader import open_state_source
+from tofusoup.tf.components.state.outputs import (
+    OutputFilter,
+    encode_bounded,
+    iter_outputs,
+    output_entry,
+    select_type,
+)
+from tofusoup.tf.components.state.paths import parse_value_path, select_value
+
+OUTPUTS = {
+    "vpc_id": {"value": "vpc-123", "type": "string"},
+    "subnets": {"value": ["a", "b"], "type": ["list", "string"]},
+    "db_password": {"value": "secret", "type": "string", "sensitive": True},
+}
+
+
+@pytest.fixture
+def always_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    path = tmp_path / "terraform.tfstate"
+    resources = [{"mode": "managed", "type": "null_resource", "name": "r"}]
+    path.write_text(json.dumps({"version": 4, "serial": 1, "outputs": OUTPUTS, "resources": resources}, indent=2))
+    return path
+
+
+@pytest.fixture
+def truncated_state(tmp_path: Path) -> Path:
+    """A state whose resources (and everything after ``subnets``) are garbage."""
+    path = tmp_path / "truncated.tfstate"
+    outputs = json.dumps({"vpc_id": OUTPUTS["vpc_id"], "subnets": OUTPUTS["subnets"]})
+    path.write_text('{"version": 4, "outputs": ' + outputs + ', "resources": [not json')
+    return path
+
+
+def names(path: Path, output_filter: OutputFilter | None = None) -> list[str]:
+    with open_state_source(path) as source:
+        return [name for name, _ in iter_outputs(source, output_filter)]
+
+
+class TestOutputFilter:
+    """Unit tests for OutputFilter."""
+
+    def test_empty_filter_matches_everything(self) -> None:
+        assert not OutputFilter().active
+        assert OutputFilter().matches("anything")
+        assert not OutputFilter().complete(10)
+
+    def test_names(self) -> None:
+        output_filter = OutputFilter(names=frozenset({"a", "b"}))
+
+        assert output_filter.matches("a")
+        assert not output_filter.matches("c")
+        assert not output_filter.complete(1)
+        assert output_filter.complete(2)
+
+    def test_from_names_splits_patterns(self) -> None:
+        output_filter = OutputFilter.from_names(["vpc_*", "db_password", None, "", "vpc_*", "subnet_[ab]"])
+
+        assert output_filter.names == frozenset({"db_password"})
+        assert output_filter.patterns == ("vpc_*", "subnet_[ab]")
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("vpc_id", True), ("vpc_", True), ("my_vpc_id", False), ("db_password", True), ("subnet_b", True)],
+    )
+    def test_patterns_match_whole_names(self, name: str, expected: bool) -> None:
+        output_filter = OutputFilter.from_names(["vpc_*", "db_password", "subnet_[ab]"])
+
+        assert output_filter.matches(name) is expected
+
+    def test_patterns_never_complete(self) -> None:
+        assert not OutputFilter.from_names(["a", "b*"]).complete(100)
+
+
+class TestIterOutputs:
+    """iter_outputs reads the same outputs whether streamed or parsed whole."""
+
+    def test_parsed_and_streamed_agree(self, state_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        parsed = names(state_file)
+        loader.state_cache().clear()
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+        assert names(state_file) == parsed == list(OUTPUTS)
+
+    def test_stream_stops_after_outputs(self, truncated_state: Path, always_stream: None) -> None:
+        assert names(truncated_state) == ["vpc_id", "subnets"]
+
+    def test_stream_stops_after_requested_name(self, tmp_path: Path, always_stream: None) -> None:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text('{"outputs": {"vpc_id": {"value": "vpc-123"}, "broken": ')
+
+        assert names(path, OutputFilter(names=frozenset({"vpc_id"}))) == ["vpc_id"]
+
+    def test_missing_name_reads_to_end_of_outputs(self, truncated_state: Path, always_stream: None) -> None:
+        assert names(truncated_state, OutputFilter(names=frozenset({"nope"}))) == []
+
+    def test_state_without_outputs(self, tmp_path: Path, always_stream: None) -> None:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text('{"version": 4, "resources": []}')
+
+        assert names(path) == []
+
+
+class TestStateOutputsStreaming:
+    """The data source returns identical results on the streaming path."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filter_name", [None, "subnets", "missing"])
+    async def test_streaming_matches_parsed(
+        self, state_file: Path, monkeypatch: pytest.MonkeyPatch, filter_name: str | None
+    ) -> None:
+        config = StateOutputsConfig(state_path=str(state_file), filter_name=filter_name)
+        parsed = await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        loader.state_cache().clear()
+        streamed = await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        assert streamed == parsed
+
+    @pytest.mark.asyncio
+    async def test_huge_resources_are_not_read(self, truncated_state: Path, always_stream: None) -> None:
+        config = StateOutputsConfig(state_path=str(truncated_state), filter_name="vpc_id")
+        state: Any = await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        assert [o["value"] for o in state.outputs] == ['"vpc-123"']
+
+
+class TestStateOutputsMultiFilter:
+    """filter_names returns every output matching any name or pattern in one read."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("filter_name", "filter_names", "expected"),
+        [
+            (None, ["vpc_id", "db_password"], ["vpc_id", "db_password"]),
+            (None, ["*_id", "sub*"], ["vpc_id", "subnets"]),
+            ("db_password", ["vpc_*"], ["vpc_id", "db_password"]),
+            (None, ["nope*"], []),
+        ],
+    )
+    async def test_filter_names(
+        self, state_file: Path, filter_name: str | None, filter_names: list[str], expected: list[str]
+    ) -> None:
+        config = StateOutputsConfig(state_path=str(state_file), filter_name=filter_name, filter_names=filter_names)
+        state = await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        assert [o["name"] for o in state.outputs] == expected
+        assert state.output_count == len(expected)
+        assert state.filter_names == filter_names
+
+    @pytest.mark.asyncio
+    async def test_validate_rejects_empty_names(self) -> None:
+        config = StateOutputsConfig(state_path="/tmp/terraform.tfstate", filter_names=["vpc_id", ""])
+
+        assert await StateOutputsDataSource()._validate_config(config) == ["'filter_names' cannot contain empty names."]
+
+
+class TestBoundedValues:
+    """values = false and max_value_bytes keep returned values small."""
+
+    @pytest.mark.parametrize(
+        "value", ["plain", "naïve ✓", 12345.5e3, [1, {"a": None, "b": [True, False]}], {"k": "v" * 10}]
+    )
+    def test_encode_bounded_matches_json_dumps(self, value: Any) -> None:
+        encoded = json.dumps(value)
+
+        assert encode_bounded(value, len(encoded)) == encoded
+        assert encode_bounded(value, len(encoded) - 1) is None
+
+    def test_encode_bounded_stops_early(self) -> None:
+        encoded: list[int] = []
+
+        class Tracking(list):  # type: ignore[type-arg]
+            def __iter__(self) -> Any:
+                for item in super().__iter__():
+                    encoded.append(item)
+                    yield item
+
+        assert encode_bounded(Tracking(range(100_000)), 100) is None
+        assert len(encoded) < 100
+
+    def test_output_entry_modes(self) -> None:
+        codec = get_codec()
+        output = {"value": {"ips": ["10.0.0.1"] * 50}, "type": "map"}
+
+        full = output_entry("o", output, codec)
+        assert full["value"] == json.dumps(output["value"]) and not full["value_truncated"]
+        assert output_entry("o", output, codec, values=False)["value"] is None
+        truncated = output_entry("o", output, codec, max_value_bytes=64)
+        assert truncated["value"] is None and truncated["value_truncated"]
+        assert output_entry("o", {"value": None}, codec, max_value_bytes=1)["value"] == "null"
+
+    @pytest.mark.asyncio
+    async def test_data_source_options(self, state_file: Path) -> None:
+        async def read(**options: Any) -> Any:
+            config = StateOutputsConfig(state_path=str(state_file), **options)
+            return await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        catalog = await read(values=False)
+        bounded = await read(max_value_bytes=10)
+
+        assert [(o["name"], o["value"]) for o in catalog.outputs] == [(name, None) for name in OUTPUTS]
+        assert [o["type"] for o in catalog.outputs] == ["string", '["list", "string"]', "string"]
+        assert {o["name"]: o["value_truncated"] for o in bounded.outputs} == {
+            "vpc_id": False,
+            "subnets": False,
+            "db_password": False,
+        }
+        assert (await read(max_value_bytes=5)).outputs[1]["value_truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_validate_max_value_bytes(self) -> None:
+        config = StateOutputsConfig(state_path="/tmp/terraform.tfstate", max_value_bytes=0)
+
+        assert await StateOutputsDataSource()._validate_config(config) == [
+            "'max_value_bytes' must be a positive number of bytes."
+        ]
+
+
+CLUSTER = {
+    "value": {"endpoint": {"hostname": "k8s.internal", "port": 443}, "nodes": [{"ip": "10.0.0.1"}, {"ip": "10.0.0.2"}]},
+    "type": [
+        "object",
+        {
+            "endpoint": ["object", {"hostname": "string", "port": "number"}],
+            "nodes": ["list", ["object", {"ip": "string"}]],
+        },
+    ],
+}
+
+
+class TestValuePath:
+    """value_path selects a subtree of each output value."""
+
+    @pytest.mark.parametrize(
+        ("path", "steps"),
+        [
+            ("endpoint.hostname", ("endpoint", "hostname")),
+            ("$.nodes[1].ip", ("nodes", 1, "ip")),
+            ('tags["kubernetes.io/role"]', ("tags", "kubernetes.io/role")),
+            ("nodes.0", ("nodes", "0")),
+        ],
+    )
+    def test_parse(self, path: str, steps: tuple[Any, ...]) -> None:
+        assert parse_value_path(path) == steps
+
+    @pytest.mark.parametrize("path", ["", ".a", "a..b", "a[0]b", "a[", "$"])
+    def test_parse_rejects_malformed(self, path: str) -> None:
+        with pytest.raises(ValueError):
+            parse_value_path(path)
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("endpoint.port", (True, 443)),
+            ("nodes[-1].ip", (True, "10.0.0.2")),
+            ("nodes.0.ip", (True, "10.0.0.1")),
+            ("nodes[5]", (False, None)),
+            ("endpoint.missing", (False, None)),
+            ("endpoint.hostname.deeper", (False, None)),
+        ],
+    )
+    def test_select_value(self, path: str, expected: tuple[bool, Any]) -> None:
+        assert select_value(CLUSTER["value"], parse_value_path(path)) == expected
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("endpoint", ["object", {"hostname": "string", "port": "number"}]),
+            ("endpoint.port", "number"),
+            ("nodes[0].ip", "string"),
+            ("endpoint.missing", "dynamic"),
+        ],
+    )
+    def test_select_type(self, path: str, expected: Any) -> None:
+        assert select_type(CLUSTER["type"], parse_value_path(path)) == expected
+
+    def test_output_entry(self) -> None:
+        codec = get_codec()
+
+        entry = output_entry("cluster", CLUSTER, codec, value_path=("endpoint",))
+        missing = output_entry("cluster", CLUSTER, codec, value_path=("nope",))
+
+        assert json.loads(entry["value"]) == {"hostname": "k8s.internal", "port": 443}
+        assert json.loads(entry["type"]) == ["object", {"hostname": "string", "port": "number"}]
+        assert missing["value"] is None
+
+    @pytest.mark.asyncio
+    async def test_data_source(self, tmp_path: Path, always_stream: None) -> None:
+        path = tmp_path / "terraform.tfstate"
+        path.write_text(json.dumps({"version": 4, "outputs": {"cluster": CLUSTER, **OUTPUTS}, "resources": []}))
+        config = StateOutputsConfig(state_path=str(path), filter_name="cluster", value_path="nodes[1].ip")
+
+        state = await StateOutputsDataSource().read(ResourceContext(config=config))
+
+        assert state.value_path == "nodes[1].ip"
+        assert [(o["name"], o["value"], o["type"]) for o in state.outputs] == [("cluster", '"10.0.0.2"', "string")]
+
+    @pytest.mark.asyncio
+    async def test_validate_value_path(self) -> None:
+        config = StateOutputsConfig(state_path="/tmp/terraform.tfstate", value_path="a..b")
+
+        errors = await StateOutputsDataSource()._validate_config(config)
+
+        assert len(errors) == 1
+        assert errors[0].startswith("'value_path' is invalid")
@@ -0,0 +1,260 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for streaming resource iteration and push-down filters."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_resources import StateResourcesConfig, StateResourcesDataSource
+from tofusoup.tf.components.state import loader
+from tofusoup.tf.components.state import resources as resources_module
+from tofusoup.tf.components.state.loader import open_state_source
+from tofusoup.tf.components.state.resources import ResourceFilter, iter_resources, read_resources
+
+RESOURCES = [
+    {"mode": "managed", "type": "aws_route53_record", "name": "a", "instances": [{"attributes": {"id": "r-a"}}]},
+    {"mode": "data", "type": "aws_route53_zone", "name": "z", "instances": [{"attributes": {"id": "z-1"}}]},
+    {
+        "mode": "managed",
+        "type": "aws_route53_record",
+        "name": "b",
+        "module": "module.dns",
+        "instances": [{"attributes": {"id": "r-b"}}, {"attributes": {"id": "r-c"}}],
+    },
+    {"mode": "managed", "type": "aws_instance", "name": "web", "module": "module.dns", "instances": []},
+    {
+        "mode": "managed",
+        "type": "aws_instance",
+        "name": "node",
+        "instances": [
+            {"index_key": 0, "attributes": {"id": "i-0", "private_ip": "10.0.0.1", "tags": {"Name": "n0"}}},
+            {"index_key": 1, "attributes": {"id": "i-1", "private_ip": "10.0.0.2", "tags": None}},
+        ],
+    },
+]
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    path = tmp_path / "terraform.tfstate"
+    path.write_text(json.dumps({"version": 4, "outputs": {"o": {"value": 1}}, "resources": RESOURCES}, indent=2))
+    return path
+
+
+@pytest.fixture
+def always_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+
+
+class TestResourceFilter:
+    """Unit tests for ResourceFilter."""
+
+    @pytest.mark.parametrize(
+        ("resource_filter", "names"),
+        [
+            (ResourceFilter(), ["a", "z", "b", "web", "node"]),
+            (ResourceFilter(mode="data"), ["z"]),
+            (ResourceFilter(type="aws_route53_record"), ["a", "b"]),
+            (ResourceFilter(type="aws_instance"), ["web", "node"]),
+            (ResourceFilter(module="module.dns"), ["b", "web"]),
+            (ResourceFilter(mode="managed", type="aws_route53_record", module="module.dns"), ["b"]),
+            (ResourceFilter(mode="", type="", module=""), ["a", "z", "b", "web", "node"]),
+        ],
+    )
+    def test_filters_combine(self, resource_filter: ResourceFilter, names: list[str]) -> None:
+        assert [r["name"] for r in RESOURCES if resource_filter.matches(r)] == names
+
+
+class TestIterResources:
+    """iter_resources yields the same resources whether streamed or parsed whole."""
+
+    def test_parsed_document(self, state_file: Path) -> None:
+        with open_state_source(state_file) as source:
+            assert source.document is not None
+            assert list(iter_resources(source)) == RESOURCES
+
+    def test_streamed(self, state_file: Path, always_stream: None) -> None:
+        with open_state_source(state_file) as source:
+            assert source.stream is not None
+            assert list(iter_resources(source)) == RESOURCES
+
+    @pytest.mark.parametrize(
+        "resource_filter",
+        [
+            ResourceFilter(type="aws_s3_bucket"),
+            ResourceFilter(mode="managed", module="module.absent"),
+        ],
+    )
+    def test_absent_filter_value_decodes_nothing(
+        self,
+        mapped_dir: Path,
+        state_file: Path,
+        always_stream: None,
+        monkeypatch: pytest.MonkeyPatch,
+        resource_filter: ResourceFilter,
+    ) -> None:
+        def no_scan(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError("state was scanned")
+
+        monkeypatch.setattr(resources_module, "scan_state", no_scan)
+        with open_state_source(state_file) as source:
+            assert list(iter_resources(source, resource_filter)) == []
+
+    def test_filter_values_with_escapes_are_still_scanned(self, tmp_path: Path, always_stream: None) -> None:
+        resource = {"mode": "managed", "type": "t", "name": "n", "module": 'module.m["a"]', "instances": []}
+        path = tmp_path / "terraform.tfstate"
+        path.write_text(json.dumps({"version": 4, "resources": [resource]}))
+
+        with open_state_source(path) as source:
+            assert list(iter_resources(source, ResourceFilter(module='module.m["a"]'))) == [resource]
+
+
+class TestAttributeProjection:
+    """Instances are projected onto the requested attribute paths."""
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    def test_projects_instances(self, state_file: Path, monkeypatch: pytest.MonkeyPatch, streamed: bool) -> None:
+        if streamed:
+            monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        entries = read_resources(state_file, ResourceFilter(type="aws_instance"), ("private_ip", "tags.Name")).resources
+
+        web, node = entries
+        assert web["instances"] == []
+        assert node["instances"] == [
+            {"index_key": "0", "attributes": {"private_ip": '"10.0.0.1"', "tags.Name": '"n0"'}},
+            {"index_key": "1", "attributes": {"private_ip": '"10.0.0.2"', "tags.Name": None}},
+        ]
+
+    def test_single_instance_has_null_index_key(self, state_file: Path) -> None:
+        entries = read_resources(state_file, ResourceFilter(mode="data"), ("id", "missing")).resources
+        assert entries[0]["instances"] == [{"index_key": None, "attributes": {"id": '"z-1"', "missing": None}}]
+
+    def test_no_projection_leaves_instances_null(self, state_file: Path) -> None:
+        entries = read_resources(state_file, ResourceFilter()).resources
+        assert all(entry["instances"] is None for entry in entries)
+
+    @pytest.mark.asyncio
+    async def test_data_source_projection(self, state_file: Path) -> None:
+        config = StateResourcesConfig(state_path=str(state_file), filter_type="aws_instance", attributes=["tags.Name"])
+        state = await StateResourcesDataSource().read(ResourceContext(config=config))
+
+        assert state.attributes == ["tags.Name"]
+        assert state.resources[1]["instances"][0]["attributes"] == {"tags.Name": '"n0"'}
+
+    @pytest.mark.asyncio
+    async def test_invalid_attribute_path(self) -> None:
+        config = StateResourcesConfig(state_path="terraform.tfstate", attributes=["tags..Name"])
+        errors = await StateResourcesDataSource()._validate_config(config)
+        assert any("'attributes'" in error for error in errors)
+
+
+class TestPagination:
+    """limit, offset and sort_by page through the matching resources."""
+
+    @pytest.mark.parametrize("streamed", [False, True])
+    @pytest.mark.parametrize("sort_by", ["state", "resource_id"])
+    def test_pages_cover_every_match_once(
+        self, state_file: Path, monkeypatch: pytest.MonkeyPatch, streamed: bool, sort_by: str
+    ) -> None:
+        if streamed:
+            monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        everything = read_resources(state_file, ResourceFilter(mode="managed"), sort_by=sort_by).resources
+
+        pages = []
+        offset: int | None = 0
+        while offset is not None:
+            page = read_resources(state_file, ResourceFilter(mode="managed"), offset=offset, limit=3, sort_by=sort_by)
+            pages.append([r["resource_id"] for r in page.resources])
+            offset = page.next_offset
+
+        assert pages == [[r["resource_id"] for r in everything[:3]], [r["resource_id"] for r in everything[3:]]]
+
+    def test_resource_id_order(self, state_file: Path) -> None:
+        page = read_resources(state_file, ResourceFilter(), sort_by="resource_id")
+        ids = [r["resource_id"] for r in page.resources]
+        assert ids == sorted(ids)
+        assert page.next_offset is None
+
+    def test_last_page_has_no_next_offset(self, state_file: Path) -> None:
+        page = read_resources(state_file, ResourceFilter(), offset=4, limit=1)
+        assert [r["name"] for r in page.resources] == ["node"]
+        assert page.next_offset is None
+
+        assert read_resources(state_file, ResourceFilter(), offset=10).resources == []
+
+    def test_stream_stops_after_page(self, state_file: Path, always_stream: None) -> None:
+        page = read_resources(state_file, ResourceFilter(), offset=1, limit=1)
+        assert [r["name"] for r in page.resources] == ["z"]
+        assert page.next_offset == 2
+        # The skipped resource is never checked and the read stops at the first resource past the page.
+        assert page.scanned == 2
+
+    def test_skipped_resources_get_no_entries(self, state_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        built: list[str] = []
+        real_entry = resources_module.resource_entry
+
+        def counting_entry(resource: dict[str, Any], *args: Any) -> dict[str, Any]:
+            built.append(resource["name"])
+            return real_entry(resource, *args)
+
+        monkeypatch.setattr(resources_module, "resource_entry", counting_entry)
+        read_resources(state_file, ResourceFilter(), offset=2, limit=2)
+        assert built == ["b", "web"]
+
+    @pytest.mark.asyncio
+    async def test_data_source_page(self, state_file: Path) -> None:
+        config = StateResourcesConfig(state_path=str(state_file), limit=2, offset=1, sort_by="resource_id")
+        state = await StateResourcesDataSource().read(ResourceContext(config=config))
+
+        assert (state.limit, state.offset, state.sort_by) == (2, 1, "resource_id")
+        assert state.resource_count == 2
+        assert state.next_offset == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("settings", "message"),
+        [
+            ({"limit": 0}, "'limit' must be a positive number of resources."),
+            ({"offset": -1}, "'offset' cannot be negative."),
+            ({"sort_by": "name"}, "'sort_by' must be either 'state' or 'resource_id'."),
+        ],
+    )
+    async def test_invalid_paging(self, settings: dict[str, Any], message: str) -> None:
+        config = StateResourcesConfig(state_path="terraform.tfstate", **settings)
+        assert await StateResourcesDataSource()._validate_config(config) == [message]
+
+
+class TestStateResourcesStreaming:
+    """The data source returns identical results on the streaming path."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"filter_type": "aws_route53_record"},
+            {"filter_mode": "managed", "filter_module": "module.dns"},
+            {"attributes": ["id", "tags.Name"]},
+            {"limit": 2, "offset": 1},
+            {"sort_by": "resource_id", "limit": 3},
+        ],
+    )
+    async def test_streaming_matches_parsed(
+        self, state_file: Path, monkeypatch: pytest.MonkeyPatch, filters: dict[str, Any]
+    ) -> None:
+        config = StateResourcesConfig(state_path=str(state_file), **filters)
+        parsed = await StateResourcesDataSource().read(ResourceContext(config=config))
+
+        monkeypatch.setattr(loader, "STREAMING_THRESHOLD_BYTES", 0)
+        loader.state_cache().clear()
+        streamed = await StateResourcesDataSource().read(ResourceContext(config=config))
+
+        assert streamed == parsed
+        assert streamed.resource_count == len(streamed.resources)
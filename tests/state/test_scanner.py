@@ -0,0 +1,177 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the streaming state scanner and state summaries."""
+
+import io
+import json
+from typing import Any
+
+import pytest
+
+from tofusoup.tf.components.state.scanner import ELEMENT, FIELD, MEMBER, scan_state
+from tofusoup.tf.components.state.summary import StateSummary, scan_header, scan_summary, summarize_state
+
+
+def make_state(resource_count: int = 25) -> dict[str, Any]:
+    resources = []
+    for i in range(resource_count):
+        resource: dict[str, Any] = {
+            "mode": "data" if i % 5 == 0 else "managed",
+            "type": f"aws_thing_{i % 3}",
+            "name": f"r{i}",
+            "provider": 'provider["registry.terraform.io/hashicorp/aws"]',
+            "instances": [{"attributes": {"id": f"id-{i}", "note": "naïve ✓", "size": 12345.5e3}}],
+        }
+        if i % 4 == 0:
+            resource["module"] = f"module.m{i % 8}"
+        resources.append(resource)
+    return {
+        "version": 4,
+        "terraform_version": "1.10.6",
+        "serial": 12,
+        "lineage": "scanner-lineage",
+        "outputs": {"a": {"value": 1, "type": "number"}, "b": {"value": ["x"], "type": ["list", "string"]}},
+        "resources": resources,
+        "check_results": None,
+    }
+
+
+def encode(document: Any, indent: int | None = 2) -> bytes:
+    return json.dumps(document, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+class TestScanState:
+    """Tests for scan_state."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_events_reassemble_the_document(self, chunk_size: int, indent: int | None) -> None:
+        document = make_state()
+        data = encode(document, indent)
+        rebuilt: dict[str, Any] = {"outputs": {}, "resources": []}
+
+        for event in scan_state(io.BytesIO(data), {"resources"}, {"outputs"}, chunk_size=chunk_size):
+            if event.kind == ELEMENT:
+                rebuilt["resources"].append(event.value)
+            elif event.kind == MEMBER:
+                rebuilt["outputs"][event.name] = event.value
+            else:
+                rebuilt[event.key] = event.value
+            # Byte ranges point at the encoded value, including non-ASCII text.
+            assert json.loads(data[event.start : event.end]) == event.value
+
+        assert rebuilt == document
+
+    def test_unstreamed_members_are_whole_fields(self) -> None:
+        events = list(scan_state(io.BytesIO(encode(make_state(3))), chunk_size=16))
+
+        assert [e.kind for e in events] == [FIELD] * 7
+        assert events[-2].key == "resources"
+        assert len(events[-2].value) == 3
+
+    def test_closing_early_stops_reading(self) -> None:
+        stream = io.BytesIO(encode(make_state(500)))
+        events = scan_state(stream, {"resources"}, chunk_size=256)
+
+        first = next(e for e in events if e.kind == ELEMENT)
+        events.close()
+
+        assert first.index == 0
+        assert stream.tell() < len(stream.getvalue()) // 10
+
+    def test_stop_after_ends_scan(self) -> None:
+        # Everything after the outputs object is invalid and must never be read.
+        data = b'{"version": 4, "outputs": {"a": {"value": 1}}, "resources": [not json'
+
+        events = list(scan_state(io.BytesIO(data), objects={"outputs"}, stop_after={"outputs"}, chunk_size=8))
+
+        assert [(e.key, e.name) for e in events] == [("version", None), ("outputs", "a")]
+
+    def test_number_split_across_chunks(self) -> None:
+        events = list(scan_state(io.BytesIO(b'{"serial": 1234567890}'), chunk_size=4))
+
+        assert events[0].value == 1234567890
+
+    @pytest.mark.parametrize("padding", range(16))
+    def test_float_split_at_every_position(self, padding: int) -> None:
+        # The padding moves the chunk boundaries across every character of each number.
+        data = b'{"serial":' + b" " * padding + b'1.5e3, "values": [-2.25E-1, 7.0e+2]}'
+        events = list(scan_state(io.BytesIO(data), {"values"}, chunk_size=16))
+
+        assert [e.value for e in events] == [1500.0, -0.225, 700.0]
+        assert [data[e.start : e.end] for e in events] == [b"1.5e3", b"-2.25E-1", b"7.0e+2"]
+
+    def test_byte_order_mark_is_accepted(self) -> None:
+        events = list(scan_state(io.BytesIO(b'\xef\xbb\xbf{"version": 4}'), chunk_size=2))
+
+        assert events[0].value == 4
+        assert events[0].start == 15
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"{invalid json", b'{"resources": [1, 2', b'{"a": 1} x', b'{"a" 1}', b'{"a": tru}'],
+    )
+    def test_malformed_input_raises_json_error(self, data: bytes) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            list(scan_state(io.BytesIO(data), {"resources"}, chunk_size=3))
+
+    def test_non_object_document_is_rejected(self) -> None:
+        with pytest.raises(TypeError, match="JSON object"):
+            list(scan_state(io.BytesIO(b"[1, 2]")))
+
+
+class TestStateSummary:
+    """Streaming and in-memory summaries agree."""
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            make_state(),
+            make_state(0),
+            {"version": 4},
+            {"resources": [], "outputs": {}},
+            {"outputs": {"a": {"value": 1}}, "resources": [{"mode": "managed", "module": "module.x"}], "serial": 3},
+            {"resources": [{"mode": "managed"}], "version": 4, "lineage": "trailing-header"},
+        ],
+    )
+    def test_streaming_matches_full_parse(self, document: dict[str, Any]) -> None:
+        streamed = scan_summary(io.BytesIO(encode(document)))
+
+        assert streamed == summarize_state(document)
+
+    def test_counts(self) -> None:
+        summary = scan_summary(io.BytesIO(encode(make_state())))
+
+        assert summary.resources_count == 25
+        assert summary.data_resources_count == 5
+        assert summary.managed_resources_count == 20
+        assert summary.modules_count == 2
+        assert summary.outputs_count == 2
+        assert summary.serial == 12
+
+
+class TestScanHeader:
+    """Tests for the header-only fast path."""
+
+    def test_stops_after_header_fields(self) -> None:
+        stream = io.BytesIO(encode(make_state(5000)))
+
+        header = scan_header(stream, chunk_size=1024)
+
+        assert header == {"version": 4, "terraform_version": "1.10.6", "serial": 12, "lineage": "scanner-lineage"}
+        assert stream.tell() == 1024
+
+    def test_finds_fields_after_resources(self) -> None:
+        document = {"resources": make_state(50)["resources"], "serial": 3, "outputs": {"a": {}}, "lineage": "late"}
+
+        assert scan_header(io.BytesIO(encode(document)), chunk_size=64) == {"serial": 3, "lineage": "late"}
+
+    def test_matches_summary_header(self) -> None:
+        document = make_state(3)
+
+        assert StateSummary.from_header(scan_header(io.BytesIO(encode(document)))) == StateSummary(
+            version=4, terraform_version="1.10.6", serial=12, lineage="scanner-lineage"
+        )
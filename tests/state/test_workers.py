@@ -0,0 +1,166 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the bounded state worker pool."""
+
+import asyncio
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pyvider.resources.context import ResourceContext  # type: ignore
+
+from tofusoup.tf.components.data_sources.state_info import StateInfoConfig, StateInfoDataSource
+from tofusoup.tf.components.provider import TofuSoupProvider
+from tofusoup.tf.components.state import loader, summary
+from tofusoup.tf.components.state.summary import parse_summary, summarize_state
+from tofusoup.tf.components.state.workers import run_in_parse_pool, run_in_state_pool
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestRunInStatePool:
+    """run_in_state_pool runs blocking work off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_uses_provider_pool(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        provider = configured_provider(state_workers=2)
+
+        name = await run_in_state_pool(current_thread_name)
+
+        assert name.startswith("tofusoup-state")
+        assert provider.state_executor._max_workers == 2
+
+    @pytest.mark.asyncio
+    async def test_without_provider_uses_default_executor(self) -> None:
+        name = await run_in_state_pool(current_thread_name)
+
+        assert name != threading.current_thread().name
+        assert not name.startswith("tofusoup-state")
+
+    @pytest.mark.asyncio
+    async def test_reads_overlap(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        configured_provider(state_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        # Both calls must be running at once for the barrier to release.
+        await asyncio.gather(run_in_state_pool(barrier.wait), run_in_state_pool(barrier.wait))
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_free(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        configured_provider()
+        released = threading.Event()
+
+        async def release() -> None:
+            await asyncio.sleep(0)
+            released.set()
+
+        results = await asyncio.gather(run_in_state_pool(released.wait, 5), release())
+
+        assert results[0] is True
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_pool(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        provider = configured_provider()
+        executor = provider.state_executor
+
+        await provider.shutdown()
+
+        assert executor._shutdown
+        assert provider.state_executor is not executor
+
+
+@pytest.mark.asyncio
+async def test_state_info_reads_in_pool(
+    tmp_path: Path, configured_provider: Callable[..., TofuSoupProvider], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    configured_provider()
+    path = tmp_path / "terraform.tfstate"
+    path.write_text(json.dumps({"version": 4, "serial": 3, "resources": []}))
+    threads: list[str] = []
+    real_read_summary = summary.read_summary
+
+    def recording_read_summary(*args: Any) -> Any:
+        threads.append(current_thread_name())
+        return real_read_summary(*args)
+
+    monkeypatch.setattr(summary, "read_summary", recording_read_summary)
+    state = await StateInfoDataSource().read(ResourceContext(config=StateInfoConfig(state_path=str(path))))
+
+    assert state.serial == 3
+    assert len(threads) == 1
+    assert threads[0].startswith("tofusoup-state")
+
+
+def write_state(path: Path, serial: int) -> Path:
+    resources = [
+        {"mode": "managed", "type": "null_resource", "name": f"r{i}", "module": f"module.m{i % 3}"}
+        for i in range(serial)
+    ]
+    path.write_text(json.dumps({"version": 4, "serial": serial, "outputs": {"o": {}}, "resources": resources}))
+    return path
+
+
+async def read_info(path: Path) -> Any:
+    return await StateInfoDataSource().read(ResourceContext(config=StateInfoConfig(state_path=str(path))))
+
+
+class TestParseProcesses:
+    """state_parse_processes moves state_info parsing into worker processes."""
+
+    def test_parse_summary_matches_parsed_and_streamed(self, tmp_path: Path) -> None:
+        path = write_state(tmp_path / "terraform.tfstate", serial=5)
+        expected = summarize_state(json.loads(path.read_text()))
+
+        assert parse_summary(path, streaming_threshold=1 << 30)[0] == expected
+        assert parse_summary(path, streaming_threshold=0)[0] == expected
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, configured_provider: Callable[..., TofuSoupProvider]) -> None:
+        provider = configured_provider()
+
+        assert provider.state_process_pool is None
+        assert await run_in_parse_pool(os.getpid) == os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_in_processes(
+        self, tmp_path: Path, configured_provider: Callable[..., TofuSoupProvider]
+    ) -> None:
+        provider = configured_provider(state_parse_processes=2)
+        paths = [write_state(tmp_path / f"{i}.tfstate", serial=i + 1) for i in range(6)]
+
+        try:
+            assert await run_in_parse_pool(os.getpid) != os.getpid()
+            states = await asyncio.gather(*(read_info(path) for path in paths))
+        finally:
+            await provider.shutdown()
+
+        assert [s.serial for s in states] == [1, 2, 3, 4, 5, 6]
+        assert [s.modules_count for s in states] == [1, 2, 3, 3, 3, 3]
+        assert len(loader.state_cache()) == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_state_skips_processes(
+        self,
+        tmp_path: Path,
+        configured_provider: Callable[..., TofuSoupProvider],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        configured_provider(state_parse_processes=2)
+        path = write_state(tmp_path / "terraform.tfstate", serial=4)
+        loader.load_state(path)
+
+        async def unexpected(*args: Any) -> Any:
+            raise AssertionError("parsed in a worker process")
+
+        monkeypatch.setattr(summary, "run_in_parse_pool", unexpected)
+
+        assert (await read_info(path)).resources_count == 4
@@ -0,0 +1,77 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Tests for the pluggable JSON codec."""
+
+import io
+import json
+import math
+import mmap
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tofusoup.tf.components import codec as codec_module
+from tofusoup.tf.components.codec import STDLIB, JsonCodec, available_codecs, get_codec, set_codec
+
+DOCUMENT = {"version": 4, "unicode": "naïve ✓", "nested": [1, 2.5, None, True, {"a": "b"}], "empty": {}}
+
+
+@pytest.fixture(params=available_codecs())
+def codec(request: pytest.FixtureRequest) -> Iterator[JsonCodec]:
+    yield set_codec(request.param)
+    set_codec(None)
+
+
+class TestJsonCodec:
+    """Every installed backend behaves like the standard library."""
+
+    def test_stdlib_is_always_available(self) -> None:
+        assert available_codecs()[-1] == STDLIB
+
+    def test_auto_selects_fastest_installed(self) -> None:
+        set_codec(None)
+        assert get_codec().name == available_codecs()[0]
+
+    def test_loads_matches_stdlib(self, codec: JsonCodec) -> None:
+        data = json.dumps(DOCUMENT).encode("utf-8")
+
+        assert codec.loads(data) == DOCUMENT
+        assert codec.load(io.BytesIO(data)) == DOCUMENT
+
+    def test_decodes_buffers_and_memory_maps(self, codec: JsonCodec, tmp_path: Path) -> None:
+        data = json.dumps(DOCUMENT).encode("utf-8")
+        path = tmp_path / "document.json"
+        path.write_bytes(b"  " + data)
+
+        assert codec.loads(memoryview(data)) == DOCUMENT
+        assert math.isnan(codec.loads(memoryview(b"NaN")))
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            mapped.seek(2)
+            assert codec.load(mapped) == DOCUMENT
+            assert mapped.tell() == len(mapped)
+        # The map closed cleanly, so no view of it was left behind.
+        assert mapped.closed
+
+    def test_inputs_fast_backends_reject_fall_back(self, codec: JsonCodec) -> None:
+        assert codec.loads(b"[18446744073709551616]") == [18446744073709551616]
+        assert math.isnan(codec.loads(b"NaN"))
+        assert codec.loads(b"\xef\xbb\xbf{}") == {}
+
+    def test_malformed_input_raises_json_decode_error(self, codec: JsonCodec) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{invalid json")
+
+    def test_dumps_is_identical_to_stdlib(self, codec: JsonCodec) -> None:
+        assert codec.dumps(DOCUMENT) == json.dumps(DOCUMENT)
+
+    def test_dumps_bytes_round_trips(self, codec: JsonCodec) -> None:
+        assert json.loads(codec.dumps_bytes(DOCUMENT)) == DOCUMENT
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(KeyError):
+            set_codec("nope")
+        assert codec_module.get_codec() is not None